@@ -55,20 +55,20 @@ def create_tools_with_validation(runtime_handler: RuntimeHandler) -> List[ToolSp
     try:
         # BashTool - work in project directory
         tools.append(ToolSpec(name="BashTool", params={"working_dir": project_dir}))
-        logger.info(f"✅ Created BashTool with working_dir: {project_dir}")
+        logger.info("✅ Created BashTool with working_dir: %s", project_dir)
 
         # FileEditorTool - workspace root directory
         tools.append(
             ToolSpec(name="FileEditorTool", params={"workspace_root": project_dir})
         )
-        logger.info(f"✅ Created FileEditorTool with workspace_root: {project_dir}")
+        logger.info("✅ Created FileEditorTool with workspace_root: %s", project_dir)
 
         # TaskTrackerTool - save to tasks directory
         tools.append(ToolSpec(name="TaskTrackerTool", params={"save_dir": tasks_dir}))
-        logger.info(f"✅ Created TaskTrackerTool with save_dir: {tasks_dir}")
+        logger.info("✅ Created TaskTrackerTool with save_dir: %s", tasks_dir)
 
     except Exception as e:
-        logger.error(f"❌ Failed to create tools: {e}")
+        logger.error("❌ Failed to create tools: %s", e)
         raise
 
     return tools
@@ -96,11 +96,11 @@ def load_system_prompt(runtime_handler: RuntimeHandler) -> str:
         with open(prompt_file, "r", encoding="utf-8") as f:
             base_prompt = f.read()
     except FileNotFoundError:
-        logger.error(f"❌ System prompt file not found: {prompt_file}")
+        logger.error("❌ System prompt file not found: %s", prompt_file)
         # Fallback to a minimal prompt if file is missing
         base_prompt = "You are OpenHands agent, a helpful AI assistant that can interact with a computer to solve tasks."
     except Exception as e:
-        logger.error(f"❌ Error loading system prompt file: {e}")
+        logger.error("❌ Error loading system prompt file: %s", e)
         base_prompt = "You are OpenHands agent, a helpful AI assistant that can interact with a computer to solve tasks."
 
     # Get runtime-appropriate workspace path
@@ -68,7 +68,7 @@ class AgentLoop:
         try:
             self.agent = create_agent(llm, self.runtime_handler)
         except Exception as e:
-            logger.error(f"❌ Failed to create agent for {self.get_key()}: {e}")
+            logger.error("❌ Failed to create agent for %s: %s", self.get_key(), e)
             raise
 
         # Create conversation using factory
@@ -88,7 +88,9 @@ class AgentLoop:
                 callbacks=callbacks,
             )
         except Exception as e:
-            logger.error(f"❌ Failed to create conversation for {self.get_key()}: {e}")
+            logger.error(
+                "❌ Failed to create conversation for %s: %s", self.get_key(), e
+            )
             raise
 
         # Thread management - simplified approach
@@ -99,7 +101,7 @@ class AgentLoop:
         self._lock = Lock()
         self._is_running = False
 
-        logger.info(f"🤖 Created refactored AgentLoop for {self.get_key()}")
+        logger.info("🤖 Created refactored AgentLoop for %s", self.get_key())
 
     @classmethod
     def from_existing_state(
@@ -118,7 +120,10 @@ class AgentLoop:
         This is a factory method that creates a new instance - the SDK handles state restoration.
         """
         logger.info(
-            f"🔄 Creating AgentLoop from existing state for {user_uuid}:{app_slug}:{riff_slug}"
+            "🔄 Creating AgentLoop from existing state for %s:%s:%s",
+            user_uuid,
+            app_slug,
+            riff_slug,
         )
 
         return cls(
@@ -138,7 +143,9 @@ class AgentLoop:
             try:
                 self.message_callback(event)
             except Exception as e:
-                logger.error(f"❌ Error in message callback for {self.get_key()}: {e}")
+                logger.error(
+                    "❌ Error in message callback for %s: %s", self.get_key(), e
+                )
 
     def get_key(self) -> str:
         """Get a unique key for this agent loop."""
@@ -150,13 +157,13 @@ class AgentLoop:
             with self._lock:
                 self._is_running = True
 
-            logger.info(f"🚀 Starting conversation for {self.get_key()}")
+            logger.info("🚀 Starting conversation for %s", self.get_key())
             self.conversation.run()
-            logger.info(f"✅ Conversation completed for {self.get_key()}")
+            logger.info("✅ Conversation completed for %s", self.get_key())
 
         except Exception as e:
-            logger.error(f"❌ Error in conversation for {self.get_key()}: {e}")
-            logger.error(f"❌ Traceback: {traceback.format_exc()}")
+            logger.error("❌ Error in conversation for %s: %s", self.get_key(), e)
+            logger.error("❌ Traceback: %s", traceback.format_exc())
         finally:
             with self._lock:
                 self._is_running = False
@@ -178,7 +185,9 @@ class AgentLoop:
             # Send message to conversation
             self.conversation.send_message(msg)
             logger.info(
-                f"📤 Sent message to conversation for {self.get_key()}: {message[:100]}..."
+                "📤 Sent message to conversation for %s: %s...",
+                self.get_key(),
+                message[:100],
             )
 
             # Start conversation in thread if not already running
@@ -187,7 +196,7 @@ class AgentLoop:
                     self._current_task is None or self._current_task.done()
                 ):
                     logger.info(
-                        f"🎯 Starting new conversation task for {self.get_key()}"
+                        "🎯 Starting new conversation task for %s", self.get_key()
                     )
                     self._current_task = self._executor.submit(
                         self._run_conversation_safely
@@ -203,7 +212,7 @@ class AgentLoop:
         except Exception as e:
             error_msg = f"❌ Failed to send message for {self.get_key()}: {e}"
             logger.error(error_msg)
-            logger.error(f"❌ Traceback: {traceback.format_exc()}")
+            logger.error("❌ Traceback: %s", traceback.format_exc())
             return error_msg
 
     def get_all_events(self):
@@ -216,7 +225,7 @@ class AgentLoop:
         try:
             return self.conversation.get_events()
         except Exception as e:
-            logger.error(f"❌ Failed to get events for {self.get_key()}: {e}")
+            logger.error("❌ Failed to get events for %s: %s", self.get_key(), e)
             return []
 
     def get_agent_status(self) -> Dict[str, Any]:
@@ -268,7 +277,7 @@ class AgentLoop:
             return status
 
         except Exception as e:
-            logger.error(f"❌ Failed to get agent status for {self.get_key()}: {e}")
+            logger.error("❌ Failed to get agent status for %s: %s", self.get_key(), e)
             return {
                 "key": self.get_key(),
                 "error": str(e),
@@ -287,15 +296,15 @@ class AgentLoop:
             # Check if conversation supports pausing
             if hasattr(self.conversation, "pause"):
                 self.conversation.pause()
-                logger.info(f"⏸️ Paused conversation for {self.get_key()}")
+                logger.info("⏸️ Paused conversation for %s", self.get_key())
                 return True
             else:
                 logger.warning(
-                    f"⚠️ Conversation does not support pausing for {self.get_key()}"
+                    "⚠️ Conversation does not support pausing for %s", self.get_key()
                 )
                 return False
         except Exception as e:
-            logger.error(f"❌ Failed to pause agent for {self.get_key()}: {e}")
+            logger.error("❌ Failed to pause agent for %s: %s", self.get_key(), e)
             return False
 
     def resume_agent(self) -> bool:
@@ -309,34 +318,34 @@ class AgentLoop:
             # Check if conversation supports resuming
             if hasattr(self.conversation, "resume"):
                 self.conversation.resume()
-                logger.info(f"▶️ Resumed conversation for {self.get_key()}")
+                logger.info("▶️ Resumed conversation for %s", self.get_key())
                 return True
             else:
                 logger.warning(
-                    f"⚠️ Conversation does not support resuming for {self.get_key()}"
+                    "⚠️ Conversation does not support resuming for %s", self.get_key()
                 )
                 return False
         except Exception as e:
-            logger.error(f"❌ Failed to resume agent for {self.get_key()}: {e}")
+            logger.error("❌ Failed to resume agent for %s: %s", self.get_key(), e)
             return False
 
     def cleanup(self):
         """Clean up resources used by this agent loop."""
         try:
-            logger.info(f"🧹 Cleaning up AgentLoop for {self.get_key()}")
+            logger.info("🧹 Cleaning up AgentLoop for %s", self.get_key())
 
             # Cancel any running tasks
             with self._lock:
                 if self._current_task and not self._current_task.done():
-                    logger.info(f"🛑 Cancelling running task for {self.get_key()}")
+                    logger.info("🛑 Cancelling running task for %s", self.get_key())
                     self._current_task.cancel()
 
             # Shutdown the executor
             if self._executor:
-                logger.info(f"🔌 Shutting down executor for {self.get_key()}")
+                logger.info("🔌 Shutting down executor for %s", self.get_key())
                 self._executor.shutdown(wait=True, timeout=10)
 
-            logger.info(f"✅ Cleanup completed for {self.get_key()}")
+            logger.info("✅ Cleanup completed for %s", self.get_key())
 
         except Exception as e:
-            logger.error(f"❌ Error during cleanup for {self.get_key()}: {e}")
+            logger.error("❌ Error during cleanup for %s: %s", self.get_key(), e)
@@ -82,13 +82,14 @@ class AgentLoopManager:
             # Check if agent loop already exists
             if key in self._agent_loops:
                 logger.warning(
-                    f"⚠️ AgentLoop already exists for {key}, returning existing instance"
+                    "⚠️ AgentLoop already exists for %s, returning existing instance",
+                    key,
                 )
                 return self._agent_loops[key]
 
             try:
                 # Create new agent loop
-                logger.info(f"🏗️ Creating new AgentLoop for {key}")
+                logger.info("🏗️ Creating new AgentLoop for %s", key)
                 agent_loop = AgentLoop(
                     user_uuid=user_uuid,
                     app_slug=app_slug,
@@ -102,12 +103,12 @@ class AgentLoopManager:
 
                 # Store the agent loop
                 self._agent_loops[key] = agent_loop
-                logger.info(f"✅ Created and stored AgentLoop for {key}")
+                logger.info("✅ Created and stored AgentLoop for %s", key)
 
                 return agent_loop
 
             except Exception as e:
-                logger.error(f"❌ Failed to create AgentLoop for {key}: {e}")
+                logger.error("❌ Failed to create AgentLoop for %s: %s", key, e)
                 raise
 
     def create_agent_loop_from_state(
@@ -143,13 +144,14 @@ class AgentLoopManager:
             # Check if agent loop already exists
             if key in self._agent_loops:
                 logger.warning(
-                    f"⚠️ AgentLoop already exists for {key}, returning existing instance"
+                    "⚠️ AgentLoop already exists for %s, returning existing instance",
+                    key,
                 )
                 return self._agent_loops[key]
 
             try:
                 # Create agent loop from existing state
-                logger.info(f"🔄 Creating AgentLoop from existing state for {key}")
+                logger.info("🔄 Creating AgentLoop from existing state for %s", key)
                 agent_loop = AgentLoop.from_existing_state(
                     user_uuid=user_uuid,
                     app_slug=app_slug,
@@ -163,12 +165,14 @@ class AgentLoopManager:
 
                 # Store the agent loop
                 self._agent_loops[key] = agent_loop
-                logger.info(f"✅ Created and stored AgentLoop from state for {key}")
+                logger.info("✅ Created and stored AgentLoop from state for %s", key)
 
                 return agent_loop
 
             except Exception as e:
-                logger.error(f"❌ Failed to create AgentLoop from state for {key}: {e}")
+                logger.error(
+                    "❌ Failed to create AgentLoop from state for %s: %s", key, e
+                )
                 raise
 
     def get_agent_loop(
@@ -190,9 +194,9 @@ class AgentLoopManager:
         with self._loops_lock:
             agent_loop = self._agent_loops.get(key)
             if agent_loop:
-                logger.debug(f"📋 Retrieved existing AgentLoop for {key}")
+                logger.debug("📋 Retrieved existing AgentLoop for %s", key)
             else:
-                logger.debug(f"❓ No AgentLoop found for {key}")
+                logger.debug("❓ No AgentLoop found for %s", key)
             return agent_loop
 
     def remove_agent_loop(self, user_uuid: str, app_slug: str, riff_slug: str) -> bool:
@@ -212,20 +216,20 @@ class AgentLoopManager:
         with self._loops_lock:
             agent_loop = self._agent_loops.get(key)
             if agent_loop:
-                logger.info(f"🗑️ Removing and cleaning up AgentLoop for {key}")
+                logger.info("🗑️ Removing and cleaning up AgentLoop for %s", key)
 
                 # Cleanup the agent loop
                 try:
                     agent_loop.cleanup()
                 except Exception as e:
-                    logger.error(f"❌ Error during cleanup of AgentLoop {key}: {e}")
+                    logger.error("❌ Error during cleanup of AgentLoop %s: %s", key, e)
 
                 # Remove from storage
                 del self._agent_loops[key]
-                logger.info(f"✅ Removed AgentLoop for {key}")
+                logger.info("✅ Removed AgentLoop for %s", key)
                 return True
             else:
-                logger.warning(f"⚠️ No AgentLoop found to remove for {key}")
+                logger.warning("⚠️ No AgentLoop found to remove for %s", key)
                 return False
 
     def get_stats(self) -> Dict[str, Any]:
@@ -259,7 +263,7 @@ class AgentLoopManager:
                         local_loops += 1
 
                 except Exception as e:
-                    logger.error(f"❌ Error getting status for {key}: {e}")
+                    logger.error("❌ Error getting status for %s: %s", key, e)
                     loop_details.append(
                         {
                             "key": key,
@@ -287,15 +291,17 @@ class AgentLoopManager:
                 agent_loop = self._agent_loops.get(key)
                 if agent_loop:
                     try:
-                        logger.info(f"🧹 Cleaning up AgentLoop for {key}")
+                        logger.info("🧹 Cleaning up AgentLoop for %s", key)
                         agent_loop.cleanup()
                     except Exception as e:
-                        logger.error(f"❌ Error during cleanup of AgentLoop {key}: {e}")
+                        logger.error(
+                            "❌ Error during cleanup of AgentLoop %s: %s", key, e
+                        )
 
                     # Remove from storage
                     del self._agent_loops[key]
 
-            logger.info(f"✅ Cleaned up {len(keys_to_remove)} AgentLoops")
+            logger.info("✅ Cleaned up %s AgentLoops", len(keys_to_remove))
 
 
 # Create singleton instance
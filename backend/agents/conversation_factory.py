@@ -89,12 +89,15 @@ class ConversationFactory:
         key = f"{user_uuid}:{app_slug}:{riff_slug}"
 
         logger.info(
-            f"🌐 Creating RemoteConversation for {key} using runtime: {self.runtime_handler.runtime_url}"
+            "🌐 Creating RemoteConversation for %s using runtime: %s",
+            key,
+            self.runtime_handler.runtime_url,
         )
 
         # Wait for the runtime to be ready and alive before creating the conversation
         logger.info(
-            f"⏳ Waiting for runtime to be ready and alive before creating conversation: {self.runtime_handler.runtime_url}"
+            "⏳ Waiting for runtime to be ready and alive before creating conversation: %s",
+            self.runtime_handler.runtime_url,
         )
         ready_success, ready_response = (
             runtime_service.wait_for_runtime_ready_and_alive(
@@ -109,11 +112,12 @@ class ConversationFactory:
 
         if not ready_success:
             error_msg = f"Runtime is not ready and alive: {ready_response.get('error', 'Unknown error')}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise RuntimeError(error_msg)
 
         logger.info(
-            f"✅ Runtime is ready and alive, creating conversation: {self.runtime_handler.runtime_url}"
+            "✅ Runtime is ready and alive, creating conversation: %s",
+            self.runtime_handler.runtime_url,
         )
 
         return Conversation(
@@ -135,13 +139,13 @@ class ConversationFactory:
         """Create a local conversation with file store persistence."""
         key = f"{user_uuid}:{app_slug}:{riff_slug}"
 
-        logger.info(f"🏠 Creating local Conversation for {key}")
+        logger.info("🏠 Creating local Conversation for %s", key)
 
         # Create LocalFileStore for persistence
         try:
             file_store = LocalFileStore(self.runtime_handler.state_path)
         except Exception as e:
-            logger.error(f"❌ Failed to create file store for {key}: {e}")
+            logger.error("❌ Failed to create file store for %s: %s", key, e)
             raise
 
         # Generate conversation ID as a proper UUID object
@@ -178,8 +182,10 @@ class ConversationFactory:
             or ("Agent provided is different" in error_msg and "tools:" in error_msg)
             or ("Conversation ID mismatch" in error_msg)
         ):
-            logger.warning(f"⚠️ Detected tool migration issue for {key}: {error_msg}")
-            logger.info(f"🔄 Clearing persisted state to handle tool name changes...")
+            logger.warning(
+                "⚠️ Detected tool migration issue for %s: %s", key, error_msg
+            )
+            logger.info("🔄 Clearing persisted state to handle tool name changes...")
 
             # Clear the persisted state directory
             if os.path.exists(self.runtime_handler.state_path):
@@ -190,7 +196,7 @@ class ConversationFactory:
             file_store = LocalFileStore(self.runtime_handler.state_path)
 
             # Retry conversation creation
-            logger.info(f"🏠 Retrying local Conversation creation for {key}")
+            logger.info("🏠 Retrying local Conversation creation for %s", key)
             conversation = Conversation(
                 agent=agent,
                 callbacks=callbacks,
@@ -198,7 +204,7 @@ class ConversationFactory:
                 conversation_id=conversation_id,
                 visualize=False,
             )
-            logger.info(f"✅ Successfully recreated conversation after state migration")
+            logger.info("✅ Successfully recreated conversation after state migration")
             return conversation
         else:
             # Re-raise the original error if it's not a migration issue
@@ -233,7 +239,8 @@ class ConversationFactory:
             # For remote conversations, we might want to retry once
             if self.runtime_handler.is_remote and "Runtime is not ready" in str(e):
                 logger.warning(
-                    f"⚠️ Retrying remote conversation creation after runtime error: {e}"
+                    "⚠️ Retrying remote conversation creation after runtime error: %s",
+                    e,
                 )
                 # Wait a bit and retry once
                 import time
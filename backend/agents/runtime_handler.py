@@ -16,7 +16,7 @@ def ensure_directory_exists(path: str) -> bool:
         os.makedirs(path, exist_ok=True)
         return True
     except Exception as e:
-        logger.error(f"❌ Failed to create directory {path}: {e}")
+        logger.error("❌ Failed to create directory %s: %s", path, e)
         return False
 
 
@@ -90,14 +90,14 @@ class RuntimeHandler:
             # Create project directory if it doesn't exist
             project_dir = os.path.join(self.workspace_path, "project")
             if not ensure_directory_exists(project_dir):
-                logger.warning(f"⚠️ Could not create project directory: {project_dir}")
+                logger.warning("⚠️ Could not create project directory: %s", project_dir)
                 # Fall back to workspace root for bash operations
                 project_dir = self.workspace_path
 
             # Create tasks directory for TaskTracker
             tasks_dir = os.path.join(self.workspace_path, "tasks")
             if not ensure_directory_exists(tasks_dir):
-                logger.warning(f"⚠️ Could not create tasks directory: {tasks_dir}")
+                logger.warning("⚠️ Could not create tasks directory: %s", tasks_dir)
                 # Fall back to workspace root
                 tasks_dir = self.workspace_path
 
@@ -138,10 +138,10 @@ class RuntimeHandler:
         runtime_type = "🌐 Remote" if self.is_remote else "🏠 Local"
         paths = self.get_runtime_paths()
 
-        logger.info(f"{runtime_type} runtime configuration {context}")
-        logger.info(f"  Project dir: {paths['project_dir']}")
-        logger.info(f"  Tasks dir: {paths['tasks_dir']}")
-        logger.info(f"  Agent workspace: {paths['agent_workspace_path']}")
+        logger.info("%s runtime configuration %s", runtime_type, context)
+        logger.info("  Project dir: %s", paths["project_dir"])
+        logger.info("  Tasks dir: %s", paths["tasks_dir"])
+        logger.info("  Agent workspace: %s", paths["agent_workspace_path"])
 
         if self.is_remote:
-            logger.info(f"  Runtime URL: {self.runtime_url}")
+            logger.info("  Runtime URL: %s", self.runtime_url)
@@ -7,6 +7,7 @@ from routes.basic import basic_bp
 from routes.integrations import integrations_bp
 from routes.apps import apps_bp
 from routes.riffs import riffs_bp
+from utils.json_provider import ORJSONProvider
 from utils.logging import get_logger, log_system_info
 
 # No-op import to ensure agent-sdk loads properly
@@ -38,6 +39,12 @@ logger = get_logger(__name__)
 app = Flask(__name__)
 CORS(app)
 
+# Serialize JSON responses as-is (no key sorting, no pretty-printing),
+# encoded with orjson
+app.json = ORJSONProvider(app)
+app.json.sort_keys = False
+app.json.compact = True
+
 # Register blueprints
 app.register_blueprint(basic_bp)
 app.register_blueprint(integrations_bp)
@@ -46,10 +53,10 @@ app.register_blueprint(riffs_bp)
 
 # Enhanced startup logging using centralized utility
 log_system_info(logger)
-logger.info(f"📦 Flask app name: {app.name}")
+logger.info("📦 Flask app name: %s", app.name)
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 3001))
-    logger.info(f"🚀 Starting Flask server on port {port}")
-    logger.info(f"🌐 Server will be accessible at http://0.0.0.0:{port}")
+    logger.info("🚀 Starting Flask server on port %s", port)
+    logger.info("🌐 Server will be accessible at http://0.0.0.0:%s", port)
     app.run(host="0.0.0.0", port=port, debug=False)
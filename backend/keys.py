@@ -66,12 +66,12 @@ def validate_anthropic_key(api_key):
         logger.debug("🤖 Validating Anthropic API key (empty/None)")
         return False
 
-    logger.debug(f"🤖 Validating Anthropic API key (length: {len(api_key)})")
+    logger.debug("🤖 Validating Anthropic API key (length: %s)", len(api_key))
 
     # In mock mode, accept any non-empty key
     if is_mock_mode():
         is_valid = bool(api_key and api_key.strip())
-        logger.info(f"🎭 MOCK_MODE: Anthropic key validation result: {is_valid}")
+        logger.info("🎭 MOCK_MODE: Anthropic key validation result: %s", is_valid)
         return is_valid
 
     try:
@@ -92,12 +92,12 @@ def validate_anthropic_key(api_key):
             },
             timeout=10,
         )
-        logger.debug(f"📡 Anthropic API response: {response.status_code}")
+        logger.debug("📡 Anthropic API response: %s", response.status_code)
         if response.status_code != 200:
-            logger.warning(f"❌ Anthropic API error: {response.text[:200]}")
+            logger.warning("❌ Anthropic API error: %s", response.text[:200])
         return response.status_code == 200
     except Exception as e:
-        logger.error(f"💥 Anthropic API validation error: {str(e)}")
+        logger.error("💥 Anthropic API validation error: %s", e)
         return False
 
 
@@ -108,12 +108,12 @@ def validate_github_key(api_key):
         logger.debug("🐙 Validating GitHub API key (empty/None)")
         return False
 
-    logger.debug(f"🐙 Validating GitHub API key (length: {len(api_key)})")
+    logger.debug("🐙 Validating GitHub API key (length: %s)", len(api_key))
 
     # In mock mode, accept any non-empty key
     if is_mock_mode():
         is_valid = bool(api_key and api_key.strip())
-        logger.info(f"🎭 MOCK_MODE: GitHub key validation result: {is_valid}")
+        logger.info("🎭 MOCK_MODE: GitHub key validation result: %s", is_valid)
         return is_valid
 
     try:
@@ -125,12 +125,12 @@ def validate_github_key(api_key):
         response = requests.get(
             "https://api.github.com/user", headers=headers, timeout=10
         )
-        logger.debug(f"📡 GitHub API response: {response.status_code}")
+        logger.debug("📡 GitHub API response: %s", response.status_code)
         if response.status_code != 200:
-            logger.warning(f"❌ GitHub API error: {response.text[:200]}")
+            logger.warning("❌ GitHub API error: %s", response.text[:200])
         return response.status_code == 200
     except Exception as e:
-        logger.error(f"💥 GitHub API validation error: {str(e)}")
+        logger.error("💥 GitHub API validation error: %s", e)
         return False
 
 
@@ -141,12 +141,12 @@ def validate_fly_key(api_key):
         logger.debug("🪰 Validating Fly.io API key (empty/None)")
         return False
 
-    logger.debug(f"🪰 Validating Fly.io API key (length: {len(api_key)})")
+    logger.debug("🪰 Validating Fly.io API key (length: %s)", len(api_key))
 
     # In mock mode, accept any non-empty key
     if is_mock_mode():
         is_valid = bool(api_key and api_key.strip())
-        logger.info(f"🎭 MOCK_MODE: Fly.io key validation result: {is_valid}")
+        logger.info("🎭 MOCK_MODE: Fly.io key validation result: %s", is_valid)
         return is_valid
 
     try:
@@ -159,9 +159,9 @@ def validate_fly_key(api_key):
         valid_prefixes = ["fo1_", "fm1_", "fm2_", "ft1_", "ft2_"]
         has_valid_prefix = any(api_key.startswith(prefix) for prefix in valid_prefixes)
 
-        logger.debug(f"🔍 Token prefix check - has valid prefix: {has_valid_prefix}")
+        logger.debug("🔍 Token prefix check - has valid prefix: %s", has_valid_prefix)
         if has_valid_prefix:
-            logger.debug(f"✅ Found valid prefix: {api_key[:4]}...")
+            logger.debug("✅ Found valid prefix: %s...", api_key[:4])
 
         # If it doesn't have a known prefix, it might be a personal auth token
         # Personal tokens are typically longer and don't have specific prefixes
@@ -188,9 +188,9 @@ def validate_fly_key(api_key):
             "https://api.machines.dev/v1/apps", headers=headers, timeout=10
         )
 
-        logger.debug(f"📡 Fly.io API response: {response.status_code}")
+        logger.debug("📡 Fly.io API response: %s", response.status_code)
         if response.status_code not in [200, 403, 404]:
-            logger.warning(f"❌ Fly.io API error: {response.text[:200]}")
+            logger.warning("❌ Fly.io API error: %s", response.text[:200])
 
         # Accept both 200 (success) and 403 (forbidden but authenticated)
         # 403 might occur if the token doesn't have permission to list apps
@@ -213,12 +213,12 @@ def validate_fly_key(api_key):
         else:
             # Other status codes (500, etc.) - assume invalid for safety
             logger.warning(
-                f"❌ Fly.io API returned unexpected status: {response.status_code}"
+                "❌ Fly.io API returned unexpected status: %s", response.status_code
             )
             return False
 
     except Exception as e:
-        logger.error(f"💥 Fly.io API validation error: {str(e)}")
+        logger.error("💥 Fly.io API validation error: %s", e)
         return False
 
 
@@ -231,7 +231,7 @@ def validate_api_key(provider, api_key):
     elif provider == "fly":
         return validate_fly_key(api_key)
     else:
-        logger.warning(f"❌ Unknown provider: {provider}")
+        logger.warning("❌ Unknown provider: %s", provider)
         return False
 
 
@@ -250,7 +250,7 @@ def get_mock_response(method: str, url: str, **kwargs) -> MockResponse:
     if not MOCK_MODE:
         raise ValueError("get_mock_response should only be called in MOCK_MODE")
 
-    logger.info(f"🎭 MOCK_MODE: {method} {url}")
+    logger.info("🎭 MOCK_MODE: %s %s", method, url)
 
     # GitHub API mocks
     if "api.github.com" in url:
@@ -333,7 +333,7 @@ def get_mock_response(method: str, url: str, **kwargs) -> MockResponse:
 
     # Default mock response for unknown URLs
     else:
-        logger.info(f"🎭 MOCK_MODE: No mock defined for {method} {url}")
+        logger.info("🎭 MOCK_MODE: No mock defined for %s %s", method, url)
         return MockResponse(404, {"error": "Mock not implemented"})
 
 
@@ -352,6 +352,10 @@ def patch_requests_for_mock_mode():
     original_post = requests.post
     original_delete = requests.delete
     original_put = requests.put
+    original_session_methods = {
+        name: getattr(requests.Session, name)
+        for name in ("get", "post", "delete", "put")
+    }
 
     def mock_get(url, **kwargs):
         return get_mock_response("GET", url, **kwargs)
@@ -371,6 +375,13 @@ def patch_requests_for_mock_mode():
     requests.delete = mock_delete
     requests.put = mock_put
 
+    # Patch requests.Session so the shared sessions in utils.http_sessions
+    # are mocked as well
+    requests.Session.get = lambda self, url, **kwargs: mock_get(url, **kwargs)
+    requests.Session.post = lambda self, url, **kwargs: mock_post(url, **kwargs)
+    requests.Session.delete = lambda self, url, **kwargs: mock_delete(url, **kwargs)
+    requests.Session.put = lambda self, url, **kwargs: mock_put(url, **kwargs)
+
     logger.info("🎭 MOCK_MODE: Patched requests module with mock responses")
 
     # Return a function to restore original methods
@@ -379,6 +390,8 @@ def patch_requests_for_mock_mode():
         requests.post = original_post
         requests.delete = original_delete
         requests.put = original_put
+        for name, method in original_session_methods.items():
+            setattr(requests.Session, name, method)
         logger.info("🎭 MOCK_MODE: Restored original requests module")
 
     return restore_requests
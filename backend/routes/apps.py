@@ -1,18 +1,22 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, g, jsonify, request
 import requests
-import json
 import logging
 import re
 import time
 import uuid
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from nacl import encoding, public
 from keys import load_user_keys
 from storage import get_apps_storage, get_riffs_storage
-from storage.base_storage import DATA_DIR
 from agents import agent_loop_manager
 from utils.deployment_status import get_deployment_status
+from utils.http_sessions import conditional_get_json, fly_session, github_session
+from utils.repository import parse_github_url
+from utils.ttl_cache import ttl_cache
+from utils.request_validation import require_user_uuid
+from utils.responses import conditional_jsonify
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +24,28 @@ logger = logging.getLogger(__name__)
 apps_bp = Blueprint("apps", __name__)
 
 
+# Slug patterns are compiled once at import rather than on every call.
+# Valid slugs: lowercase letters, numbers, and single hyphens between them
+_VALID_SLUG_RE = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
+_SLUG_STRIP_RE = re.compile(r"[^a-z0-9\s-]")
+_SLUG_DASH_RE = re.compile(r"[\s-]+")
+
+# How long GitHub/Fly.io status lookups are reused before hitting the APIs again
+STATUS_CACHE_TTL = 15
+
+# A token's Fly.io organization effectively never changes; re-detect hourly
+FLY_ORG_CACHE_TTL = 3600
+
+# Shared pool for running independent GitHub/Fly.io API calls in parallel
+_status_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="apps-api")
+
+# Separate pool for leaf GitHub requests fanned out inside a task that may
+# itself be running on _status_executor, so the two can never starve each other
+_github_fetch_executor = ThreadPoolExecutor(
+    max_workers=16, thread_name_prefix="github-fetch"
+)
+
+
 def load_user_apps(user_uuid):
     """Load apps for a specific user"""
     storage = get_apps_storage(user_uuid)
@@ -50,42 +76,17 @@ def delete_user_app(user_uuid, app_slug):
     return storage.delete_app(app_slug)
 
 
-# Legacy functions for backward compatibility during migration
-def load_apps():
-    """Load apps from legacy file - DEPRECATED"""
-    logger.warning("⚠️ Using deprecated load_apps() function")
-    legacy_file = DATA_DIR / "apps.json"
-    if legacy_file.exists():
-        try:
-            with open(legacy_file, "r") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"❌ Failed to load legacy apps: {e}")
-    return []
-
-
-def save_apps(apps):
-    """Save apps to legacy file - DEPRECATED"""
-    logger.warning("⚠️ Using deprecated save_apps() function")
-    return False  # Disable legacy saving
-
-
 def is_valid_slug(slug):
     """Validate that a slug contains only lowercase letters, numbers, and hyphens"""
     if not slug:
         return False
-    # Check if slug matches the pattern: lowercase letters, numbers, and hyphens only
-    # Must not start or end with hyphen, and no consecutive hyphens
-    pattern = r"^[a-z0-9]+(-[a-z0-9]+)*$"
-    return bool(re.match(pattern, slug))
+    return bool(_VALID_SLUG_RE.match(slug))
 
 
 def create_slug(name):
     """Convert app name to slug format"""
-    # Convert to lowercase and replace spaces/special chars with hyphens
-    slug = re.sub(r"[^a-zA-Z0-9\s-]", "", name.lower())
-    slug = re.sub(r"\s+", "-", slug.strip())
-    slug = re.sub(r"-+", "-", slug)
+    # Drop special chars, then collapse whitespace/hyphen runs into one hyphen
+    slug = _SLUG_DASH_RE.sub("-", _SLUG_STRIP_RE.sub("", name.lower()))
     return slug.strip("-")
 
 
@@ -114,7 +115,10 @@ def create_initial_riff_and_message(
         riff_slug = riff_name  # Already in slug format since app_slug is validated
 
         logger.info(
-            f"🔄 Creating initial riff: {riff_name} -> {riff_slug} for app {app_slug}"
+            "🔄 Creating initial riff: %s -> %s for app %s",
+            riff_name,
+            riff_slug,
+            app_slug,
         )
 
         # Create riff record
@@ -159,13 +163,15 @@ Update the corresponding PR title and description but be brief.
             return False, "Failed to save initial message"
 
         # Create agent for the riff using the working function from riffs.py
-        logger.info(f"🤖 Creating agent for initial riff: {riff_slug}")
+        logger.info("🤖 Creating agent for initial riff: %s", riff_slug)
         agent_success, agent_error = create_agent_for_user(
             user_uuid, app_slug, riff_slug
         )
 
         if not agent_success:
-            logger.warning(f"⚠️ Failed to create agent for initial riff: {agent_error}")
+            logger.warning(
+                "⚠️ Failed to create agent for initial riff: %s", agent_error
+            )
             # Don't fail the entire process if agent creation fails
             return True, {
                 "riff": riff,
@@ -180,46 +186,47 @@ Update the corresponding PR title and description but be brief.
             )
             if agent_loop:
                 logger.info(
-                    f"🤖 Sending initial message to agent for {user_uuid[:8]}/{app_slug}/{riff_slug}"
+                    "🤖 Sending initial message to agent for %s/%s/%s",
+                    user_uuid[:8],
+                    app_slug,
+                    riff_slug,
                 )
                 confirmation = agent_loop.send_message(initial_message_content)
-                logger.info(f"✅ Initial message sent to agent: {confirmation}")
+                logger.info("✅ Initial message sent to agent: %s", confirmation)
             else:
                 logger.warning(
-                    f"❌ AgentLoop not found after creation for {user_uuid[:8]}:{app_slug}:{riff_slug}"
+                    "❌ AgentLoop not found after creation for %s:%s:%s",
+                    user_uuid[:8],
+                    app_slug,
+                    riff_slug,
                 )
         except Exception as e:
-            logger.warning(f"⚠️ Failed to send initial message to agent: {str(e)}")
+            logger.warning("⚠️ Failed to send initial message to agent: %s", e)
 
         logger.info(
-            f"✅ Created initial riff and message for app: {app_slug_for_message}"
+            "✅ Created initial riff and message for app: %s", app_slug_for_message
         )
         return True, {"riff": riff, "message": message}
 
     except Exception as e:
-        logger.error(f"💥 Error creating initial riff and message: {str(e)}")
+        logger.error("💥 Error creating initial riff and message: %s", e)
         return False, f"Error creating initial riff: {str(e)}"
 
 
-def get_user_default_org(fly_token):
+@ttl_cache(FLY_ORG_CACHE_TTL)
+def detect_fly_org(fly_token):
     """
-    Get the user's default organization slug by checking their existing apps.
+    Detect the organization slug of a Fly.io token from its first app.
 
-    This function tries to determine the user's actual organization slug
-    by listing their existing apps and extracting the organization information.
-    Falls back to 'personal' if no apps exist or API call fails.
+    Only the first app is requested (limit=1) since that is all the detection
+    needs; successful detections are cached per token.
 
     Args:
         fly_token (str): The user's Fly.io API token
 
     Returns:
-        tuple: (success, org_slug_or_error_message)
+        str: Organization slug, or None if it could not be determined
     """
-    if not fly_token:
-        return False, "Fly.io API token is required"
-
-    logger.debug(f"🛩️ Attempting to determine user's organization from existing apps")
-
     try:
         headers = {
             "Authorization": f"Bearer {fly_token}",
@@ -228,33 +235,61 @@ def get_user_default_org(fly_token):
         }
 
         # Try to list user's existing apps to determine their organization
-        response = requests.get(
-            "https://api.machines.dev/v1/apps", headers=headers, timeout=10
+        response = fly_session.get(
+            "https://api.machines.dev/v1/apps",
+            headers=headers,
+            params={"limit": 1},
+            timeout=10,
         )
 
-        if response.status_code == 200:
-            apps = response.json()
-            if apps and len(apps) > 0:
-                # Get organization from the first app
-                first_app = apps[0]
-                org_slug = first_app.get("organization", {}).get("slug")
-                if org_slug:
-                    logger.debug(
-                        f"🛩️ Detected user organization from existing apps: {org_slug}"
-                    )
-                    return True, org_slug
-                else:
-                    logger.debug(f"🛩️ No organization info found in existing apps")
-            else:
-                logger.debug(f"🛩️ User has no existing apps")
-        else:
-            logger.debug(f"🛩️ Failed to list apps: {response.status_code}")
+        if response.status_code != 200:
+            logger.debug("🛩️ Failed to list apps: %s", response.status_code)
+            return None
+
+        apps = response.json()
+        if not apps:
+            logger.debug("🛩️ User has no existing apps")
+            return None
+
+        # Get organization from the first app
+        org_slug = (apps[0].get("organization") or {}).get("slug")
+        if not org_slug:
+            logger.debug("🛩️ No organization info found in existing apps")
+            return None
+
+        logger.debug("🛩️ Detected user organization from existing apps: %s", org_slug)
+        return org_slug
 
     except Exception as e:
-        logger.debug(f"🛩️ Error determining organization from apps: {str(e)}")
+        logger.debug("🛩️ Error determining organization from apps: %s", e)
+        return None
+
+
+def get_user_default_org(fly_token):
+    """
+    Get the user's default organization slug by checking their existing apps.
+
+    This function tries to determine the user's actual organization slug
+    by listing their existing apps and extracting the organization information.
+    Falls back to 'personal' if no apps exist or API call fails.
+
+    Args:
+        fly_token (str): The user's Fly.io API token
+
+    Returns:
+        tuple: (success, org_slug_or_error_message)
+    """
+    if not fly_token:
+        return False, "Fly.io API token is required"
+
+    logger.debug("🛩️ Attempting to determine user's organization from existing apps")
+
+    org_slug = detect_fly_org(fly_token)
+    if org_slug:
+        return True, org_slug
 
     # Fall back to 'personal' as the default organization slug
-    logger.debug(f"🛩️ Falling back to default organization: personal")
+    logger.debug("🛩️ Falling back to default organization: personal")
     return True, "personal"
 
 
@@ -272,14 +307,15 @@ def create_fly_app(app_name, fly_token):
     if not fly_token:
         return False, "Fly.io API token is required"
 
-    logger.info(f"🛩️ Creating Fly.io app: {app_name}")
+    logger.info("🛩️ Creating Fly.io app: %s", app_name)
+    get_fly_status.invalidate(app_name, fly_token)
 
     # First, get the user's default organization
     success, org_slug = get_user_default_org(fly_token)
     if not success:
         return False, f"Failed to get user organization: {org_slug}"
 
-    logger.debug(f"🛩️ Using organization: {org_slug}")
+    logger.debug("🛩️ Using organization: %s", org_slug)
 
     headers = {
         "Authorization": f"Bearer {fly_token}",
@@ -289,7 +325,7 @@ def create_fly_app(app_name, fly_token):
 
     # Check if app already exists first
     try:
-        check_response = requests.get(
+        check_response = fly_session.get(
             f"https://api.machines.dev/v1/apps/{app_name}", headers=headers, timeout=10
         )
 
@@ -302,13 +338,19 @@ def create_fly_app(app_name, fly_token):
             # it means they have access to it. This is a strong indicator of ownership.
             # We'll accept this as ownership regardless of organization slug mismatch,
             # since the organization detection might not be perfect.
-            logger.info(f"✅ App '{app_name}' already exists and user has access to it")
-            logger.debug(f"🛩️ App organization: {app_org_slug}, Expected: {org_slug}")
+            logger.info(
+                "✅ App '%s' already exists and user has access to it", app_name
+            )
+            logger.debug(
+                "🛩️ App organization: %s, Expected: %s", app_org_slug, org_slug
+            )
 
             # Update our understanding of the user's organization if it differs
             if app_org_slug and app_org_slug != org_slug:
                 logger.debug(
-                    f"🛩️ Updating user organization from {org_slug} to {app_org_slug}"
+                    "🛩️ Updating user organization from %s to %s",
+                    org_slug,
+                    app_org_slug,
                 )
 
             return True, app_data
@@ -316,52 +358,54 @@ def create_fly_app(app_name, fly_token):
         elif check_response.status_code == 403:
             # App exists but user doesn't have access - this means it's owned by someone else
             logger.error(
-                f"❌ App '{app_name}' exists but user doesn't have access to it"
+                "❌ App '%s' exists but user doesn't have access to it", app_name
             )
             return False, f"App '{app_name}' already exists and is not owned by you"
 
         elif check_response.status_code == 401:
             # Unauthorized - invalid token
-            logger.error(f"❌ Invalid Fly.io API token")
+            logger.error("❌ Invalid Fly.io API token")
             return False, "Invalid Fly.io API token"
 
         elif check_response.status_code != 404:
             # Some other error occurred
             logger.error(
-                f"❌ Error checking app existence: {check_response.status_code} - {check_response.text}"
+                "❌ Error checking app existence: %s - %s",
+                check_response.status_code,
+                check_response.text,
             )
             return False, f"Error checking app existence: {check_response.status_code}"
 
     except Exception as e:
-        logger.error(f"💥 Error checking app existence: {str(e)}")
+        logger.error("💥 Error checking app existence: %s", e)
         return False, f"Error checking app existence: {str(e)}"
 
     # App doesn't exist, create it
     try:
         create_data = {"app_name": app_name, "org_slug": org_slug}
 
-        logger.debug(f"🛩️ Creating app with data: {create_data}")
+        logger.debug("🛩️ Creating app with data: %s", create_data)
 
-        create_response = requests.post(
+        create_response = fly_session.post(
             "https://api.machines.dev/v1/apps",
             headers=headers,
             json=create_data,
             timeout=30,
         )
 
-        logger.debug(f"🛩️ App creation response status: {create_response.status_code}")
+        logger.debug("🛩️ App creation response status: %s", create_response.status_code)
 
         if create_response.status_code == 201:
             app_data = create_response.json()
-            logger.info(f"✅ Successfully created Fly.io app: {app_name}")
-            logger.debug(f"🛩️ Created app data: {app_data}")
+            logger.info("✅ Successfully created Fly.io app: %s", app_name)
+            logger.debug("🛩️ Created app data: %s", app_data)
             return True, app_data
 
         elif create_response.status_code == 422:
             # App name might be taken or invalid
             error_text = create_response.text
             logger.error(
-                f"❌ App creation failed - name taken or invalid: {error_text}"
+                "❌ App creation failed - name taken or invalid: %s", error_text
             )
             if "already taken" in error_text.lower():
                 return False, f"App name '{app_name}' is already taken"
@@ -369,50 +413,49 @@ def create_fly_app(app_name, fly_token):
                 return False, f"Invalid app name or creation failed: {error_text}"
 
         elif create_response.status_code == 401:
-            logger.error(f"❌ Unauthorized - invalid Fly.io API token")
+            logger.error("❌ Unauthorized - invalid Fly.io API token")
             return False, "Invalid Fly.io API token"
 
         elif create_response.status_code == 403:
-            logger.error(f"❌ Forbidden - insufficient permissions")
+            logger.error("❌ Forbidden - insufficient permissions")
             return False, "Insufficient permissions for Fly.io API"
 
         else:
             logger.error(
-                f"❌ Unexpected response from Fly.io API: {create_response.status_code} - {create_response.text}"
+                "❌ Unexpected response from Fly.io API: %s - %s",
+                create_response.status_code,
+                create_response.text,
             )
             return False, f"Fly.io API error: {create_response.status_code}"
 
     except requests.exceptions.Timeout:
-        logger.error(f"❌ Timeout creating Fly.io app")
+        logger.error("❌ Timeout creating Fly.io app")
         return False, "Timeout creating Fly.io app"
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error connecting to Fly.io API: {str(e)}")
+        logger.error("❌ Error connecting to Fly.io API: %s", e)
         return False, f"Error connecting to Fly.io API: {str(e)}"
 
     except Exception as e:
-        logger.error(f"💥 Unexpected error creating Fly.io app: {str(e)}")
+        logger.error("💥 Unexpected error creating Fly.io app: %s", e)
         return False, f"Unexpected error: {str(e)}"
 
 
+@ttl_cache(STATUS_CACHE_TTL)
 def get_github_status(repo_url, github_token):
     """Get GitHub repository status including CI/CD tests"""
-    logger.info(f"🐙 Checking GitHub status for: {repo_url}")
+    logger.info("🐙 Checking GitHub status for: %s", repo_url)
 
     try:
         # Extract owner and repo from URL
         # Expected format: https://github.com/owner/repo
-        if not repo_url or "github.com" not in repo_url:
-            logger.warning(f"❌ Invalid GitHub URL: {repo_url}")
+        parsed = parse_github_url(repo_url)
+        if not parsed:
+            logger.warning("❌ Invalid GitHub URL: %s", repo_url)
             return None
 
-        parts = repo_url.replace("https://github.com/", "").split("/")
-        if len(parts) < 2:
-            logger.warning(f"❌ Cannot parse GitHub URL: {repo_url}")
-            return None
-
-        owner, repo = parts[0], parts[1]
-        logger.debug(f"🔍 GitHub repo: {owner}/{repo}")
+        owner, repo = parsed
+        logger.debug("🔍 GitHub repo: %s/%s", owner, repo)
 
         headers = {
             "Authorization": f"token {github_token}",
@@ -420,44 +463,43 @@ def get_github_status(repo_url, github_token):
             "User-Agent": "OpenVibe-Backend/1.0",
         }
 
-        logger.debug(f"🔍 Request headers: {dict(headers)}")
         logger.info(
-            f"🔍 Making request to: https://api.github.com/repos/{owner}/{repo}/commits/main"
+            "🔍 Making request to: https://api.github.com/repos/%s/%s/commits/main",
+            owner,
+            repo,
         )
 
-        # Get latest commit on main branch
-        commits_response = requests.get(
+        # Get latest commit on main branch (revalidated with ETag when possible)
+        commits_ok, commits_response, commit_data = conditional_get_json(
+            github_session,
             f"https://api.github.com/repos/{owner}/{repo}/commits/main",
-            headers=headers,
-            timeout=10,
+            headers,
         )
 
-        if commits_response.status_code != 200:
-            logger.warning(f"❌ Failed to get commits: {commits_response.status_code}")
-            logger.warning(f"❌ Response body: {commits_response.text[:500]}")
-            logger.debug(f"❌ Response headers count: {len(commits_response.headers)}")
+        if not commits_ok:
+            logger.warning("❌ Failed to get commits: %s", commits_response.status_code)
+            logger.warning("❌ Response body: %s", commits_response.text[:500])
             return None
 
-        commit_data = commits_response.json()
         latest_commit_sha = commit_data["sha"]
-        logger.debug(f"🔍 Latest commit: {latest_commit_sha[:7]}")
+        logger.debug("🔍 Latest commit: %s", latest_commit_sha[:7])
 
         # Get status checks for the latest commit
-        status_response = requests.get(
+        status_ok, status_response, status_data = conditional_get_json(
+            github_session,
             f"https://api.github.com/repos/{owner}/{repo}/commits/{latest_commit_sha}/status",
-            headers=headers,
-            timeout=10,
+            headers,
         )
 
         logger.info(
-            f"🔍 GitHub status API response code: {status_response.status_code}"
+            "🔍 GitHub status API response code: %s", status_response.status_code
         )
 
-        if status_response.status_code != 200:
+        if not status_ok:
             logger.warning(
-                f"❌ Failed to get status checks: {status_response.status_code}"
+                "❌ Failed to get status checks: %s", status_response.status_code
             )
-            logger.warning(f"❌ Response body: {status_response.text[:500]}")
+            logger.warning("❌ Response body: %s", status_response.text[:500])
             # Return basic info even if status checks fail
             return {
                 "tests_passing": None,
@@ -465,24 +507,23 @@ def get_github_status(repo_url, github_token):
                 "status": "unknown",
             }
 
-        status_data = status_response.json()
         logger.debug(
-            f"🔍 GitHub status response received with {len(status_data)} fields"
+            "🔍 GitHub status response received with %s fields", len(status_data)
         )
 
         state = status_data.get("state", "unknown")
         total_count = status_data.get("total_count", 0)
         logger.info(
-            f"🔍 Extracted state from GitHub: '{state}', total_count: {total_count}"
+            "🔍 Extracted state from GitHub: '%s', total_count: %s", state, total_count
         )
 
         # If status API returns pending with no checks, try GitHub Actions API as fallback
         if state == "pending" and total_count == 0:
             logger.info(
-                f"🔍 Status API shows pending with no checks, trying GitHub Actions API..."
+                "🔍 Status API shows pending with no checks, trying GitHub Actions API..."
             )
             try:
-                actions_response = requests.get(
+                actions_response = github_session.get(
                     f"https://api.github.com/repos/{owner}/{repo}/actions/runs?head_sha={latest_commit_sha}",
                     headers=headers,
                     timeout=10,
@@ -491,7 +532,7 @@ def get_github_status(repo_url, github_token):
                 if actions_response.status_code == 200:
                     actions_data = actions_response.json()
                     workflow_runs = actions_data.get("workflow_runs", [])
-                    logger.debug(f"🔍 Found {len(workflow_runs)} workflow runs")
+                    logger.debug("🔍 Found %s workflow runs", len(workflow_runs))
 
                     if workflow_runs:
                         # Check if all workflows are completed and successful
@@ -502,7 +543,10 @@ def get_github_status(repo_url, github_token):
                             run_status = run.get("status")
                             run_conclusion = run.get("conclusion")
                             logger.info(
-                                f"🔍 Workflow '{run.get('name')}': status={run_status}, conclusion={run_conclusion}"
+                                "🔍 Workflow '%s': status=%s, conclusion=%s",
+                                run.get("name"),
+                                run_status,
+                                run_conclusion,
                             )
 
                             if run_status != "completed":
@@ -514,24 +558,28 @@ def get_github_status(repo_url, github_token):
                             if all_successful:
                                 state = "success"
                                 logger.info(
-                                    f"🔍 All workflows completed successfully, overriding state to: {state}"
+                                    "🔍 All workflows completed successfully, overriding state to: %s",
+                                    state,
                                 )
                             else:
                                 state = "failure"
                                 logger.info(
-                                    f"🔍 Some workflows failed, overriding state to: {state}"
+                                    "🔍 Some workflows failed, overriding state to: %s",
+                                    state,
                                 )
                         else:
                             # Keep as pending since some workflows are still running
                             logger.info(
-                                f"🔍 Some workflows still running, keeping state as: {state}"
+                                "🔍 Some workflows still running, keeping state as: %s",
+                                state,
                             )
                 else:
                     logger.warning(
-                        f"❌ Failed to get GitHub Actions: {actions_response.status_code}"
+                        "❌ Failed to get GitHub Actions: %s",
+                        actions_response.status_code,
                     )
             except Exception as e:
-                logger.warning(f"❌ Error checking GitHub Actions: {str(e)}")
+                logger.warning("❌ Error checking GitHub Actions: %s", e)
 
         # Handle different CI/CD states properly
         if state == "success":
@@ -541,7 +589,7 @@ def get_github_status(repo_url, github_token):
         else:  # failure, error, or unknown
             tests_passing = False
 
-        logger.info(f"✅ GitHub status retrieved: {state}")
+        logger.info("✅ GitHub status retrieved: %s", state)
 
         result = {
             "tests_passing": tests_passing,
@@ -550,18 +598,19 @@ def get_github_status(repo_url, github_token):
             "total_count": status_data.get("total_count", 0),
         }
 
-        logger.debug(f"🔍 Returning GitHub status: {result.get('status', 'unknown')}")
+        logger.debug("🔍 Returning GitHub status: %s", result.get("status", "unknown"))
 
         return result
 
     except Exception as e:
-        logger.error(f"💥 GitHub status check error: {str(e)}")
+        logger.error("💥 GitHub status check error: %s", e)
         return None
 
 
+@ttl_cache(STATUS_CACHE_TTL)
 def get_fly_status(project_slug, fly_token):
     """Get Fly.io deployment status"""
-    logger.info(f"🚁 Checking Fly.io status for: {project_slug}")
+    logger.info("🚁 Checking Fly.io status for: %s", project_slug)
 
     try:
         if not fly_token:
@@ -574,18 +623,18 @@ def get_fly_status(project_slug, fly_token):
         }
 
         # Check if app exists and get status
-        app_response = requests.get(
+        app_response = fly_session.get(
             f"https://api.machines.dev/v1/apps/{project_slug}",
             headers=headers,
             timeout=10,
         )
 
         if app_response.status_code == 404:
-            logger.info(f"⚠️ Fly.io app not found: {project_slug}")
+            logger.info("⚠️ Fly.io app not found: %s", project_slug)
             return {"deployed": False, "app_url": None, "status": "not_found"}
         elif app_response.status_code != 200:
             logger.warning(
-                f"❌ Failed to get Fly.io app status: {app_response.status_code}"
+                "❌ Failed to get Fly.io app status: %s", app_response.status_code
             )
             return None
 
@@ -595,7 +644,7 @@ def get_fly_status(project_slug, fly_token):
         # Construct app URL
         app_url = f"https://{project_slug}.fly.dev"
 
-        logger.info(f"✅ Fly.io status retrieved: {app_status}")
+        logger.info("✅ Fly.io status retrieved: %s", app_status)
 
         return {
             "deployed": app_status in ["running", "deployed"],
@@ -605,10 +654,11 @@ def get_fly_status(project_slug, fly_token):
         }
 
     except Exception as e:
-        logger.error(f"💥 Fly.io status check error: {str(e)}")
+        logger.error("💥 Fly.io status check error: %s", e)
         return None
 
 
+@ttl_cache(STATUS_CACHE_TTL)
 def get_pr_status(repo_url, github_token, branch="main", search_by_base=False):
     """
     Get GitHub Pull Request status for a specific branch.
@@ -626,10 +676,15 @@ def get_pr_status(repo_url, github_token, branch="main", search_by_base=False):
 
     search_type = "base" if search_by_base else "head"
     logger.info(
-        f"🔀 Checking PR status for: {repo_url} (branch: {branch}, search_by: {search_type})"
+        "🔀 Checking PR status for: %s (branch: %s, search_by: %s)",
+        repo_url,
+        branch,
+        search_type,
     )
     logger.info(
-        f"🔑 GitHub token provided: {bool(github_token)} (length: {len(github_token) if github_token else 0})"
+        "🔑 GitHub token provided: %s (length: %s)",
+        bool(github_token),
+        len(github_token) if github_token else 0,
     )
 
     if not github_token:
@@ -637,15 +692,14 @@ def get_pr_status(repo_url, github_token, branch="main", search_by_base=False):
         return None
 
     # Parse GitHub URL to extract owner and repo
-    github_pattern = r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$"
-    match = re.match(github_pattern, repo_url)
-    if not match:
-        logger.warning(f"❌ Invalid GitHub URL format: {repo_url}")
+    parsed = parse_github_url(repo_url)
+    if not parsed:
+        logger.warning("❌ Invalid GitHub URL format: %s", repo_url)
         return None
 
-    owner, repo = match.groups()
-    logger.debug(f"🔍 Parsed GitHub repo: {owner}/{repo}")
-    logger.info(f"🌿 Looking for PRs with branch: '{branch}'")
+    owner, repo = parsed
+    logger.debug("🔍 Parsed GitHub repo: %s/%s", owner, repo)
+    logger.info("🌿 Looking for PRs with branch: '%s'", branch)
 
     # Set up headers for GitHub API
     headers = {
@@ -659,47 +713,53 @@ def get_pr_status(repo_url, github_token, branch="main", search_by_base=False):
         if search_by_base:
             # Search for PRs targeting this branch as base
             api_url = f"https://api.github.com/repos/{owner}/{repo}/pulls?base={branch}&state=open"
-            logger.debug(f"🔍 Searching for PRs targeting base branch '{branch}'")
+            logger.debug("🔍 Searching for PRs targeting base branch '%s'", branch)
         else:
             # Search for PRs from this branch as head
             api_url = f"https://api.github.com/repos/{owner}/{repo}/pulls?head={owner}:{branch}&state=open"
-            logger.debug(f"🔍 Searching for PRs from head branch '{owner}:{branch}'")
+            logger.debug("🔍 Searching for PRs from head branch '%s:%s'", owner, branch)
 
-        logger.debug(f"🔍 API URL: {api_url}")
+        logger.debug("🔍 API URL: %s", api_url)
 
-        pr_response = requests.get(api_url, headers=headers, timeout=10)
-        logger.debug(f"🔍 Response status: {pr_response.status_code}")
+        pr_response = github_session.get(api_url, headers=headers, timeout=10)
+        logger.debug("🔍 Response status: %s", pr_response.status_code)
 
         if pr_response.status_code != 200:
             logger.warning(
-                f"❌ GitHub API request failed: {pr_response.status_code} - {pr_response.text[:200]}"
+                "❌ GitHub API request failed: %s - %s",
+                pr_response.status_code,
+                pr_response.text[:200],
             )
             return None
 
         prs = pr_response.json()
-        logger.debug(f"🔍 Found {len(prs)} PRs")
+        logger.debug("🔍 Found %s PRs", len(prs))
 
         if not prs:
-            logger.debug(f"ℹ️ No open PRs found for {search_type} branch '{branch}'")
+            logger.debug("ℹ️ No open PRs found for %s branch '%s'", search_type, branch)
             return None
 
         # Log details of found PRs
         for pr in prs:
             # Handle case where mock returns strings instead of dicts
             if isinstance(pr, str):
-                logger.warning(f"🔍 PR data is string instead of dict: {pr}")
+                logger.warning("🔍 PR data is string instead of dict: %s", pr)
                 continue
 
             head_info = pr.get("head", {})
             base_info = pr.get("base", {})
             logger.info(
-                f"🔍 PR #{pr.get('number', 'unknown')}: {pr.get('title', 'unknown')}"
+                "🔍 PR #%s: %s", pr.get("number", "unknown"), pr.get("title", "unknown")
             )
             logger.info(
-                f"🔍   Head: {head_info.get('label', 'unknown')} (ref: {head_info.get('ref', 'unknown')})"
+                "🔍   Head: %s (ref: %s)",
+                head_info.get("label", "unknown"),
+                head_info.get("ref", "unknown"),
             )
             logger.info(
-                f"🔍   Base: {base_info.get('label', 'unknown')} (ref: {base_info.get('ref', 'unknown')})"
+                "🔍   Base: %s (ref: %s)",
+                base_info.get("label", "unknown"),
+                base_info.get("ref", "unknown"),
             )
 
         # Get the first (most recent) PR that's a valid dict
@@ -715,12 +775,12 @@ def get_pr_status(repo_url, github_token, branch="main", search_by_base=False):
 
         pr_number = pr["number"]
 
-        logger.debug(f"🔍 Selected PR #{pr_number}: {pr['title']}")
-        logger.debug(f"🔍 PR head: {pr.get('head', {}).get('label', 'unknown')}")
-        logger.debug(f"🔍 PR base: {pr.get('base', {}).get('label', 'unknown')}")
+        logger.debug("🔍 Selected PR #%s: %s", pr_number, pr["title"])
+        logger.debug("🔍 PR head: %s", pr.get("head", {}).get("label", "unknown"))
+        logger.debug("🔍 PR base: %s", pr.get("base", {}).get("label", "unknown"))
 
         # Get PR details including mergeable status
-        pr_detail_response = requests.get(
+        pr_detail_response = github_session.get(
             f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
             headers=headers,
             timeout=10,
@@ -728,31 +788,34 @@ def get_pr_status(repo_url, github_token, branch="main", search_by_base=False):
 
         if pr_detail_response.status_code != 200:
             logger.warning(
-                f"❌ Failed to get PR details: {pr_detail_response.status_code}"
+                "❌ Failed to get PR details: %s", pr_detail_response.status_code
             )
             return None
 
         pr_details = pr_detail_response.json()
 
-        # Get commit status for the PR head
+        # Commit status, commit details and check runs for the PR head only
+        # depend on its SHA, so fetch them concurrently rather than in turn
         head_sha = pr_details["head"]["sha"]
-        status_response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/commits/{head_sha}/status",
-            headers=headers,
-            timeout=10,
+        commit_url = f"https://api.github.com/repos/{owner}/{repo}/commits/{head_sha}"
+        status_future = _github_fetch_executor.submit(
+            github_session.get, f"{commit_url}/status", headers=headers, timeout=10
+        )
+        commit_future = _github_fetch_executor.submit(
+            github_session.get, commit_url, headers=headers, timeout=10
+        )
+        checks_future = _github_fetch_executor.submit(
+            github_session.get, f"{commit_url}/check-runs", headers=headers, timeout=10
         )
 
+        status_response = status_future.result()
         ci_status = "unknown"
         if status_response.status_code == 200:
             status_data = status_response.json()
             ci_status = status_data.get("state", "unknown")
 
         # Get commit details for the PR head
-        commit_response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/commits/{head_sha}",
-            headers=headers,
-            timeout=10,
-        )
+        commit_response = commit_future.result()
 
         commit_hash_short = head_sha[:7] if head_sha else ""
         commit_message = ""
@@ -763,11 +826,7 @@ def get_pr_status(repo_url, github_token, branch="main", search_by_base=False):
             commit_message = commit_message.split("\n")[0] if commit_message else ""
 
         # Get check runs for more detailed CI information
-        checks_response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/commits/{head_sha}/check-runs",
-            headers=headers,
-            timeout=10,
-        )
+        checks_response = checks_future.result()
 
         checks = []
         if checks_response.status_code == 200:
@@ -807,34 +866,30 @@ def get_pr_status(repo_url, github_token, branch="main", search_by_base=False):
             "commit_message": commit_message,
         }
 
-        logger.info(f"✅ PR status retrieved for #{pr_number}")
+        logger.info("✅ PR status retrieved for #%s", pr_number)
         return pr_status
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Network error while fetching PR status: {str(e)}")
+        logger.error("❌ Network error while fetching PR status: %s", e)
         return None
     except Exception as e:
-        logger.error(f"❌ Unexpected error while fetching PR status: {str(e)}")
+        logger.error("❌ Unexpected error while fetching PR status: %s", e)
         return None
 
 
 def close_github_pr(repo_url, github_token, branch_name):
     """Close GitHub Pull Request for a specific branch"""
-    logger.info(f"🔀 Closing PR for branch: {branch_name} in {repo_url}")
+    logger.info("🔀 Closing PR for branch: %s in %s", branch_name, repo_url)
 
     try:
         # Extract owner and repo from URL
-        if not repo_url or "github.com" not in repo_url:
-            logger.warning(f"❌ Invalid GitHub URL: {repo_url}")
+        parsed = parse_github_url(repo_url)
+        if not parsed:
+            logger.warning("❌ Invalid GitHub URL: %s", repo_url)
             return False, "Invalid GitHub URL"
 
-        parts = repo_url.replace("https://github.com/", "").split("/")
-        if len(parts) < 2:
-            logger.warning(f"❌ Cannot parse GitHub URL: {repo_url}")
-            return False, "Cannot parse GitHub URL"
-
-        owner, repo = parts[0], parts[1]
-        logger.debug(f"🔍 GitHub repo: {owner}/{repo}, branch: {branch_name}")
+        owner, repo = parsed
+        logger.debug("🔍 GitHub repo: %s/%s, branch: %s", owner, repo, branch_name)
 
         headers = {
             "Authorization": f"token {github_token}",
@@ -843,30 +898,30 @@ def close_github_pr(repo_url, github_token, branch_name):
         }
 
         # Find open PRs for this branch
-        pr_response = requests.get(
+        pr_response = github_session.get(
             f"https://api.github.com/repos/{owner}/{repo}/pulls?head={owner}:{branch_name}&state=open",
             headers=headers,
             timeout=10,
         )
 
         if pr_response.status_code != 200:
-            logger.warning(f"❌ Failed to get PRs: {pr_response.status_code}")
+            logger.warning("❌ Failed to get PRs: %s", pr_response.status_code)
             return False, f"Failed to get PRs: {pr_response.status_code}"
 
         prs = pr_response.json()
 
         if not prs:
-            logger.debug(f"ℹ️ No open PRs found for branch: {branch_name}")
+            logger.debug("ℹ️ No open PRs found for branch: %s", branch_name)
             return True, "No open PRs found for this branch"
 
         # Close each PR found (usually there should be only one)
         closed_prs = []
         for pr in prs:
             pr_number = pr["number"]
-            logger.info(f"🔀 Closing PR #{pr_number} for branch: {branch_name}")
+            logger.info("🔀 Closing PR #%s for branch: %s", pr_number, branch_name)
 
             close_data = {"state": "closed"}
-            close_response = requests.patch(
+            close_response = github_session.patch(
                 f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}",
                 headers=headers,
                 json=close_data,
@@ -874,11 +929,13 @@ def close_github_pr(repo_url, github_token, branch_name):
             )
 
             if close_response.status_code == 200:
-                logger.info(f"✅ Successfully closed PR #{pr_number}")
+                logger.info("✅ Successfully closed PR #%s", pr_number)
                 closed_prs.append(pr_number)
             else:
                 logger.error(
-                    f"❌ Failed to close PR #{pr_number}: {close_response.status_code}"
+                    "❌ Failed to close PR #%s: %s",
+                    pr_number,
+                    close_response.status_code,
                 )
                 return False, f"Failed to close PR #{pr_number}"
 
@@ -888,31 +945,27 @@ def close_github_pr(repo_url, github_token, branch_name):
             return True, "No PRs needed to be closed"
 
     except Exception as e:
-        logger.error(f"💥 Error closing GitHub PR: {str(e)}")
+        logger.error("💥 Error closing GitHub PR: %s", e)
         return False, f"Error closing PR: {str(e)}"
 
 
 def delete_github_branch(repo_url, github_token, branch_name):
     """Delete a GitHub branch"""
-    logger.info(f"🌿 Deleting branch: {branch_name} from {repo_url}")
+    logger.info("🌿 Deleting branch: %s from %s", branch_name, repo_url)
 
     try:
         # Extract owner and repo from URL
-        if not repo_url or "github.com" not in repo_url:
-            logger.warning(f"❌ Invalid GitHub URL: {repo_url}")
+        parsed = parse_github_url(repo_url)
+        if not parsed:
+            logger.warning("❌ Invalid GitHub URL: %s", repo_url)
             return False, "Invalid GitHub URL"
 
-        parts = repo_url.replace("https://github.com/", "").split("/")
-        if len(parts) < 2:
-            logger.warning(f"❌ Cannot parse GitHub URL: {repo_url}")
-            return False, "Cannot parse GitHub URL"
-
-        owner, repo = parts[0], parts[1]
-        logger.debug(f"🔍 GitHub repo: {owner}/{repo}, branch: {branch_name}")
+        owner, repo = parsed
+        logger.debug("🔍 GitHub repo: %s/%s, branch: %s", owner, repo, branch_name)
 
         # Don't delete main/master branches
         if branch_name.lower() in ["main", "master"]:
-            logger.warning(f"⚠️ Cannot delete protected branch: {branch_name}")
+            logger.warning("⚠️ Cannot delete protected branch: %s", branch_name)
             return False, f"Cannot delete protected branch: {branch_name}"
 
         headers = {
@@ -922,52 +975,53 @@ def delete_github_branch(repo_url, github_token, branch_name):
         }
 
         # Delete the branch
-        delete_response = requests.delete(
+        delete_response = github_session.delete(
             f"https://api.github.com/repos/{owner}/{repo}/git/refs/heads/{branch_name}",
             headers=headers,
             timeout=10,
         )
 
         if delete_response.status_code == 204:
-            logger.info(f"✅ Successfully deleted branch: {branch_name}")
+            logger.info("✅ Successfully deleted branch: %s", branch_name)
             return True, f"Branch '{branch_name}' deleted successfully"
         elif delete_response.status_code == 404:
-            logger.warning(f"⚠️ Branch not found: {branch_name}")
+            logger.warning("⚠️ Branch not found: %s", branch_name)
             return (
                 True,
                 f"Branch '{branch_name}' not found (may have been already deleted)",
             )
         elif delete_response.status_code == 422:
-            logger.warning(f"⚠️ Cannot delete branch: {branch_name} (may be protected)")
+            logger.warning(
+                "⚠️ Cannot delete branch: %s (may be protected)", branch_name
+            )
             return False, f"Cannot delete branch '{branch_name}' (may be protected)"
         else:
             logger.error(
-                f"❌ Failed to delete branch: {delete_response.status_code} - {delete_response.text}"
+                "❌ Failed to delete branch: %s - %s",
+                delete_response.status_code,
+                delete_response.text,
             )
             return False, f"GitHub API error: {delete_response.status_code}"
 
     except Exception as e:
-        logger.error(f"💥 Error deleting GitHub branch: {str(e)}")
+        logger.error("💥 Error deleting GitHub branch: %s", e)
         return False, f"Error deleting branch: {str(e)}"
 
 
 def delete_github_repo(repo_url, github_token):
     """Delete a GitHub repository"""
-    logger.info(f"🗑️ Deleting GitHub repo: {repo_url}")
+    logger.info("🗑️ Deleting GitHub repo: %s", repo_url)
+    get_github_status.invalidate(repo_url, github_token)
 
     try:
         # Extract owner and repo from URL
-        if not repo_url or "github.com" not in repo_url:
-            logger.warning(f"❌ Invalid GitHub URL: {repo_url}")
+        parsed = parse_github_url(repo_url)
+        if not parsed:
+            logger.warning("❌ Invalid GitHub URL: %s", repo_url)
             return False, "Invalid GitHub URL"
 
-        parts = repo_url.replace("https://github.com/", "").split("/")
-        if len(parts) < 2:
-            logger.warning(f"❌ Cannot parse GitHub URL: {repo_url}")
-            return False, "Cannot parse GitHub URL"
-
-        owner, repo = parts[0], parts[1]
-        logger.debug(f"🔍 GitHub repo to delete: {owner}/{repo}")
+        owner, repo = parsed
+        logger.debug("🔍 GitHub repo to delete: %s/%s", owner, repo)
 
         headers = {
             "Authorization": f"token {github_token}",
@@ -976,33 +1030,38 @@ def delete_github_repo(repo_url, github_token):
         }
 
         # Delete the repository
-        delete_response = requests.delete(
+        delete_response = github_session.delete(
             f"https://api.github.com/repos/{owner}/{repo}", headers=headers, timeout=30
         )
 
         if delete_response.status_code == 204:
-            logger.info(f"✅ Successfully deleted GitHub repo: {owner}/{repo}")
+            logger.info("✅ Successfully deleted GitHub repo: %s/%s", owner, repo)
             return True, "Repository deleted successfully"
         elif delete_response.status_code == 404:
-            logger.warning(f"⚠️ GitHub repo not found: {owner}/{repo}")
+            logger.warning("⚠️ GitHub repo not found: %s/%s", owner, repo)
             return True, "Repository not found (may have been already deleted)"
         elif delete_response.status_code == 403:
-            logger.error(f"❌ Insufficient permissions to delete repo: {owner}/{repo}")
+            logger.error(
+                "❌ Insufficient permissions to delete repo: %s/%s", owner, repo
+            )
             return False, "Insufficient permissions to delete repository"
         else:
             logger.error(
-                f"❌ Failed to delete GitHub repo: {delete_response.status_code} - {delete_response.text}"
+                "❌ Failed to delete GitHub repo: %s - %s",
+                delete_response.status_code,
+                delete_response.text,
             )
             return False, f"GitHub API error: {delete_response.status_code}"
 
     except Exception as e:
-        logger.error(f"💥 Error deleting GitHub repo: {str(e)}")
+        logger.error("💥 Error deleting GitHub repo: %s", e)
         return False, f"Error deleting repository: {str(e)}"
 
 
 def delete_fly_app(app_name, fly_token):
     """Delete a Fly.io app"""
-    logger.info(f"🗑️ Deleting Fly.io app: {app_name}")
+    logger.info("🗑️ Deleting Fly.io app: %s", app_name)
+    get_fly_status.invalidate(app_name, fly_token)
 
     try:
         if not fly_token:
@@ -1015,51 +1074,104 @@ def delete_fly_app(app_name, fly_token):
         }
 
         # First check if app exists
-        check_response = requests.get(
+        check_response = fly_session.get(
             f"https://api.machines.dev/v1/apps/{app_name}", headers=headers, timeout=10
         )
 
         if check_response.status_code == 404:
-            logger.warning(f"⚠️ Fly.io app not found: {app_name}")
+            logger.warning("⚠️ Fly.io app not found: %s", app_name)
             return True, "App not found (may have been already deleted)"
         elif check_response.status_code != 200:
-            logger.error(f"❌ Error checking Fly.io app: {check_response.status_code}")
+            logger.error("❌ Error checking Fly.io app: %s", check_response.status_code)
             return False, f"Error checking app status: {check_response.status_code}"
 
         # Delete the app
-        delete_response = requests.delete(
+        delete_response = fly_session.delete(
             f"https://api.machines.dev/v1/apps/{app_name}", headers=headers, timeout=30
         )
 
         if delete_response.status_code in [200, 202, 204]:
-            logger.info(f"✅ Successfully deleted Fly.io app: {app_name}")
+            logger.info("✅ Successfully deleted Fly.io app: %s", app_name)
             return True, "App deleted successfully"
         elif delete_response.status_code == 404:
-            logger.warning(f"⚠️ Fly.io app not found during deletion: {app_name}")
+            logger.warning("⚠️ Fly.io app not found during deletion: %s", app_name)
             return True, "App not found (may have been already deleted)"
         elif delete_response.status_code == 403:
             logger.error(
-                f"❌ Insufficient permissions to delete Fly.io app: {app_name}"
+                "❌ Insufficient permissions to delete Fly.io app: %s", app_name
             )
             return False, "Insufficient permissions to delete app"
         else:
             logger.error(
-                f"❌ Failed to delete Fly.io app: {delete_response.status_code} - {delete_response.text}"
+                "❌ Failed to delete Fly.io app: %s - %s",
+                delete_response.status_code,
+                delete_response.text,
             )
             return False, f"Fly.io API error: {delete_response.status_code}"
 
     except Exception as e:
-        logger.error(f"💥 Error deleting Fly.io app: {str(e)}")
+        logger.error("💥 Error deleting Fly.io app: %s", e)
         return False, f"Error deleting app: {str(e)}"
 
 
+def set_fly_api_token_secret(owner, repo_name, fly_token, headers):
+    """
+    Store the user's Fly.io token as the FLY_API_TOKEN Actions secret of a repo.
+
+    Args:
+        owner (str): GitHub repository owner
+        repo_name (str): GitHub repository name
+        fly_token (str): The user's Fly.io API token
+        headers (dict): Authenticated GitHub API request headers
+
+    Returns:
+        bool: True if the secret was set
+    """
+    if not fly_token:
+        return False
+
+    secrets_url = f"https://api.github.com/repos/{owner}/{repo_name}/actions/secrets"
+
+    # Get the repository's public key for encrypting secrets
+    key_response = github_session.get(
+        f"{secrets_url}/public-key", headers=headers, timeout=10
+    )
+    if key_response.status_code != 200:
+        logger.warning("⚠️ Failed to get public key for secrets: %s", key_response.text)
+        return False
+
+    public_key_data = key_response.json()
+    public_key = public.PublicKey(
+        public_key_data["key"].encode("utf-8"), encoding.Base64Encoder()
+    )
+
+    # Encrypt the secret; the sealed box is built once per call since the
+    # public key is per-repo and may rotate, so it isn't cached across calls
+    sealed_box = public.SealedBox(public_key)
+    encrypted = sealed_box.encrypt(fly_token.encode("utf-8"))
+    encrypted_value = b64encode(encrypted).decode("utf-8")
+
+    # Set the secret
+    secret_data = {
+        "encrypted_value": encrypted_value,
+        "key_id": public_key_data["key_id"],
+    }
+    secret_response = github_session.put(
+        f"{secrets_url}/FLY_API_TOKEN", headers=headers, json=secret_data, timeout=10
+    )
+
+    if secret_response.status_code in [201, 204]:
+        logger.info("✅ FLY_API_TOKEN secret set successfully")
+        return True
+
+    logger.warning("⚠️ Failed to set FLY_API_TOKEN secret: %s", secret_response.text)
+    return False
+
+
 def create_github_repo(repo_name, github_token, fly_token):
     """Create a GitHub repository from template and set FLY_API_TOKEN secret"""
-    logger.info(f"🐙 Creating GitHub repo: {repo_name}")
-    logger.debug(f"🐙 GitHub token length: {len(github_token)}")
-    logger.debug(f"🐙 GitHub token prefix: {github_token[:10]}...")
-    logger.debug(f"🐙 Fly token provided: {bool(fly_token)}")
-    logger.debug(f"🐙 Fly token length: {len(fly_token) if fly_token else 0}")
+    logger.info("🐙 Creating GitHub repo: %s", repo_name)
+    logger.debug("🐙 Fly token provided: %s", bool(fly_token))
 
     try:
         # First, check if repo already exists
@@ -1068,29 +1180,24 @@ def create_github_repo(repo_name, github_token, fly_token):
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "OpenVibe-Backend/1.0",
         }
-        logger.debug(f"🐙 Request headers: {headers}")
 
         # Get the authenticated user to determine the owner
-        logger.debug(f"🐙 Making request to GitHub user API...")
-        user_response = requests.get(
+        logger.debug("🐙 Making request to GitHub user API...")
+        user_response = github_session.get(
             "https://api.github.com/user", headers=headers, timeout=10
         )
-        logger.debug(f"🐙 GitHub user API response: {user_response.status_code}")
+        logger.debug("🐙 GitHub user API response: %s", user_response.status_code)
 
         if user_response.status_code != 200:
-            logger.error(f"❌ Failed to get GitHub user: {user_response.text}")
-            logger.debug(f"🐙 Response content: {user_response.content}")
+            logger.error("❌ Failed to get GitHub user: %s", user_response.status_code)
             return False, "Failed to authenticate with GitHub"
 
         user_data = user_response.json()
         owner = user_data["login"]
-        logger.debug(f"🔍 GitHub owner: {owner}")
-        logger.debug(
-            f"🔍 GitHub user authenticated: {user_data.get('login', 'unknown')}"
-        )
+        logger.debug("🔍 GitHub user authenticated: %s", owner)
 
         # Check if repo already exists
-        check_response = requests.get(
+        check_response = github_session.get(
             f"https://api.github.com/repos/{owner}/{repo_name}",
             headers=headers,
             timeout=10,
@@ -1099,59 +1206,20 @@ def create_github_repo(repo_name, github_token, fly_token):
             # Repository already exists, but that's okay - we'll use the existing one
             repo_data = check_response.json()
             logger.info(
-                f"✅ Repository {owner}/{repo_name} already exists, using existing repository"
+                "✅ Repository %s/%s already exists, using existing repository",
+                owner,
+                repo_name,
             )
 
-            # Still try to set the FLY_API_TOKEN secret if provided
-            if fly_token:
-                logger.info(
-                    f"🔐 Setting FLY_API_TOKEN secret for existing repo {repo_name}"
-                )
-
-                # Get the repository's public key for encrypting secrets
-                key_response = requests.get(
-                    f"https://api.github.com/repos/{owner}/{repo_name}/actions/secrets/public-key",
-                    headers=headers,
-                    timeout=10,
-                )
-
-                if key_response.status_code == 200:
-                    public_key_data = key_response.json()
-                    public_key = public.PublicKey(
-                        public_key_data["key"].encode("utf-8"), encoding.Base64Encoder()
-                    )
-
-                    # Encrypt the secret
-                    sealed_box = public.SealedBox(public_key)
-                    encrypted = sealed_box.encrypt(fly_token.encode("utf-8"))
-                    encrypted_value = b64encode(encrypted).decode("utf-8")
-
-                    # Set the secret
-                    secret_data = {
-                        "encrypted_value": encrypted_value,
-                        "key_id": public_key_data["key_id"],
-                    }
-
-                    secret_response = requests.put(
-                        f"https://api.github.com/repos/{owner}/{repo_name}/actions/secrets/FLY_API_TOKEN",
-                        headers=headers,
-                        json=secret_data,
-                        timeout=10,
-                    )
-
-                    if secret_response.status_code in [201, 204]:
-                        logger.info(
-                            "✅ FLY_API_TOKEN secret set successfully for existing repo"
-                        )
-                    else:
-                        logger.warning(
-                            f"⚠️ Failed to set FLY_API_TOKEN secret for existing repo: {secret_response.text}"
-                        )
-                else:
-                    logger.warning(
-                        f"⚠️ Failed to get public key for secrets on existing repo: {key_response.text}"
-                    )
+            # Nothing more to do without a Fly.io token to store
+            if not fly_token:
+                return True, repo_data["html_url"]
 
+            # Still try to set the FLY_API_TOKEN secret
+            logger.info(
+                "🔐 Setting FLY_API_TOKEN secret for existing repo %s", repo_name
+            )
+            set_fly_api_token_secret(owner, repo_name, fly_token, headers)
             return True, repo_data["html_url"]
 
         # Create repo from template
@@ -1165,7 +1233,7 @@ def create_github_repo(repo_name, github_token, fly_token):
         template_headers = headers.copy()
         template_headers["Accept"] = "application/vnd.github.baptiste-preview+json"
 
-        create_response = requests.post(
+        create_response = github_session.post(
             "https://api.github.com/repos/rbren/openvibe-template/generate",
             headers=template_headers,
             json=create_data,
@@ -1173,117 +1241,62 @@ def create_github_repo(repo_name, github_token, fly_token):
         )
 
         if create_response.status_code != 201:
-            logger.error(f"Failed to create repo from template: {create_response.text}")
+            logger.error(
+                "Failed to create repo from template: %s", create_response.text
+            )
             return False, f"Failed to create repository: {create_response.text}"
 
         repo_data = create_response.json()
-        logger.info(f"✅ Created repository: {repo_data['html_url']}")
-
-        # Set FLY_API_TOKEN secret
-        if fly_token:
-            logger.info(f"🔐 Setting FLY_API_TOKEN secret for {repo_name}")
-
-            # Get the repository's public key for encrypting secrets
-            key_response = requests.get(
-                f"https://api.github.com/repos/{owner}/{repo_name}/actions/secrets/public-key",
-                headers=headers,
-                timeout=10,
-            )
-
-            if key_response.status_code == 200:
-                public_key_data = key_response.json()
-                public_key = public.PublicKey(
-                    public_key_data["key"].encode("utf-8"), encoding.Base64Encoder()
-                )
-
-                # Encrypt the secret
-                sealed_box = public.SealedBox(public_key)
-                encrypted = sealed_box.encrypt(fly_token.encode("utf-8"))
-                encrypted_value = b64encode(encrypted).decode("utf-8")
+        logger.info("✅ Created repository: %s", repo_data["html_url"])
 
-                # Set the secret
-                secret_data = {
-                    "encrypted_value": encrypted_value,
-                    "key_id": public_key_data["key_id"],
-                }
-
-                secret_response = requests.put(
-                    f"https://api.github.com/repos/{owner}/{repo_name}/actions/secrets/FLY_API_TOKEN",
-                    headers=headers,
-                    json=secret_data,
-                    timeout=10,
-                )
-
-                if secret_response.status_code in [201, 204]:
-                    logger.info("✅ FLY_API_TOKEN secret set successfully")
-                else:
-                    logger.warning(
-                        f"⚠️ Failed to set FLY_API_TOKEN secret: {secret_response.text}"
-                    )
-            else:
-                logger.warning(
-                    f"⚠️ Failed to get public key for secrets: {key_response.text}"
-                )
+        if not fly_token:
+            return True, repo_data["html_url"]
 
+        # Set FLY_API_TOKEN secret
+        logger.info("🔐 Setting FLY_API_TOKEN secret for %s", repo_name)
+        set_fly_api_token_secret(owner, repo_name, fly_token, headers)
         return True, repo_data["html_url"]
 
     except Exception as e:
-        logger.error(f"💥 GitHub repo creation error: {str(e)}")
+        logger.error("💥 GitHub repo creation error: %s", e)
         return False, f"Error creating repository: {str(e)}"
 
 
 @apps_bp.route("/api/apps", methods=["GET"])
+@require_user_uuid
 def get_apps():
     """Get all apps for a user, ordered alphabetically"""
     logger.info("📋 GET /api/apps - Fetching user apps")
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
+        # Storage returns apps already ordered alphabetically by name
         apps = load_user_apps(user_uuid)
-        # Sort apps alphabetically by name
-        apps.sort(key=lambda x: x.get("name", "").lower())
 
-        logger.debug(f"📊 Returning {len(apps)} apps for user {user_uuid[:8]}")
-        return jsonify({"apps": apps, "count": len(apps)})
+        logger.debug("📊 Returning %s apps for user %s", len(apps), user_uuid[:8])
+        return conditional_jsonify({"apps": apps, "count": len(apps)})
     except Exception as e:
-        logger.error(f"💥 Error fetching apps: {str(e)}")
+        logger.error("💥 Error fetching apps: %s", e)
         return jsonify({"error": "Failed to fetch apps"}), 500
 
 
 @apps_bp.route("/api/apps/<slug>", methods=["GET"])
+@require_user_uuid
 def get_app(slug):
     """Get a specific app by slug with status information"""
-    logger.info(f"📋 GET /api/apps/{slug} - Fetching app details")
+    logger.info("📋 GET /api/apps/%s - Fetching app details", slug)
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Load app for this user
         app = load_user_app(user_uuid, slug)
         if not app:
-            logger.warning(f"❌ App not found: {slug} for user {user_uuid[:8]}")
+            logger.warning("❌ App not found: %s for user %s", slug, user_uuid[:8])
             return jsonify({"error": "App not found"}), 404
 
-        logger.debug(f"📊 Found app: {app['slug']} for user {user_uuid[:8]}")
+        logger.debug("📊 Found app: %s for user %s", app["slug"], user_uuid[:8])
 
         # Get user's API keys for status information
         github_status = None
@@ -1295,64 +1308,69 @@ def get_app(slug):
             github_token = user_keys.get("github")
             fly_token = user_keys.get("fly")
 
-            # Get GitHub status if token is available
+            # The GitHub, PR and Fly.io lookups are independent network calls,
+            # so run them concurrently: latency is the slowest call, not the sum
+            github_future = pr_future = fly_future = None
             if github_token and app.get("github_url"):
-                logger.debug(f"🔍 GitHub token length: {len(github_token)} characters")
-                logger.debug(f"🔍 GitHub token starts with: {github_token[:10]}...")
-                github_status = get_github_status(app["github_url"], github_token)
+                github_future = _status_executor.submit(
+                    get_github_status, app["github_url"], github_token
+                )
 
                 # Get PR status for the current branch
                 branch = app.get("branch", "main")
                 logger.info(
-                    f"🔍 APPS ENDPOINT: Getting PR status for app branch: {branch}"
+                    "🔍 APPS ENDPOINT: Getting PR status for app branch: %s", branch
+                )
+                pr_future = _status_executor.submit(
+                    get_pr_status, app["github_url"], github_token, branch
                 )
-                pr_status = get_pr_status(app["github_url"], github_token, branch)
 
             # Get Fly.io status if token is available
             if fly_token and app.get("slug"):
-                fly_status = get_fly_status(app["slug"], fly_token)
+                fly_future = _status_executor.submit(
+                    get_fly_status, app["slug"], fly_token
+                )
+
+            if github_future:
+                github_status = github_future.result()
+            if pr_future:
+                pr_status = pr_future.result()
+            if fly_future:
+                fly_status = fly_future.result()
 
         except Exception as e:
-            logger.warning(f"⚠️ Error getting status information: {str(e)}")
+            logger.warning("⚠️ Error getting status information: %s", e)
 
         # Add status information to app
         app_with_status = app.copy()
         if github_status:
             app_with_status["github_status"] = github_status
             logger.debug(
-                f"🔍 Added GitHub status: {github_status.get('status', 'unknown')}"
+                "🔍 Added GitHub status: %s", github_status.get("status", "unknown")
             )
         else:
-            logger.debug(f"🔍 No github_status to add (github_status is None or empty)")
+            logger.debug("🔍 No github_status to add (github_status is None or empty)")
         if fly_status:
             app_with_status["fly_status"] = fly_status
         if pr_status:
             app_with_status["pr_status"] = pr_status
-            logger.debug(f"🔍 Adding pr_status to response")
+            logger.debug("🔍 Adding pr_status to response")
 
-        logger.debug(f"🔍 Returning app {slug} with status information")
+        logger.debug("🔍 Returning app %s with status information", slug)
         return jsonify(app_with_status)
     except Exception as e:
-        logger.error(f"💥 Error fetching app: {str(e)}")
+        logger.error("💥 Error fetching app: %s", e)
         return jsonify({"error": "Failed to fetch app"}), 500
 
 
 @apps_bp.route("/api/apps", methods=["POST"])
+@require_user_uuid
 def create_app():
     """Create a new app with GitHub repo and Fly.io app"""
     logger.info("🆕 POST /api/apps - Creating new app")
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Get request data
         data = request.get_json()
@@ -1367,7 +1385,7 @@ def create_app():
 
         # Validate slug format
         if not is_valid_slug(app_slug):
-            logger.warning(f"❌ Invalid app slug format: {app_slug}")
+            logger.warning("❌ Invalid app slug format: %s", app_slug)
             return (
                 jsonify(
                     {
@@ -1377,12 +1395,14 @@ def create_app():
                 400,
             )
 
-        logger.info(f"🔄 Creating app: {app_slug} for user {user_uuid[:8]}")
+        logger.info("🔄 Creating app: %s for user %s", app_slug, user_uuid[:8])
 
         # Check if app with same slug already exists for this user
         if user_app_exists(user_uuid, app_slug):
             logger.warning(
-                f"❌ App with slug '{app_slug}' already exists for user {user_uuid[:8]}"
+                "❌ App with slug '%s' already exists for user %s",
+                app_slug,
+                user_uuid[:8],
             )
             return jsonify({"error": f'App with slug "{app_slug}" already exists'}), 409
 
@@ -1414,13 +1434,13 @@ def create_app():
             )
 
         # Create GitHub repository
-        logger.info(f"🐙 Creating GitHub repository: {app_slug}")
+        logger.info("🐙 Creating GitHub repository: %s", app_slug)
         github_success, github_result = create_github_repo(
             app_slug, github_token, fly_token
         )
 
         if not github_success:
-            logger.error(f"❌ GitHub repo creation failed: {github_result}")
+            logger.error("❌ GitHub repo creation failed: %s", github_result)
             return (
                 jsonify(
                     {"error": f"Failed to create GitHub repository: {github_result}"}
@@ -1429,21 +1449,22 @@ def create_app():
             )
 
         github_url = github_result
-        logger.info(f"✅ GitHub repository created: {github_url}")
+        logger.info("✅ GitHub repository created: %s", github_url)
 
-        # Create Fly.io app
-        logger.info(f"🛩️ Creating Fly.io app: {app_slug}")
+        # Create Fly.io app only once the repo exists, so a GitHub failure never
+        # needs a Fly.io cleanup (create_fly_app also accepts an existing app)
+        logger.info("🛩️ Creating Fly.io app: %s", app_slug)
         fly_success, fly_result = create_fly_app(app_slug, fly_token)
 
         if not fly_success:
-            logger.error(f"❌ Fly.io app creation failed: {fly_result}")
+            logger.error("❌ Fly.io app creation failed: %s", fly_result)
             # Don't fail the entire app creation if Fly.io fails
             # The user can manually create the app later
-            logger.warning(f"⚠️ Continuing with app creation despite Fly.io failure")
+            logger.warning("⚠️ Continuing with app creation despite Fly.io failure")
             fly_app_name = None
         else:
             fly_app_name = app_slug
-            logger.info(f"✅ Fly.io app created: {fly_app_name}")
+            logger.info("✅ Fly.io app created: %s", fly_app_name)
 
         # Create app record
         app = {
@@ -1461,12 +1482,12 @@ def create_app():
 
         # Wait 5 seconds before creating the first riff to allow for proper setup
         logger.info(
-            f"⏳ Waiting 5 seconds before creating initial riff for app: {app_slug}"
+            "⏳ Waiting 5 seconds before creating initial riff for app: %s", app_slug
         )
         time.sleep(5)
 
         # Create initial riff and message for the new app
-        logger.info(f"🆕 Creating initial riff for app: {app_slug}")
+        logger.info("🆕 Creating initial riff for app: %s", app_slug)
         riff_success, riff_result = create_initial_riff_and_message(
             user_uuid, app_slug, app_slug, github_url
         )
@@ -1476,12 +1497,12 @@ def create_app():
             warnings.append(f"Fly.io app creation failed: {fly_result}")
 
         if not riff_success:
-            logger.warning(f"⚠️ Failed to create initial riff: {riff_result}")
+            logger.warning("⚠️ Failed to create initial riff: %s", riff_result)
             warnings.append(f"Initial riff creation failed: {riff_result}")
         else:
-            logger.info(f"✅ Initial riff created successfully for app: {app_slug}")
+            logger.info("✅ Initial riff created successfully for app: %s", app_slug)
 
-        logger.info(f"✅ App created successfully: {app_slug}")
+        logger.info("✅ App created successfully: %s", app_slug)
         return (
             jsonify(
                 {
@@ -1495,34 +1516,28 @@ def create_app():
         )
 
     except Exception as e:
-        logger.error(f"💥 Error creating app: {str(e)}")
+        logger.error("💥 Error creating app: %s", e)
         return jsonify({"error": "Failed to create app"}), 500
 
 
 @apps_bp.route("/api/apps/<slug>", methods=["DELETE"])
+@require_user_uuid
 def delete_app(slug):
     """Delete a app and its associated GitHub repo and Fly.io app"""
-    logger.info(f"🗑️ DELETE /api/apps/{slug} - Deleting app")
+    logger.info("🗑️ DELETE /api/apps/%s - Deleting app", slug)
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Load app for this user
         app = load_user_app(user_uuid, slug)
         if not app:
-            logger.warning(f"❌ App not found: {slug} for user {user_uuid[:8]}")
+            logger.warning("❌ App not found: %s for user %s", slug, user_uuid[:8])
             return jsonify({"error": "App not found"}), 404
 
-        logger.debug(f"🔍 Found app to delete: {app['slug']} for user {user_uuid[:8]}")
+        logger.debug(
+            "🔍 Found app to delete: %s for user %s", app["slug"], user_uuid[:8]
+        )
 
         # Get user's API keys
         user_keys = load_user_keys(user_uuid)
@@ -1536,41 +1551,52 @@ def delete_app(slug):
             "fly_error": None,
         }
 
-        # Delete GitHub repository if URL exists and token is available
+        # The GitHub and Fly.io deletions are independent, so run them concurrently
+        github_future = fly_future = None
         if app.get("github_url") and github_token:
-            logger.info(f"🐙 Deleting GitHub repository: {app['github_url']}")
-            github_success, github_message = delete_github_repo(
-                app["github_url"], github_token
+            logger.info("🐙 Deleting GitHub repository: %s", app["github_url"])
+            github_future = _status_executor.submit(
+                delete_github_repo, app["github_url"], github_token
+            )
+        if app.get("fly_app_name") and fly_token:
+            logger.info("🛩️ Deleting Fly.io app: %s", app["fly_app_name"])
+            fly_future = _status_executor.submit(
+                delete_fly_app, app["fly_app_name"], fly_token
             )
+
+        # Delete GitHub repository if URL exists and token is available
+        if github_future:
+            github_success, github_message = github_future.result()
             deletion_results["github_success"] = github_success
             if not github_success:
                 deletion_results["github_error"] = github_message
-                logger.warning(f"⚠️ GitHub deletion failed: {github_message}")
+                logger.warning("⚠️ GitHub deletion failed: %s", github_message)
             else:
-                logger.info(f"✅ GitHub repository deleted: {github_message}")
+                logger.info("✅ GitHub repository deleted: %s", github_message)
         else:
             logger.info("⚠️ Skipping GitHub deletion (no URL or token)")
 
         # Delete Fly.io app if name exists and token is available
-        if app.get("fly_app_name") and fly_token:
-            logger.info(f"🛩️ Deleting Fly.io app: {app['fly_app_name']}")
-            fly_success, fly_message = delete_fly_app(app["fly_app_name"], fly_token)
+        if fly_future:
+            fly_success, fly_message = fly_future.result()
             deletion_results["fly_success"] = fly_success
             if not fly_success:
                 deletion_results["fly_error"] = fly_message
-                logger.warning(f"⚠️ Fly.io deletion failed: {fly_message}")
+                logger.warning("⚠️ Fly.io deletion failed: %s", fly_message)
             else:
-                logger.info(f"✅ Fly.io app deleted: {fly_message}")
+                logger.info("✅ Fly.io app deleted: %s", fly_message)
         else:
             logger.info("⚠️ Skipping Fly.io deletion (no app name or token)")
 
         # Delete app and all its data (including riffs)
         if delete_user_app(user_uuid, slug):
             logger.info(
-                f"✅ App {slug} and all associated data deleted for user {user_uuid[:8]}"
+                "✅ App %s and all associated data deleted for user %s",
+                slug,
+                user_uuid[:8],
             )
         else:
-            logger.error(f"❌ Failed to delete app data")
+            logger.error("❌ Failed to delete app data")
             return jsonify({"error": "Failed to delete app data"}), 500
 
         # Prepare response
@@ -1595,41 +1621,33 @@ def delete_app(slug):
         if warnings:
             response_data["warnings"] = warnings
 
-        logger.info(f"✅ App deletion completed: {slug}")
+        logger.info("✅ App deletion completed: %s", slug)
         return jsonify(response_data)
 
     except Exception as e:
-        logger.error(f"💥 Error deleting app: {str(e)}")
+        logger.error("💥 Error deleting app: %s", e)
         return jsonify({"error": "Failed to delete app"}), 500
 
 
 @apps_bp.route("/api/apps/<slug>/deployment", methods=["GET"])
+@require_user_uuid
 def get_app_deployment_status(slug):
     """Get deployment status for an app (checks main branch)"""
-    logger.info(f"🚀 GET /api/apps/{slug}/deployment - Getting app deployment status")
+    logger.info("🚀 GET /api/apps/%s/deployment - Getting app deployment status", slug)
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Load app for this user
         app = load_user_app(user_uuid, slug)
         if not app:
-            logger.warning(f"❌ App not found: {slug} for user {user_uuid[:8]}")
+            logger.warning("❌ App not found: %s for user %s", slug, user_uuid[:8])
             return jsonify({"error": "App not found"}), 404
 
         # Check if app has GitHub URL
         github_url = app.get("github_url")
         if not github_url:
-            logger.debug(f"ℹ️ No GitHub URL configured for app {slug}")
+            logger.debug("ℹ️ No GitHub URL configured for app %s", slug)
             return jsonify(
                 {
                     "status": "error",
@@ -1643,7 +1661,7 @@ def get_app_deployment_status(slug):
         github_token = user_keys.get("github")
 
         if not github_token:
-            logger.debug(f"ℹ️ No GitHub token found for user {user_uuid[:8]}")
+            logger.debug("ℹ️ No GitHub token found for user %s", user_uuid[:8])
             return jsonify(
                 {
                     "status": "error",
@@ -1655,16 +1673,20 @@ def get_app_deployment_status(slug):
         # Check deployment status for main branch
         branch_name = "main"
         logger.info(
-            f"🔍 Checking deployment status for app '{slug}' on branch '{branch_name}'"
+            "🔍 Checking deployment status for app '%s' on branch '%s'",
+            slug,
+            branch_name,
         )
 
         deployment_status = get_deployment_status(github_url, github_token, branch_name)
 
         logger.info(
-            f"✅ Deployment status retrieved for app {slug}: {deployment_status['status']}"
+            "✅ Deployment status retrieved for app %s: %s",
+            slug,
+            deployment_status["status"],
         )
         return jsonify(deployment_status)
 
     except Exception as e:
-        logger.error(f"💥 Error getting app deployment status: {str(e)}")
+        logger.error("💥 Error getting app deployment status: %s", e)
         return jsonify({"error": "Failed to get deployment status"}), 500
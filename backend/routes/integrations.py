@@ -1,4 +1,4 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, g, jsonify, request
 import logging
 from keys import (
     load_user_keys,
@@ -8,6 +8,7 @@ from keys import (
     get_supported_providers,
     is_valid_provider,
 )
+from utils.request_validation import require_user_uuid
 
 logger = logging.getLogger(__name__)
 
@@ -19,35 +20,21 @@ api_keys = {"anthropic": None, "github": None, "fly": None}
 
 
 @integrations_bp.route("/api/integrations/<provider>", methods=["POST"])
+@require_user_uuid
 def set_api_key(provider):
     """Set API key for a provider"""
-    logger.info(f"🔑 POST /api/integrations/{provider} - Setting API key")
-    logger.debug(f"📥 Request headers: {dict(request.headers)}")
-    logger.debug(f"📥 Request remote addr: {request.remote_addr}")
+    logger.info("🔑 POST /api/integrations/%s - Setting API key", provider)
+    logger.debug("📥 Request remote addr: %s", request.remote_addr)
     logger.debug(
-        f"📥 Request user agent: {request.headers.get('User-Agent', 'Unknown')}"
+        "📥 Request user agent: %s", request.headers.get("User-Agent", "Unknown")
     )
 
     if not is_valid_provider(provider):
-        logger.warning(f"❌ Invalid provider requested: {provider}")
-        logger.debug(f"📋 Valid providers: {get_supported_providers()}")
+        logger.warning("❌ Invalid provider requested: %s", provider)
+        logger.debug("📋 Valid providers: %s", get_supported_providers())
         return jsonify({"error": "Invalid provider"}), 400
 
-    # Get UUID from headers
-    user_uuid = request.headers.get("X-User-UUID")
-    logger.debug(f"🆔 Raw UUID from header: '{user_uuid}'")
-
-    if not user_uuid:
-        logger.warning("❌ X-User-UUID header is required")
-        logger.debug(f"📋 Available headers: {list(request.headers.keys())}")
-        return jsonify({"error": "X-User-UUID header is required"}), 400
-
-    user_uuid = user_uuid.strip()
-    logger.debug(f"🆔 Cleaned UUID: '{user_uuid}' (length: {len(user_uuid)})")
-
-    if not user_uuid:
-        logger.warning("❌ Empty UUID provided in header")
-        return jsonify({"error": "UUID cannot be empty"}), 400
+    user_uuid = g.user_uuid
 
     data = request.get_json()
     if not data or "api_key" not in data:
@@ -59,7 +46,7 @@ def set_api_key(provider):
         logger.warning("❌ Empty API key provided")
         return jsonify({"error": "API key cannot be empty"}), 400
 
-    logger.debug(f"🔍 Validating {provider} API key for user {user_uuid[:8]}...")
+    logger.debug("🔍 Validating %s API key for user %s...", provider, user_uuid[:8])
 
     # Validate the API key using the keys module
     is_valid = validate_api_key(provider, api_key)
@@ -74,19 +61,21 @@ def set_api_key(provider):
             # Also store in memory for backward compatibility
             api_keys[provider] = api_key
             logger.info(
-                f"✅ {provider} API key validated and stored for user {user_uuid[:8]}"
+                "✅ %s API key validated and stored for user %s",
+                provider,
+                user_uuid[:8],
             )
             return jsonify(
                 {"valid": True, "message": f"{provider.title()} API key is valid"}
             )
         else:
             logger.error(
-                f"❌ Failed to save {provider} API key for user {user_uuid[:8]}"
+                "❌ Failed to save %s API key for user %s", provider, user_uuid[:8]
             )
             return jsonify({"valid": False, "message": "Failed to save API key"}), 500
     else:
         logger.warning(
-            f"❌ {provider} API key validation failed for user {user_uuid[:8]}"
+            "❌ %s API key validation failed for user %s", provider, user_uuid[:8]
         )
         return (
             jsonify(
@@ -97,30 +86,24 @@ def set_api_key(provider):
 
 
 @integrations_bp.route("/api/integrations/<provider>", methods=["GET"])
+@require_user_uuid
 def check_api_key(provider):
     """Check if API key is set and valid for a provider"""
-    logger.info(f"🔍 GET /api/integrations/{provider} - Checking API key status")
+    logger.info("🔍 GET /api/integrations/%s - Checking API key status", provider)
 
     if not is_valid_provider(provider):
-        logger.warning(f"❌ Invalid provider requested: {provider}")
+        logger.warning("❌ Invalid provider requested: %s", provider)
         return jsonify({"error": "Invalid provider"}), 400
 
-    # Get UUID from headers
-    user_uuid = request.headers.get("X-User-UUID")
-    if not user_uuid:
-        logger.warning("❌ X-User-UUID header is required")
-        return jsonify({"error": "X-User-UUID header is required"}), 400
+    user_uuid = g.user_uuid
 
-    user_uuid = user_uuid.strip()
-    if not user_uuid:
-        logger.warning("❌ Empty UUID provided in header")
-        return jsonify({"error": "UUID cannot be empty"}), 400
-
-    logger.debug(f"🔍 Checking {provider} API key status for user {user_uuid[:8]}...")
+    logger.debug(
+        "🔍 Checking %s API key status for user %s...", provider, user_uuid[:8]
+    )
 
     # Check if user has keys file
     if not user_has_keys(user_uuid):
-        logger.debug(f"⚠️ No keys file found for user {user_uuid[:8]}")
+        logger.debug("⚠️ No keys file found for user %s", user_uuid[:8])
         return jsonify(
             {"valid": False, "message": f"{provider.title()} API key not set"}
         )
@@ -130,13 +113,13 @@ def check_api_key(provider):
     api_key = user_keys.get(provider)
 
     if not api_key:
-        logger.debug(f"⚠️ {provider} API key not set for user {user_uuid[:8]}")
+        logger.debug("⚠️ %s API key not set for user %s", provider, user_uuid[:8])
         return jsonify(
             {"valid": False, "message": f"{provider.title()} API key not set"}
         )
 
     logger.debug(
-        f"🔍 Re-validating stored {provider} API key for user {user_uuid[:8]}..."
+        "🔍 Re-validating stored %s API key for user %s...", provider, user_uuid[:8]
     )
 
     # Re-validate the stored key using the keys module
@@ -148,6 +131,6 @@ def check_api_key(provider):
     }
 
     logger.info(
-        f"📊 {provider} API key check result for user {user_uuid[:8]}: {result}"
+        "📊 %s API key check result for user %s: %s", provider, user_uuid[:8], result
     )
     return jsonify(result)
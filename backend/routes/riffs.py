@@ -1,4 +1,4 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, g, jsonify, request
 import re
 import uuid
 import sys
@@ -11,6 +11,8 @@ from keys import get_user_key, load_user_keys
 from utils.repository import setup_riff_workspace
 from utils.event_serializer import serialize_agent_event_to_message
 from utils.deployment_status import get_deployment_status
+from utils.request_validation import require_user_uuid
+from utils.responses import conditional_jsonify, ndjson_response, polled_jsonify
 
 import os
 
@@ -74,6 +76,15 @@ logger = get_logger(__name__)
 riffs_bp = Blueprint("riffs", __name__)
 
 
+# Slug patterns are compiled once at import rather than on every call.
+# Valid slugs: lowercase letters, numbers, and single hyphens between them
+_VALID_SLUG_RE = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
+
+# Seconds browsers may reuse polled status responses before revalidating
+STATUS_MAX_AGE = 2
+RUNTIME_API_STATUS_MAX_AGE = 5
+
+
 def reconstruct_agent_from_state(user_uuid, app_slug, riff_slug):
     """
     Reconstruct an Agent object from existing serialized state for a specific user, app, and riff.
@@ -91,7 +102,7 @@ def reconstruct_agent_from_state(user_uuid, app_slug, riff_slug):
         # Get user's Anthropic token
         anthropic_token = get_user_key(user_uuid, "anthropic")
         if not anthropic_token:
-            logger.warning(f"⚠️ No Anthropic token found for user {user_uuid[:8]}")
+            logger.warning("⚠️ No Anthropic token found for user %s", user_uuid[:8])
             return False, "Anthropic API key required"
 
         # Get workspace path (should already exist from previous setup)
@@ -102,11 +113,12 @@ def reconstruct_agent_from_state(user_uuid, app_slug, riff_slug):
         # Check if workspace exists - if not, fall back to creating new agent
         if not os.path.exists(workspace_path):
             logger.warning(
-                f"⚠️ Workspace not found at {workspace_path}, falling back to creating new agent"
+                "⚠️ Workspace not found at %s, falling back to creating new agent",
+                workspace_path,
             )
             return create_agent_for_user(user_uuid, app_slug, riff_slug)
 
-        logger.info(f"🔄 Reconstructing agent from state for riff {riff_slug}")
+        logger.info("🔄 Reconstructing agent from state for riff %s", riff_slug)
 
         # Create LLM instance
         try:
@@ -118,7 +130,9 @@ def reconstruct_agent_from_state(user_uuid, app_slug, riff_slug):
             def message_callback(event):
                 """Callback to handle events from the agent conversation"""
                 try:
-                    logger.info(f"📨 Received event from agent: {type(event).__name__}")
+                    logger.info(
+                        "📨 Received event from agent: %s", type(event).__name__
+                    )
 
                     # Serialize the event to a message format
                     serialized_message = serialize_agent_event_to_message(
@@ -127,36 +141,29 @@ def reconstruct_agent_from_state(user_uuid, app_slug, riff_slug):
 
                     if serialized_message:
                         # Save the serialized message
-                        if add_user_message(
+                        if commit_user_message(
                             user_uuid, app_slug, riff_slug, serialized_message
                         ):
                             logger.info(
-                                f"✅ Agent event ({type(event).__name__}) saved as message for riff: {riff_slug}"
-                            )
-
-                            # Update riff message stats
-                            messages = load_user_messages(
-                                user_uuid, app_slug, riff_slug
-                            )
-                            update_riff_message_stats(
-                                user_uuid,
-                                app_slug,
+                                "✅ Agent event (%s) saved as message for riff: %s",
+                                type(event).__name__,
                                 riff_slug,
-                                len(messages),
-                                serialized_message["created_at"],
                             )
                         else:
                             logger.error(
-                                f"❌ Failed to save agent event ({type(event).__name__}) for riff: {riff_slug}"
+                                "❌ Failed to save agent event (%s) for riff: %s",
+                                type(event).__name__,
+                                riff_slug,
                             )
                     else:
                         logger.debug(
-                            f"🔇 Event {type(event).__name__} was not serialized (likely filtered out)"
+                            "🔇 Event %s was not serialized (likely filtered out)",
+                            type(event).__name__,
                         )
 
                 except Exception as e:
-                    logger.error(f"❌ Error in message callback: {e}")
-                    logger.error(f"❌ Traceback: {traceback.format_exc()}")
+                    logger.error("❌ Error in message callback: %s", e)
+                    logger.error("❌ Traceback: %s", traceback.format_exc())
 
             # Load riff data to get runtime information
             riff_data = load_user_riff(user_uuid, app_slug, riff_slug)
@@ -164,15 +171,18 @@ def reconstruct_agent_from_state(user_uuid, app_slug, riff_slug):
             session_api_key = riff_data.get("session_api_key") if riff_data else None
 
             if runtime_url and session_api_key:
-                logger.info(f"🌐 Found runtime info for {riff_slug}: {runtime_url}")
+                logger.info("🌐 Found runtime info for %s: %s", riff_slug, runtime_url)
             else:
                 logger.info(
-                    f"🏠 No runtime info found for {riff_slug}, using local agent"
+                    "🏠 No runtime info found for %s, using local agent", riff_slug
                 )
 
             # Create and store the agent loop from existing state
             logger.info(
-                f"🔧 Reconstructing AgentLoop from state with key: {user_uuid[:8]}:{app_slug}:{riff_slug}"
+                "🔧 Reconstructing AgentLoop from state with key: %s:%s:%s",
+                user_uuid[:8],
+                app_slug,
+                riff_slug,
             )
             agent_loop_manager.create_agent_loop_from_state(
                 user_uuid,
@@ -184,7 +194,7 @@ def reconstruct_agent_from_state(user_uuid, app_slug, riff_slug):
                 runtime_url,
                 session_api_key,
             )
-            logger.info(f"🤖 Reconstructed AgentLoop for riff: {riff_slug}")
+            logger.info("🤖 Reconstructed AgentLoop for riff: %s", riff_slug)
 
             # Verify it was stored correctly
             agent_loop = agent_loop_manager.get_agent_loop(
@@ -192,21 +202,27 @@ def reconstruct_agent_from_state(user_uuid, app_slug, riff_slug):
             )
             if agent_loop:
                 logger.info(
-                    f"✅ AgentLoop reconstruction verification successful for {user_uuid[:8]}:{app_slug}:{riff_slug}"
+                    "✅ AgentLoop reconstruction verification successful for %s:%s:%s",
+                    user_uuid[:8],
+                    app_slug,
+                    riff_slug,
                 )
                 return True, None
             else:
                 logger.error(
-                    f"❌ AgentLoop reconstruction verification failed for {user_uuid[:8]}:{app_slug}:{riff_slug}"
+                    "❌ AgentLoop reconstruction verification failed for %s:%s:%s",
+                    user_uuid[:8],
+                    app_slug,
+                    riff_slug,
                 )
                 return False, "Failed to verify Agent reconstruction"
 
         except Exception as e:
-            logger.error(f"❌ Failed to create LLM instance: {e}")
+            logger.error("❌ Failed to create LLM instance: %s", e)
             return False, f"Failed to initialize LLM: {str(e)}"
 
     except Exception as e:
-        logger.error(f"❌ Failed to reconstruct AgentLoop: {e}")
+        logger.error("❌ Failed to reconstruct AgentLoop: %s", e)
         return False, f"Failed to reconstruct Agent: {str(e)}"
 
 
@@ -227,32 +243,32 @@ def create_agent_for_user(user_uuid, app_slug, riff_slug):
         # Get user's Anthropic token
         anthropic_token = get_user_key(user_uuid, "anthropic")
         if not anthropic_token:
-            logger.warning(f"⚠️ No Anthropic token found for user {user_uuid[:8]}")
+            logger.warning("⚠️ No Anthropic token found for user %s", user_uuid[:8])
             return False, "Anthropic API key required"
 
         # Get app data to retrieve GitHub URL
         apps_storage = get_apps_storage(user_uuid)
         app_data = apps_storage.load_app(app_slug)
         if not app_data:
-            logger.error(f"❌ App data not found for {app_slug}")
+            logger.error("❌ App data not found for %s", app_slug)
             return False, "App not found"
 
         github_url = app_data.get("github_url")
         if not github_url:
-            logger.error(f"❌ No GitHub URL found for app {app_slug}")
+            logger.error("❌ No GitHub URL found for app %s", app_slug)
             return False, "GitHub URL not configured for this app"
 
         # Setup workspace: create directory and clone repository
-        logger.info(f"🏗️ Setting up workspace for riff {riff_slug}")
+        logger.info("🏗️ Setting up workspace for riff %s", riff_slug)
         workspace_success, workspace_path, workspace_error = setup_riff_workspace(
             user_uuid, app_slug, riff_slug, github_url
         )
 
         if not workspace_success:
-            logger.error(f"❌ Failed to setup workspace: {workspace_error}")
+            logger.error("❌ Failed to setup workspace: %s", workspace_error)
             return False, f"Failed to setup workspace: {workspace_error}"
 
-        logger.info(f"✅ Workspace ready at: {workspace_path}")
+        logger.info("✅ Workspace ready at: %s", workspace_path)
 
         # Create LLM instance
         try:
@@ -264,7 +280,9 @@ def create_agent_for_user(user_uuid, app_slug, riff_slug):
             def message_callback(event):
                 """Callback to handle events from the agent conversation"""
                 try:
-                    logger.info(f"📨 Received event from agent: {type(event).__name__}")
+                    logger.info(
+                        "📨 Received event from agent: %s", type(event).__name__
+                    )
 
                     # Serialize the event to a message format
                     serialized_message = serialize_agent_event_to_message(
@@ -273,36 +291,29 @@ def create_agent_for_user(user_uuid, app_slug, riff_slug):
 
                     if serialized_message:
                         # Save the serialized message
-                        if add_user_message(
+                        if commit_user_message(
                             user_uuid, app_slug, riff_slug, serialized_message
                         ):
                             logger.info(
-                                f"✅ Agent event ({type(event).__name__}) saved as message for riff: {riff_slug}"
-                            )
-
-                            # Update riff message stats
-                            messages = load_user_messages(
-                                user_uuid, app_slug, riff_slug
-                            )
-                            update_riff_message_stats(
-                                user_uuid,
-                                app_slug,
+                                "✅ Agent event (%s) saved as message for riff: %s",
+                                type(event).__name__,
                                 riff_slug,
-                                len(messages),
-                                serialized_message["created_at"],
                             )
                         else:
                             logger.error(
-                                f"❌ Failed to save agent event ({type(event).__name__}) for riff: {riff_slug}"
+                                "❌ Failed to save agent event (%s) for riff: %s",
+                                type(event).__name__,
+                                riff_slug,
                             )
                     else:
                         logger.debug(
-                            f"🔇 Event {type(event).__name__} was not serialized (likely filtered out)"
+                            "🔇 Event %s was not serialized (likely filtered out)",
+                            type(event).__name__,
                         )
 
                 except Exception as e:
-                    logger.error(f"❌ Error in message callback: {e}")
-                    logger.error(f"❌ Traceback: {traceback.format_exc()}")
+                    logger.error("❌ Error in message callback: %s", e)
+                    logger.error("❌ Traceback: %s", traceback.format_exc())
 
             # Load riff data to get runtime information
             riff_data = load_user_riff(user_uuid, app_slug, riff_slug)
@@ -310,15 +321,18 @@ def create_agent_for_user(user_uuid, app_slug, riff_slug):
             session_api_key = riff_data.get("session_api_key") if riff_data else None
 
             if runtime_url and session_api_key:
-                logger.info(f"🌐 Found runtime info for {riff_slug}: {runtime_url}")
+                logger.info("🌐 Found runtime info for %s: %s", riff_slug, runtime_url)
             else:
                 logger.info(
-                    f"🏠 No runtime info found for {riff_slug}, using local agent"
+                    "🏠 No runtime info found for %s, using local agent", riff_slug
                 )
 
             # Create and store the agent loop
             logger.info(
-                f"🔧 Creating AgentLoop with key: {user_uuid[:8]}:{app_slug}:{riff_slug}"
+                "🔧 Creating AgentLoop with key: %s:%s:%s",
+                user_uuid[:8],
+                app_slug,
+                riff_slug,
             )
             agent_loop_manager.create_agent_loop(
                 user_uuid,
@@ -330,7 +344,7 @@ def create_agent_for_user(user_uuid, app_slug, riff_slug):
                 runtime_url,
                 session_api_key,
             )
-            logger.info(f"🤖 Created AgentLoop for riff: {riff_slug}")
+            logger.info("🤖 Created AgentLoop for riff: %s", riff_slug)
 
             # Verify it was stored correctly
             agent_loop = agent_loop_manager.get_agent_loop(
@@ -338,7 +352,10 @@ def create_agent_for_user(user_uuid, app_slug, riff_slug):
             )
             if agent_loop:
                 logger.debug(
-                    f"✅ AgentLoop verification successful for {user_uuid[:8]}:{app_slug}:{riff_slug}"
+                    "✅ AgentLoop verification successful for %s:%s:%s",
+                    user_uuid[:8],
+                    app_slug,
+                    riff_slug,
                 )
 
                 # Initial message logic removed - agents will wait for user input
@@ -346,16 +363,19 @@ def create_agent_for_user(user_uuid, app_slug, riff_slug):
                 return True, None
             else:
                 logger.error(
-                    f"❌ AgentLoop verification failed for {user_uuid[:8]}:{app_slug}:{riff_slug}"
+                    "❌ AgentLoop verification failed for %s:%s:%s",
+                    user_uuid[:8],
+                    app_slug,
+                    riff_slug,
                 )
                 return False, "Failed to verify Agent creation"
 
         except Exception as e:
-            logger.error(f"❌ Failed to create LLM instance: {e}")
+            logger.error("❌ Failed to create LLM instance: %s", e)
             return False, f"Failed to initialize LLM: {str(e)}"
 
     except Exception as e:
-        logger.error(f"❌ Failed to create AgentLoop: {e}")
+        logger.error("❌ Failed to create AgentLoop: %s", e)
         return False, f"Failed to create Agent: {str(e)}"
 
 
@@ -377,6 +397,12 @@ def save_user_riff(user_uuid, app_slug, riff_slug, riff_data):
     return storage.save_riff(app_slug, riff_slug, riff_data)
 
 
+def update_user_riff(user_uuid, app_slug, riff_slug, updates):
+    """Merge updates into an existing riff for a user"""
+    storage = get_riffs_storage(user_uuid)
+    return storage.update_riff(app_slug, riff_slug, updates)
+
+
 def user_riff_exists(user_uuid, app_slug, riff_slug):
     """Check if riff exists for user"""
     storage = get_riffs_storage(user_uuid)
@@ -389,83 +415,54 @@ def delete_user_riff(user_uuid, app_slug, riff_slug):
     return storage.delete_riff(app_slug, riff_slug)
 
 
-def create_slug(name):
-    """Convert riff name to slug format"""
-    # Convert to lowercase and replace spaces/special chars with hyphens
-    slug = re.sub(r"[^a-zA-Z0-9\s-]", "", name.lower())
-    slug = re.sub(r"\s+", "-", slug.strip())
-    slug = re.sub(r"-+", "-", slug)
-    return slug.strip("-")
-
-
 def is_valid_slug(slug):
     """Validate that a slug contains only lowercase letters, numbers, and hyphens"""
     if not slug:
         return False
-    # Check if slug matches the pattern: lowercase letters, numbers, and hyphens only
-    # Must not start or end with hyphen, and no consecutive hyphens
-    pattern = r"^[a-z0-9]+(-[a-z0-9]+)*$"
-    return bool(re.match(pattern, slug))
+    return bool(_VALID_SLUG_RE.match(slug))
 
 
 @riffs_bp.route("/api/apps/<slug>/riffs", methods=["GET"])
+@require_user_uuid
 def get_riffs(slug):
     """Get all riffs for a specific app"""
-    logger.info(f"📋 GET /api/apps/{slug}/riffs - Fetching riffs")
+    logger.info("📋 GET /api/apps/%s/riffs - Fetching riffs", slug)
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Verify app exists for this user
         if not user_app_exists(user_uuid, slug):
-            logger.warning(f"❌ App not found: {slug} for user {user_uuid[:8]}")
+            logger.warning("❌ App not found: %s for user %s", slug, user_uuid[:8])
             return jsonify({"error": "App not found"}), 404
 
+        # Storage keeps riffs ordered newest first
         riffs = load_user_riffs(user_uuid, slug)
-        # Sort riffs by creation date (newest first)
-        riffs.sort(key=lambda x: x.get("created_at", ""), reverse=True)
 
         logger.info(
-            f"📊 Returning {len(riffs)} riffs for app {slug} for user {user_uuid[:8]}"
+            "📊 Returning %s riffs for app %s for user %s",
+            len(riffs),
+            slug,
+            user_uuid[:8],
+        )
+        return conditional_jsonify(
+            {"riffs": riffs, "count": len(riffs), "app_slug": slug}
         )
-        return jsonify({"riffs": riffs, "count": len(riffs), "app_slug": slug})
     except Exception as e:
-        logger.error(f"💥 Error fetching riffs: {str(e)}")
+        logger.error("💥 Error fetching riffs: %s", e)
         return jsonify({"error": "Failed to fetch riffs"}), 500
 
 
 @riffs_bp.route("/api/apps/<slug>/riffs", methods=["POST"])
+@require_user_uuid
 def create_riff(slug):
     """Create a new riff for a specific app"""
-    logger.info(f"🆕 POST /api/apps/{slug}/riffs - Creating new riff")
+    logger.info("🆕 POST /api/apps/%s/riffs - Creating new riff", slug)
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
+        user_uuid = g.user_uuid
 
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
-
-        # Verify app exists for this user
-        if not user_app_exists(user_uuid, slug):
-            logger.warning(f"❌ App not found: {slug} for user {user_uuid[:8]}")
-            return jsonify({"error": "App not found"}), 404
-
-        # Get request data
+        # Validate the request body before touching the filesystem
         data = request.get_json()
         if not data or "slug" not in data:
             logger.warning("❌ Riff slug is required")
@@ -478,7 +475,7 @@ def create_riff(slug):
 
         # Validate slug format
         if not is_valid_slug(riff_slug):
-            logger.warning(f"❌ Invalid riff slug format: {riff_slug}")
+            logger.warning("❌ Invalid riff slug format: %s", riff_slug)
             return (
                 jsonify(
                     {
@@ -488,13 +485,20 @@ def create_riff(slug):
                 400,
             )
 
-        logger.info(f"🔄 Creating riff: {riff_slug} for user {user_uuid[:8]}")
+        # Verify app exists for this user
+        if not user_app_exists(user_uuid, slug):
+            logger.warning("❌ App not found: %s for user %s", slug, user_uuid[:8])
+            return jsonify({"error": "App not found"}), 404
+
+        logger.info("🔄 Creating riff: %s for user %s", riff_slug, user_uuid[:8])
 
         # Check if riff with same slug already exists for this user
         existing_riff = None
         if user_riff_exists(user_uuid, slug, riff_slug):
             logger.info(
-                f"🔄 Riff with slug '{riff_slug}' already exists for user {user_uuid[:8]}, adopting existing riff"
+                "🔄 Riff with slug '%s' already exists for user %s, adopting existing riff",
+                riff_slug,
+                user_uuid[:8],
             )
             existing_riff = load_user_riff(user_uuid, slug, riff_slug)
             if existing_riff:
@@ -503,7 +507,7 @@ def create_riff(slug):
                     user_uuid, slug, riff_slug
                 )
                 if success:
-                    logger.info(f"✅ Successfully adopted existing riff: {riff_slug}")
+                    logger.info("✅ Successfully adopted existing riff: %s", riff_slug)
                     return (
                         jsonify(
                             {
@@ -516,17 +520,20 @@ def create_riff(slug):
                 else:
                     # If reconstruction fails, try creating a new agent
                     logger.warning(
-                        f"⚠️ Failed to reconstruct agent from existing state: {error_message}"
+                        "⚠️ Failed to reconstruct agent from existing state: %s",
+                        error_message,
                     )
                     logger.info(
-                        f"🔄 Attempting to create new agent for existing riff: {riff_slug}"
+                        "🔄 Attempting to create new agent for existing riff: %s",
+                        riff_slug,
                     )
                     success, error_message = create_agent_for_user(
                         user_uuid, slug, riff_slug
                     )
                     if success:
                         logger.info(
-                            f"✅ Successfully created new agent for existing riff: {riff_slug}"
+                            "✅ Successfully created new agent for existing riff: %s",
+                            riff_slug,
                         )
                         return (
                             jsonify(
@@ -539,7 +546,8 @@ def create_riff(slug):
                         )
                     else:
                         logger.error(
-                            f"❌ Failed to create agent for existing riff: {error_message}"
+                            "❌ Failed to create agent for existing riff: %s",
+                            error_message,
                         )
                         return (
                             jsonify(
@@ -550,7 +558,7 @@ def create_riff(slug):
                             500,
                         )
             else:
-                logger.error(f"❌ Could not load existing riff data for {riff_slug}")
+                logger.error("❌ Could not load existing riff data for %s", riff_slug)
                 return jsonify({"error": "Failed to load existing riff data"}), 500
 
         # Create riff record
@@ -569,14 +577,15 @@ def create_riff(slug):
             return jsonify({"error": "Failed to save riff"}), 500
 
         # Start remote runtime for the new Riff
-        logger.info(f"🚀 Starting remote runtime for riff: {riff_slug}")
+        logger.info("🚀 Starting remote runtime for riff: %s", riff_slug)
         runtime_success, runtime_response = runtime_service.start_runtime(
             user_uuid, slug, riff_slug
         )
 
         if runtime_success:
             logger.info(
-                f"✅ Remote runtime started successfully: {runtime_response.get('runtime_id')}"
+                "✅ Remote runtime started successfully: %s",
+                runtime_response.get("runtime_id"),
             )
             # Store runtime info in riff data
             riff["runtime_id"] = runtime_response.get("runtime_id")
@@ -587,14 +596,14 @@ def create_riff(slug):
             save_user_riff(user_uuid, slug, riff_slug, riff)
         else:
             logger.warning(
-                f"⚠️ Failed to start remote runtime: {runtime_response.get('error')}"
+                "⚠️ Failed to start remote runtime: %s", runtime_response.get("error")
             )
             # Continue without runtime - local agent will be used as fallback
 
         # Create AgentLoop with user's Anthropic token
         success, error_message = create_agent_for_user(user_uuid, slug, riff_slug)
         if not success:
-            logger.error(f"❌ Failed to create Agent for riff: {error_message}")
+            logger.error("❌ Failed to create Agent for riff: %s", error_message)
             # Return 500 for git/workspace setup failures, 400 for other client errors
             status_code = (
                 500
@@ -604,11 +613,11 @@ def create_riff(slug):
             )
             return jsonify({"error": error_message}), status_code
 
-        logger.info(f"✅ Riff created successfully: {riff_slug}")
+        logger.info("✅ Riff created successfully: %s", riff_slug)
         return jsonify({"message": "Riff created successfully", "riff": riff}), 201
 
     except Exception as e:
-        logger.error(f"💥 Error creating riff: {str(e)}")
+        logger.error("💥 Error creating riff: %s", e)
         return jsonify({"error": "Failed to create riff"}), 500
 
 
@@ -625,71 +634,45 @@ def save_user_messages(user_uuid, app_slug, riff_slug, messages):
     return storage.save_messages(app_slug, riff_slug, messages)
 
 
-def add_user_message(user_uuid, app_slug, riff_slug, message):
-    """Add a single message to a riff using storage pattern"""
+def commit_user_message(user_uuid, app_slug, riff_slug, message):
+    """Add a message to a riff and queue its message stats update"""
     storage = get_riffs_storage(user_uuid)
-    return storage.add_message(app_slug, riff_slug, message)
-
-
-def update_riff_message_stats(
-    user_uuid, app_slug, riff_slug, message_count, last_message_at
-):
-    """Update riff statistics with message count and last message time"""
-    try:
-        # Load the riff data
-        riff_data = load_user_riff(user_uuid, app_slug, riff_slug)
-        if riff_data:
-            # Update stats
-            riff_data["message_count"] = message_count
-            riff_data["last_message_at"] = last_message_at
-
-            # Save updated riff data
-            success = save_user_riff(user_uuid, app_slug, riff_slug, riff_data)
-            if success:
-                logger.debug(
-                    f"📊 Updated riff stats: {message_count} messages, last at {last_message_at}"
-                )
-            return success
-    except Exception as e:
-        logger.error(f"❌ Failed to update riff stats: {e}")
-    return False
+    return storage.commit_message(app_slug, riff_slug, message)
 
 
 @riffs_bp.route("/api/apps/<slug>/riffs/<riff_slug>/messages", methods=["GET"])
+@require_user_uuid
 def get_messages(slug, riff_slug):
     """Get all messages for a specific riff"""
     logger.info(
-        f"📋 GET /api/apps/{slug}/riffs/{riff_slug}/messages - Fetching messages"
+        "📋 GET /api/apps/%s/riffs/%s/messages - Fetching messages", slug, riff_slug
     )
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Verify app exists
         if not user_app_exists(user_uuid, slug):
-            logger.warning(f"❌ App not found: {slug}")
+            logger.warning("❌ App not found: %s", slug)
             return jsonify({"error": "App not found"}), 404
 
         # Verify riff exists
         if not user_riff_exists(user_uuid, slug, riff_slug):
-            logger.warning(f"❌ Riff not found: {riff_slug}")
+            logger.warning("❌ Riff not found: %s", riff_slug)
             return jsonify({"error": "Riff not found"}), 404
 
+        # Storage already returns messages by creation time (oldest first)
         messages = load_user_messages(user_uuid, slug, riff_slug)
-        # Sort messages by creation time (oldest first for chat display)
-        messages.sort(key=lambda x: x.get("created_at", ""))
 
-        logger.debug(f"📊 Returning {len(messages)} messages for riff {riff_slug}")
-        return jsonify(
+        # Opt-in streaming: one message per line, encoded as it is sent
+        if request.accept_mimetypes.best == "application/x-ndjson":
+            logger.debug(
+                "📊 Streaming %s messages for riff %s", len(messages), riff_slug
+            )
+            return ndjson_response(messages)
+
+        logger.debug("📊 Returning %s messages for riff %s", len(messages), riff_slug)
+        return conditional_jsonify(
             {
                 "messages": messages,
                 "count": len(messages),
@@ -698,30 +681,22 @@ def get_messages(slug, riff_slug):
             }
         )
     except Exception as e:
-        logger.error(f"💥 Error fetching messages: {str(e)}")
+        logger.error("💥 Error fetching messages: %s", e)
         return jsonify({"error": "Failed to fetch messages"}), 500
 
 
 @riffs_bp.route("/api/apps/<slug>/riffs/messages", methods=["POST"])
+@require_user_uuid
 def create_message(slug):
     """Create a new message for a specific riff"""
-    logger.info(f"🆕 POST /api/apps/{slug}/riffs/messages - Creating new message")
+    logger.info("🆕 POST /api/apps/%s/riffs/messages - Creating new message", slug)
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Verify app exists
         if not user_app_exists(user_uuid, slug):
-            logger.warning(f"❌ App not found: {slug}")
+            logger.warning("❌ App not found: %s", slug)
             return jsonify({"error": "App not found"}), 404
 
         # Get request data
@@ -742,10 +717,10 @@ def create_message(slug):
 
         # Verify riff exists
         if not user_riff_exists(user_uuid, slug, riff_slug):
-            logger.warning(f"❌ Riff not found: {riff_slug}")
+            logger.warning("❌ Riff not found: %s", riff_slug)
             return jsonify({"error": "Riff not found"}), 404
 
-        logger.info(f"🔄 Creating message for riff: {riff_slug}")
+        logger.info("🔄 Creating message for riff: %s", riff_slug)
 
         # Create message record
         message_id = str(uuid.uuid4())
@@ -762,15 +737,18 @@ def create_message(slug):
             "metadata": data.get("metadata", {}),  # Additional data like file info
         }
 
-        # Add message using storage pattern
-        if not add_user_message(user_uuid, slug, riff_slug, message):
+        # Add message and queue the riff stats update in one step
+        if not commit_user_message(user_uuid, slug, riff_slug, message):
             logger.error("❌ Failed to save message to file")
             return jsonify({"error": "Failed to save message"}), 500
 
         # Check if this is a user message that should trigger LLM response
         message_type = data.get("type", "text")
         logger.info(
-            f"🔍 Message type: {message_type}, created_by: {message.get('created_by')}, user_uuid: {user_uuid[:8]}"
+            "🔍 Message type: %s, created_by: %s, user_uuid: %s",
+            message_type,
+            message.get("created_by"),
+            user_uuid[:8],
         )
 
         if message_type == "user" or (
@@ -778,45 +756,44 @@ def create_message(slug):
         ):
             # Try to get agent loop and generate LLM response
             logger.info(
-                f"🔍 Looking for AgentLoop with key: {user_uuid[:8]}:{slug}:{riff_slug}"
+                "🔍 Looking for AgentLoop with key: %s:%s:%s",
+                user_uuid[:8],
+                slug,
+                riff_slug,
             )
 
             # Debug: Show all available agent loops
             stats = agent_loop_manager.get_stats()
-            logger.debug(f"📊 Current AgentLoop stats: {stats}")
+            logger.debug("📊 Current AgentLoop stats: %s", stats)
 
             agent_loop = agent_loop_manager.get_agent_loop(user_uuid, slug, riff_slug)
             if agent_loop:
                 logger.info(
-                    f"✅ Found AgentLoop for {user_uuid[:8]}:{slug}:{riff_slug}"
+                    "✅ Found AgentLoop for %s:%s:%s", user_uuid[:8], slug, riff_slug
                 )
             else:
                 logger.warning(
-                    f"❌ AgentLoop not found for {user_uuid[:8]}:{slug}:{riff_slug}"
+                    "❌ AgentLoop not found for %s:%s:%s",
+                    user_uuid[:8],
+                    slug,
+                    riff_slug,
                 )
                 # Debug: Show what keys are actually stored
                 with agent_loop_manager._lock:
                     stored_keys = list(agent_loop_manager.agent_loops.keys())
-                    logger.info(f"🔑 Available AgentLoop keys: {stored_keys}")
+                    logger.info("🔑 Available AgentLoop keys: %s", stored_keys)
 
             if agent_loop:
                 try:
                     logger.info(
-                        f"🤖 Sending message to Agent for {user_uuid[:8]}/{slug}/{riff_slug}"
-                    )
-                    # Send message to agent - response will come through callback
-                    confirmation = agent_loop.send_message(content)
-                    logger.info(f"✅ Message sent to agent: {confirmation}")
-
-                    # Update riff message stats for the user message
-                    messages = load_user_messages(user_uuid, slug, riff_slug)
-                    update_riff_message_stats(
-                        user_uuid,
+                        "🤖 Sending message to Agent for %s/%s/%s",
+                        user_uuid[:8],
                         slug,
                         riff_slug,
-                        len(messages),
-                        created_at,
                     )
+                    # Send message to agent - response will come through callback
+                    confirmation = agent_loop.send_message(content)
+                    logger.info("✅ Message sent to agent: %s", confirmation)
 
                     # Return success - agent response will be saved via callback
                     return (
@@ -831,49 +808,37 @@ def create_message(slug):
                     )
 
                 except Exception as e:
-                    logger.error(f"❌ Error sending message to agent: {e}")
+                    logger.error("❌ Error sending message to agent: %s", e)
                     # Continue without agent response - user message was still saved
 
-        # Get updated message count for stats (fallback if no LLM response)
-        messages = load_user_messages(user_uuid, slug, riff_slug)
-        update_riff_message_stats(user_uuid, slug, riff_slug, len(messages), created_at)
-
-        logger.info(f"✅ Message created successfully for riff: {riff_slug}")
+        logger.info("✅ Message created successfully for riff: %s", riff_slug)
         return (
             jsonify({"message": "Message created successfully", "data": message}),
             201,
         )
 
     except Exception as e:
-        logger.error(f"💥 Error creating message: {str(e)}")
+        logger.error("💥 Error creating message: %s", e)
         return jsonify({"error": "Failed to create message"}), 500
 
 
 @riffs_bp.route("/api/apps/<slug>/riffs/<riff_slug>/ready", methods=["GET"])
+@require_user_uuid
 def check_riff_ready(slug, riff_slug):
     """Check if an LLM object is ready in memory for a specific riff"""
     log_api_request(logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/ready")
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Verify app exists
         if not user_app_exists(user_uuid, slug):
-            logger.warning(f"❌ App not found: {slug}")
+            logger.warning("❌ App not found: %s", slug)
             return jsonify({"error": "App not found"}), 404
 
         # Verify riff exists
         if not user_riff_exists(user_uuid, slug, riff_slug):
-            logger.warning(f"❌ Riff not found: {riff_slug}")
+            logger.warning("❌ Riff not found: %s", riff_slug)
             return jsonify({"error": "Riff not found"}), 404
 
         # Check if AgentLoop exists for this riff
@@ -884,19 +849,22 @@ def check_riff_ready(slug, riff_slug):
         if not is_ready:
             stats = agent_loop_manager.get_stats()
             logger.warning(
-                f"🔍 LLM not ready for {user_uuid[:8]}:{slug}:{riff_slug}. "
-                f"Total loops: {stats.get('total_loops', 0)}"
+                "🔍 LLM not ready for %s:%s:%s. Total loops: %s",
+                user_uuid[:8],
+                slug,
+                riff_slug,
+                stats.get("total_loops", 0),
             )
         else:
-            logger.info(f"✅ LLM ready for {user_uuid[:8]}:{slug}:{riff_slug}")
+            logger.info("✅ LLM ready for %s:%s:%s", user_uuid[:8], slug, riff_slug)
 
         log_api_response(
             logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/ready", 200, user_uuid
         )
-        return jsonify({"ready": is_ready}), 200
+        return polled_jsonify({"ready": is_ready}, STATUS_MAX_AGE)
 
     except Exception as e:
-        logger.error(f"💥 Error checking riff readiness: {str(e)}")
+        logger.error("💥 Error checking riff readiness: %s", e)
         log_api_response(
             logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/ready", 500
         )
@@ -904,50 +872,48 @@ def check_riff_ready(slug, riff_slug):
 
 
 @riffs_bp.route("/api/apps/<slug>/riffs/<riff_slug>/reset", methods=["POST"])
+@require_user_uuid
 def reset_riff_llm(slug, riff_slug):
     """Reset the LLM object for a specific riff by creating a brand new one"""
     log_api_request(logger, "POST", f"/api/apps/{slug}/riffs/{riff_slug}/reset")
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Verify app exists
         if not user_app_exists(user_uuid, slug):
-            logger.warning(f"❌ App not found: {slug}")
+            logger.warning("❌ App not found: %s", slug)
             return jsonify({"error": "App not found"}), 404
 
         # Verify riff exists
         if not user_riff_exists(user_uuid, slug, riff_slug):
-            logger.warning(f"❌ Riff not found: {riff_slug}")
+            logger.warning("❌ Riff not found: %s", riff_slug)
             return jsonify({"error": "Riff not found"}), 404
 
         # Handle runtime reset - check status and unpause/restart as needed
-        logger.info(f"🔄 Handling runtime reset for riff: {riff_slug}")
+        logger.info("🔄 Handling runtime reset for riff: %s", riff_slug)
         runtime_success, runtime_response = runtime_service.handle_agent_reset(
             user_uuid, slug, riff_slug
         )
 
         if runtime_success:
             logger.info(
-                f"✅ Runtime reset handled successfully: {runtime_response.get('status')}"
+                "✅ Runtime reset handled successfully: %s",
+                runtime_response.get("status"),
             )
             # Update riff with any new runtime info
-            riff_data = load_user_riff(user_uuid, slug, riff_slug)
-            if riff_data and runtime_response.get("runtime_id"):
-                riff_data["runtime_id"] = runtime_response.get("runtime_id")
-                riff_data["runtime_url"] = runtime_response.get("url")
-                save_user_riff(user_uuid, slug, riff_slug, riff_data)
+            if runtime_response.get("runtime_id"):
+                update_user_riff(
+                    user_uuid,
+                    slug,
+                    riff_slug,
+                    {
+                        "runtime_id": runtime_response.get("runtime_id"),
+                        "runtime_url": runtime_response.get("url"),
+                    },
+                )
         else:
-            logger.warning(f"⚠️ Runtime reset failed: {runtime_response.get('error')}")
+            logger.warning("⚠️ Runtime reset failed: %s", runtime_response.get("error"))
             # Continue with local agent reset as fallback
 
         # Remove existing AgentLoop if it exists
@@ -956,11 +922,17 @@ def reset_riff_llm(slug, riff_slug):
         )
         if existing_removed:
             logger.info(
-                f"🗑️ Removed existing AgentLoop for {user_uuid[:8]}:{slug}:{riff_slug}"
+                "🗑️ Removed existing AgentLoop for %s:%s:%s",
+                user_uuid[:8],
+                slug,
+                riff_slug,
             )
         else:
             logger.info(
-                f"ℹ️ No existing AgentLoop found for {user_uuid[:8]}:{slug}:{riff_slug}"
+                "ℹ️ No existing AgentLoop found for %s:%s:%s",
+                user_uuid[:8],
+                slug,
+                riff_slug,
             )
 
         # Reconstruct Agent object from existing serialized state (no re-cloning)
@@ -968,17 +940,23 @@ def reset_riff_llm(slug, riff_slug):
             user_uuid, slug, riff_slug
         )
         if not success:
-            logger.error(f"❌ Failed to reset Agent for riff: {error_message}")
+            logger.error("❌ Failed to reset Agent for riff: %s", error_message)
             return jsonify({"error": error_message}), 500
 
         # Double-check that the LLM is actually ready before returning success
         logger.info(
-            f"🔍 Verifying LLM readiness after reset for {user_uuid[:8]}:{slug}:{riff_slug}"
+            "🔍 Verifying LLM readiness after reset for %s:%s:%s",
+            user_uuid[:8],
+            slug,
+            riff_slug,
         )
         agent_loop = agent_loop_manager.get_agent_loop(user_uuid, slug, riff_slug)
         if not agent_loop:
             logger.error(
-                f"❌ LLM reset appeared successful but AgentLoop not found for {user_uuid[:8]}:{slug}:{riff_slug}"
+                "❌ LLM reset appeared successful but AgentLoop not found for %s:%s:%s",
+                user_uuid[:8],
+                slug,
+                riff_slug,
             )
             return (
                 jsonify({"error": "LLM reset failed - could not verify readiness"}),
@@ -988,18 +966,27 @@ def reset_riff_llm(slug, riff_slug):
         # Test that the LLM can actually respond to a simple query
         try:
             logger.info(
-                f"🧪 Testing LLM functionality for {user_uuid[:8]}:{slug}:{riff_slug}"
+                "🧪 Testing LLM functionality for %s:%s:%s",
+                user_uuid[:8],
+                slug,
+                riff_slug,
             )
             test_message = "Hello"
-            logger.info(f"📨 Sending test message: {test_message}")
+            logger.info("📨 Sending test message: %s", test_message)
             test_response = agent_loop.send_message(test_message)
             if test_response and len(test_response.strip()) > 0:
                 logger.info(
-                    f"✅ LLM test successful for {user_uuid[:8]}:{slug}:{riff_slug}"
+                    "✅ LLM test successful for %s:%s:%s",
+                    user_uuid[:8],
+                    slug,
+                    riff_slug,
                 )
             else:
                 logger.error(
-                    f"❌ LLM test failed - empty response for {user_uuid[:8]}:{slug}:{riff_slug}"
+                    "❌ LLM test failed - empty response for %s:%s:%s",
+                    user_uuid[:8],
+                    slug,
+                    riff_slug,
                 )
                 return (
                     jsonify(
@@ -1009,21 +996,25 @@ def reset_riff_llm(slug, riff_slug):
                 )
         except Exception as e:
             logger.error(
-                f"❌ LLM test failed with exception for {user_uuid[:8]}:{slug}:{riff_slug}: {e}"
+                "❌ LLM test failed with exception for %s:%s:%s: %s",
+                user_uuid[:8],
+                slug,
+                riff_slug,
+                e,
             )
             return (
                 jsonify({"error": f"LLM reset failed - LLM test error: {str(e)}"}),
                 500,
             )
 
-        logger.info(f"✅ LLM reset and verification successful for riff: {riff_slug}")
+        logger.info("✅ LLM reset and verification successful for riff: %s", riff_slug)
         log_api_response(
             logger, "POST", f"/api/apps/{slug}/riffs/{riff_slug}/reset", 200, user_uuid
         )
         return jsonify({"message": "LLM reset successfully", "ready": True}), 200
 
     except Exception as e:
-        logger.error(f"💥 Error resetting riff LLM: {str(e)}")
+        logger.error("💥 Error resetting riff LLM: %s", e)
         log_api_response(
             logger, "POST", f"/api/apps/{slug}/riffs/{riff_slug}/reset", 500
         )
@@ -1031,37 +1022,29 @@ def reset_riff_llm(slug, riff_slug):
 
 
 @riffs_bp.route("/api/apps/<slug>/riffs/<riff_slug>/status", methods=["GET"])
+@require_user_uuid
 def get_agent_status(slug, riff_slug):
     """Get the current status of the agent for a specific riff"""
     log_api_request(logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/status")
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Verify app exists
         if not user_app_exists(user_uuid, slug):
-            logger.warning(f"❌ App not found: {slug}")
+            logger.warning("❌ App not found: %s", slug)
             return jsonify({"error": "App not found"}), 404
 
         # Verify riff exists
         if not user_riff_exists(user_uuid, slug, riff_slug):
-            logger.warning(f"❌ Riff not found: {riff_slug}")
+            logger.warning("❌ Riff not found: %s", riff_slug)
             return jsonify({"error": "Riff not found"}), 404
 
         # Get the agent loop
         agent_loop = agent_loop_manager.get_agent_loop(user_uuid, slug, riff_slug)
         if not agent_loop:
             logger.warning(
-                f"❌ Agent loop not found for {user_uuid[:8]}:{slug}:{riff_slug}"
+                "❌ Agent loop not found for %s:%s:%s", user_uuid[:8], slug, riff_slug
             )
             return (
                 jsonify(
@@ -1077,15 +1060,15 @@ def get_agent_status(slug, riff_slug):
         status = agent_loop.get_agent_status()
 
         logger.debug(
-            f"📊 Agent status retrieved for {user_uuid[:8]}:{slug}:{riff_slug}"
+            "📊 Agent status retrieved for %s:%s:%s", user_uuid[:8], slug, riff_slug
         )
         log_api_response(
             logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/status", 200, user_uuid
         )
-        return jsonify(status), 200
+        return polled_jsonify(status, STATUS_MAX_AGE)
 
     except Exception as e:
-        logger.error(f"💥 Error getting agent status: {str(e)}")
+        logger.error("💥 Error getting agent status: %s", e)
         log_api_response(
             logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/status", 500
         )
@@ -1093,37 +1076,29 @@ def get_agent_status(slug, riff_slug):
 
 
 @riffs_bp.route("/api/apps/<slug>/riffs/<riff_slug>/play", methods=["POST"])
+@require_user_uuid
 def play_agent(slug, riff_slug):
     """Resume/play the agent for a specific riff"""
     log_api_request(logger, "POST", f"/api/apps/{slug}/riffs/{riff_slug}/play")
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Verify app exists
         if not user_app_exists(user_uuid, slug):
-            logger.warning(f"❌ App not found: {slug}")
+            logger.warning("❌ App not found: %s", slug)
             return jsonify({"error": "App not found"}), 404
 
         # Verify riff exists
         if not user_riff_exists(user_uuid, slug, riff_slug):
-            logger.warning(f"❌ Riff not found: {riff_slug}")
+            logger.warning("❌ Riff not found: %s", riff_slug)
             return jsonify({"error": "Riff not found"}), 404
 
         # Get the agent loop
         agent_loop = agent_loop_manager.get_agent_loop(user_uuid, slug, riff_slug)
         if not agent_loop:
             logger.warning(
-                f"❌ Agent loop not found for {user_uuid[:8]}:{slug}:{riff_slug}"
+                "❌ Agent loop not found for %s:%s:%s", user_uuid[:8], slug, riff_slug
             )
             return (
                 jsonify(
@@ -1137,7 +1112,7 @@ def play_agent(slug, riff_slug):
         # Resume the agent
         success = agent_loop.resume_agent()
         if success:
-            logger.info(f"▶️ Agent resumed for {user_uuid[:8]}:{slug}:{riff_slug}")
+            logger.info("▶️ Agent resumed for %s:%s:%s", user_uuid[:8], slug, riff_slug)
             log_api_response(
                 logger,
                 "POST",
@@ -1151,12 +1126,12 @@ def play_agent(slug, riff_slug):
             )
         else:
             logger.error(
-                f"❌ Failed to resume agent for {user_uuid[:8]}:{slug}:{riff_slug}"
+                "❌ Failed to resume agent for %s:%s:%s", user_uuid[:8], slug, riff_slug
             )
             return jsonify({"error": "Failed to resume agent"}), 500
 
     except Exception as e:
-        logger.error(f"💥 Error resuming agent: {str(e)}")
+        logger.error("💥 Error resuming agent: %s", e)
         log_api_response(
             logger, "POST", f"/api/apps/{slug}/riffs/{riff_slug}/play", 500
         )
@@ -1164,37 +1139,29 @@ def play_agent(slug, riff_slug):
 
 
 @riffs_bp.route("/api/apps/<slug>/riffs/<riff_slug>/pause", methods=["POST"])
+@require_user_uuid
 def pause_agent(slug, riff_slug):
     """Pause the agent for a specific riff"""
     log_api_request(logger, "POST", f"/api/apps/{slug}/riffs/{riff_slug}/pause")
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Verify app exists
         if not user_app_exists(user_uuid, slug):
-            logger.warning(f"❌ App not found: {slug}")
+            logger.warning("❌ App not found: %s", slug)
             return jsonify({"error": "App not found"}), 404
 
         # Verify riff exists
         if not user_riff_exists(user_uuid, slug, riff_slug):
-            logger.warning(f"❌ Riff not found: {riff_slug}")
+            logger.warning("❌ Riff not found: %s", riff_slug)
             return jsonify({"error": "Riff not found"}), 404
 
         # Get the agent loop
         agent_loop = agent_loop_manager.get_agent_loop(user_uuid, slug, riff_slug)
         if not agent_loop:
             logger.warning(
-                f"❌ Agent loop not found for {user_uuid[:8]}:{slug}:{riff_slug}"
+                "❌ Agent loop not found for %s:%s:%s", user_uuid[:8], slug, riff_slug
             )
             return (
                 jsonify(
@@ -1208,7 +1175,7 @@ def pause_agent(slug, riff_slug):
         # Pause the agent
         success = agent_loop.pause_agent()
         if success:
-            logger.info(f"⏸️ Agent paused for {user_uuid[:8]}:{slug}:{riff_slug}")
+            logger.info("⏸️ Agent paused for %s:%s:%s", user_uuid[:8], slug, riff_slug)
             log_api_response(
                 logger,
                 "POST",
@@ -1222,12 +1189,12 @@ def pause_agent(slug, riff_slug):
             )
         else:
             logger.error(
-                f"❌ Failed to pause agent for {user_uuid[:8]}:{slug}:{riff_slug}"
+                "❌ Failed to pause agent for %s:%s:%s", user_uuid[:8], slug, riff_slug
             )
             return jsonify({"error": "Failed to pause agent"}), 500
 
     except Exception as e:
-        logger.error(f"💥 Error pausing agent: {str(e)}")
+        logger.error("💥 Error pausing agent: %s", e)
         log_api_response(
             logger, "POST", f"/api/apps/{slug}/riffs/{riff_slug}/pause", 500
         )
@@ -1236,33 +1203,19 @@ def pause_agent(slug, riff_slug):
 
 # PR Status endpoint for CI status display
 @riffs_bp.route("/api/apps/<slug>/riffs/<riff_slug>/pr-status", methods=["GET"])
+@require_user_uuid
 def get_riff_pr_status(slug, riff_slug):
     """Get GitHub Pull Request status for a specific riff (using riff name as branch)"""
     log_api_request(logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/pr-status")
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            log_api_response(
-                logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/pr-status", 400
-            )
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            log_api_response(
-                logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/pr-status", 400
-            )
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Load app to get GitHub URL
         apps_storage = get_apps_storage(user_uuid)
         app = apps_storage.load_app(slug)
         if not app:
-            logger.warning(f"❌ App not found: {slug} for user {user_uuid[:8]}")
+            logger.warning("❌ App not found: %s for user %s", slug, user_uuid[:8])
             log_api_response(
                 logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/pr-status", 404
             )
@@ -1271,7 +1224,7 @@ def get_riff_pr_status(slug, riff_slug):
         # Check if app has GitHub URL
         github_url = app.get("github_url")
         if not github_url:
-            logger.debug(f"ℹ️ No GitHub URL configured for app {slug}")
+            logger.debug("ℹ️ No GitHub URL configured for app %s", slug)
             log_api_response(
                 logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/pr-status", 200
             )
@@ -1282,7 +1235,7 @@ def get_riff_pr_status(slug, riff_slug):
             user_keys = load_user_keys(user_uuid)
             github_token = user_keys.get("github")
             if not github_token:
-                logger.debug(f"ℹ️ No GitHub token configured for user {user_uuid[:8]}")
+                logger.debug("ℹ️ No GitHub token configured for user %s", user_uuid[:8])
                 log_api_response(
                     logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/pr-status", 200
                 )
@@ -1292,43 +1245,47 @@ def get_riff_pr_status(slug, riff_slug):
 
             # Use riff slug as branch name (this is the typical pattern)
             riff_branch = riff_slug
-            logger.debug(f"🔍 Looking for PR from riff branch '{riff_branch}' to main")
+            logger.debug("🔍 Looking for PR from riff branch '%s' to main", riff_branch)
 
             # Search for PRs FROM the riff branch TO main (the typical workflow)
             # This means: head=riff_branch, base=main
             pr_status = get_pr_status(
-                github_url, github_token, riff_branch, search_by_base=False
+                github_url, github_token, branch=riff_branch, search_by_base=False
             )
 
             if pr_status:
-                logger.info(f"✅ Found PR from riff branch '{riff_branch}' to main")
+                logger.info("✅ Found PR from riff branch '%s' to main", riff_branch)
             else:
-                logger.debug(f"ℹ️ No PR found from riff branch '{riff_branch}' to main")
+                logger.debug(
+                    "ℹ️ No PR found from riff branch '%s' to main", riff_branch
+                )
                 # Note: We don't try base search here because riffs are source branches, not target branches
 
             if pr_status:
                 logger.info(
-                    f"✅ Found PR status for riff {riff_slug}: #{pr_status['number']}"
+                    "✅ Found PR status for riff %s: #%s",
+                    riff_slug,
+                    pr_status["number"],
                 )
             else:
                 logger.info(
-                    f"ℹ️ No PR found for riff {riff_slug} (branch: {riff_branch})"
+                    "ℹ️ No PR found for riff %s (branch: %s)", riff_slug, riff_branch
                 )
 
             log_api_response(
                 logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/pr-status", 200
             )
-            return jsonify({"pr_status": pr_status})
+            return polled_jsonify({"pr_status": pr_status}, STATUS_MAX_AGE)
 
         except Exception as e:
-            logger.error(f"❌ Error getting PR status: {str(e)}")
+            logger.error("❌ Error getting PR status: %s", e)
             log_api_response(
                 logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/pr-status", 500
             )
             return jsonify({"error": f"Failed to get PR status: {str(e)}"}), 500
 
     except Exception as e:
-        logger.error(f"💥 Error getting riff PR status: {str(e)}")
+        logger.error("💥 Error getting riff PR status: %s", e)
         log_api_response(
             logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/pr-status", 500
         )
@@ -1336,41 +1293,35 @@ def get_riff_pr_status(slug, riff_slug):
 
 
 @riffs_bp.route("/api/apps/<slug>/riffs/<riff_slug>", methods=["DELETE"])
+@require_user_uuid
 def delete_riff(slug, riff_slug):
     """Delete a riff and its associated Fly.io app, close PR, and delete branch"""
-    logger.info(f"🗑️ DELETE /api/apps/{slug}/riffs/{riff_slug} - Deleting riff")
+    logger.info("🗑️ DELETE /api/apps/%s/riffs/%s - Deleting riff", slug, riff_slug)
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Verify app exists
         if not user_app_exists(user_uuid, slug):
-            logger.warning(f"❌ App not found: {slug} for user {user_uuid[:8]}")
+            logger.warning("❌ App not found: %s for user %s", slug, user_uuid[:8])
             return jsonify({"error": "App not found"}), 404
 
         # Load riff for this user
         riff = load_user_riff(user_uuid, slug, riff_slug)
         if not riff:
-            logger.warning(f"❌ Riff not found: {riff_slug} for user {user_uuid[:8]}")
+            logger.warning(
+                "❌ Riff not found: %s for user %s", riff_slug, user_uuid[:8]
+            )
             return jsonify({"error": "Riff not found"}), 404
 
         logger.debug(
-            f"🔍 Found riff to delete: {riff['slug']} for user {user_uuid[:8]}"
+            "🔍 Found riff to delete: %s for user %s", riff["slug"], user_uuid[:8]
         )
 
         # Load app data to get GitHub URL
         app = load_user_app(user_uuid, slug)
         if not app:
-            logger.warning(f"❌ App data not found: {slug} for user {user_uuid[:8]}")
+            logger.warning("❌ App data not found: %s for user %s", slug, user_uuid[:8])
             return jsonify({"error": "App data not found"}), 404
 
         # Get user's API keys
@@ -1389,45 +1340,45 @@ def delete_riff(slug, riff_slug):
 
         # Close GitHub PR if URL exists and token is available
         if app.get("github_url") and github_token:
-            logger.info(f"🔀 Closing PR for branch: {riff_slug}")
+            logger.info("🔀 Closing PR for branch: %s", riff_slug)
             pr_success, pr_message = close_github_pr(
                 app["github_url"], github_token, riff_slug
             )
             deletion_results["github_pr_success"] = pr_success
             if not pr_success:
                 deletion_results["github_pr_error"] = pr_message
-                logger.warning(f"⚠️ PR closure failed: {pr_message}")
+                logger.warning("⚠️ PR closure failed: %s", pr_message)
             else:
-                logger.info(f"✅ PR closed: {pr_message}")
+                logger.info("✅ PR closed: %s", pr_message)
         else:
             logger.info("⚠️ Skipping PR closure (no GitHub URL or token)")
 
         # Delete GitHub branch if URL exists and token is available
         if app.get("github_url") and github_token:
-            logger.info(f"🌿 Deleting branch: {riff_slug}")
+            logger.info("🌿 Deleting branch: %s", riff_slug)
             branch_success, branch_message = delete_github_branch(
                 app["github_url"], github_token, riff_slug
             )
             deletion_results["github_branch_success"] = branch_success
             if not branch_success:
                 deletion_results["github_branch_error"] = branch_message
-                logger.warning(f"⚠️ Branch deletion failed: {branch_message}")
+                logger.warning("⚠️ Branch deletion failed: %s", branch_message)
             else:
-                logger.info(f"✅ Branch deleted: {branch_message}")
+                logger.info("✅ Branch deleted: %s", branch_message)
         else:
             logger.info("⚠️ Skipping branch deletion (no GitHub URL or token)")
 
         # Delete Fly.io app if name exists and token is available
         fly_app_name = f"{slug}-{riff_slug}"
         if fly_token:
-            logger.info(f"🛩️ Deleting Fly.io app: {fly_app_name}")
+            logger.info("🛩️ Deleting Fly.io app: %s", fly_app_name)
             fly_success, fly_message = delete_fly_app(fly_app_name, fly_token)
             deletion_results["fly_success"] = fly_success
             if not fly_success:
                 deletion_results["fly_error"] = fly_message
-                logger.warning(f"⚠️ Fly.io deletion failed: {fly_message}")
+                logger.warning("⚠️ Fly.io deletion failed: %s", fly_message)
             else:
-                logger.info(f"✅ Fly.io app deleted: {fly_message}")
+                logger.info("✅ Fly.io app deleted: %s", fly_message)
         else:
             logger.info("⚠️ Skipping Fly.io deletion (no token)")
 
@@ -1435,19 +1386,21 @@ def delete_riff(slug, riff_slug):
         try:
             agent_loop = agent_loop_manager.get_agent_loop(user_uuid, slug, riff_slug)
             if agent_loop:
-                logger.info(f"🤖 Stopping agent loop for riff: {riff_slug}")
+                logger.info("🤖 Stopping agent loop for riff: %s", riff_slug)
                 agent_loop_manager.remove_agent_loop(user_uuid, slug, riff_slug)
-                logger.info(f"✅ Agent loop stopped and removed")
+                logger.info("✅ Agent loop stopped and removed")
         except Exception as e:
-            logger.warning(f"⚠️ Error stopping agent loop: {e}")
+            logger.warning("⚠️ Error stopping agent loop: %s", e)
 
         # Delete riff data
         if delete_user_riff(user_uuid, slug, riff_slug):
             logger.info(
-                f"✅ Riff {riff_slug} and all associated data deleted for user {user_uuid[:8]}"
+                "✅ Riff %s and all associated data deleted for user %s",
+                riff_slug,
+                user_uuid[:8],
             )
         else:
-            logger.error(f"❌ Failed to delete riff data")
+            logger.error("❌ Failed to delete riff data")
             return jsonify({"error": "Failed to delete riff data"}), 500
 
         # Prepare response
@@ -1474,51 +1427,47 @@ def delete_riff(slug, riff_slug):
         if warnings:
             response_data["warnings"] = warnings
 
-        logger.info(f"✅ Riff deletion completed: {riff_slug}")
+        logger.info("✅ Riff deletion completed: %s", riff_slug)
         return jsonify(response_data)
 
     except Exception as e:
-        logger.error(f"💥 Error deleting riff: {str(e)}")
+        logger.error("💥 Error deleting riff: %s", e)
         return jsonify({"error": "Failed to delete riff"}), 500
 
 
 @riffs_bp.route("/api/apps/<slug>/riffs/<riff_slug>/deployment", methods=["GET"])
+@require_user_uuid
 def get_riff_deployment_status(slug, riff_slug):
     """Get deployment status for a riff (checks riff branch)"""
     logger.info(
-        f"🚀 GET /api/apps/{slug}/riffs/{riff_slug}/deployment - Getting riff deployment status"
+        "🚀 GET /api/apps/%s/riffs/%s/deployment - Getting riff deployment status",
+        slug,
+        riff_slug,
     )
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Load app to get GitHub URL
         apps_storage = get_apps_storage(user_uuid)
         app = apps_storage.load_app(slug)
         if not app:
-            logger.warning(f"❌ App not found: {slug} for user {user_uuid[:8]}")
+            logger.warning("❌ App not found: %s for user %s", slug, user_uuid[:8])
             return jsonify({"error": "App not found"}), 404
 
         # Verify riff exists
         riffs_storage = get_riffs_storage(user_uuid)
         riff = riffs_storage.load_riff(slug, riff_slug)
         if not riff:
-            logger.warning(f"❌ Riff not found: {riff_slug} for user {user_uuid[:8]}")
+            logger.warning(
+                "❌ Riff not found: %s for user %s", riff_slug, user_uuid[:8]
+            )
             return jsonify({"error": "Riff not found"}), 404
 
         # Check if app has GitHub URL
         github_url = app.get("github_url")
         if not github_url:
-            logger.debug(f"ℹ️ No GitHub URL configured for app {slug}")
+            logger.debug("ℹ️ No GitHub URL configured for app %s", slug)
             return jsonify(
                 {
                     "status": "error",
@@ -1532,7 +1481,7 @@ def get_riff_deployment_status(slug, riff_slug):
         github_token = user_keys.get("github")
 
         if not github_token:
-            logger.debug(f"ℹ️ No GitHub token found for user {user_uuid[:8]}")
+            logger.debug("ℹ️ No GitHub token found for user %s", user_uuid[:8])
             return jsonify(
                 {
                     "status": "error",
@@ -1544,18 +1493,22 @@ def get_riff_deployment_status(slug, riff_slug):
         # Check deployment status for riff branch (use riff slug as branch name)
         branch_name = riff_slug
         logger.info(
-            f"🔍 Checking deployment status for riff '{riff_slug}' on branch '{branch_name}'"
+            "🔍 Checking deployment status for riff '%s' on branch '%s'",
+            riff_slug,
+            branch_name,
         )
 
         deployment_status = get_deployment_status(github_url, github_token, branch_name)
 
         logger.info(
-            f"✅ Deployment status retrieved for riff {riff_slug}: {deployment_status['status']}"
+            "✅ Deployment status retrieved for riff %s: %s",
+            riff_slug,
+            deployment_status["status"],
         )
-        return jsonify(deployment_status)
+        return polled_jsonify(deployment_status, STATUS_MAX_AGE)
 
     except Exception as e:
-        logger.error(f"💥 Error getting riff deployment status: {str(e)}")
+        logger.error("💥 Error getting riff deployment status: %s", e)
         return jsonify({"error": "Failed to get deployment status"}), 500
 
 
@@ -1571,7 +1524,7 @@ def get_runtime_api_status():
         if user_uuid:
             user_uuid = user_uuid.strip()
             logger.info(
-                f"🏥 Runtime API status check requested by user {user_uuid[:8]}"
+                "🏥 Runtime API status check requested by user %s", user_uuid[:8]
             )
         else:
             logger.info("🏥 Runtime API status check requested (no user UUID)")
@@ -1582,19 +1535,18 @@ def get_runtime_api_status():
         if success:
             logger.info("✅ Runtime API is healthy")
             log_api_response(logger, "GET", "/api/runtime/status", 200, user_uuid)
-            return (
-                jsonify(
-                    {
-                        "status": "healthy",
-                        "runtime_api_url": runtime_service.runtime_api_url,
-                        "details": health_response,
-                    }
-                ),
-                200,
+            return polled_jsonify(
+                {
+                    "status": "healthy",
+                    "runtime_api_url": runtime_service.runtime_api_url,
+                    "details": health_response,
+                },
+                RUNTIME_API_STATUS_MAX_AGE,
+                public=True,
             )
         else:
             logger.warning(
-                f"⚠️ Runtime API health check failed: {health_response.get('error')}"
+                "⚠️ Runtime API health check failed: %s", health_response.get("error")
             )
             log_api_response(logger, "GET", "/api/runtime/status", 503, user_uuid)
             return (
@@ -1610,7 +1562,7 @@ def get_runtime_api_status():
             )
 
     except Exception as e:
-        logger.error(f"💥 Error checking runtime API status: {str(e)}")
+        logger.error("💥 Error checking runtime API status: %s", e)
         log_api_response(
             logger,
             "GET",
@@ -1631,34 +1583,29 @@ def get_runtime_api_status():
 
 # Runtime Status endpoint for specific riff
 @riffs_bp.route("/api/apps/<slug>/riffs/<riff_slug>/runtime/status", methods=["GET"])
+@require_user_uuid
 def get_riff_runtime_status(slug, riff_slug):
     """Get the runtime status for a specific riff"""
     log_api_request(logger, "GET", f"/api/apps/{slug}/riffs/{riff_slug}/runtime/status")
 
     try:
-        # Get UUID from headers
-        user_uuid = request.headers.get("X-User-UUID")
-        if not user_uuid:
-            logger.warning("❌ X-User-UUID header is required")
-            return jsonify({"error": "X-User-UUID header is required"}), 400
-
-        user_uuid = user_uuid.strip()
-        if not user_uuid:
-            logger.warning("❌ Empty UUID provided in header")
-            return jsonify({"error": "UUID cannot be empty"}), 400
+        user_uuid = g.user_uuid
 
         # Verify app exists
         if not user_app_exists(user_uuid, slug):
-            logger.warning(f"❌ App not found: {slug}")
+            logger.warning("❌ App not found: %s", slug)
             return jsonify({"error": "App not found"}), 404
 
         # Verify riff exists
         if not user_riff_exists(user_uuid, slug, riff_slug):
-            logger.warning(f"❌ Riff not found: {riff_slug}")
+            logger.warning("❌ Riff not found: %s", riff_slug)
             return jsonify({"error": "Riff not found"}), 404
 
         logger.info(
-            f"📊 Getting runtime status for riff: {user_uuid[:8]}:{slug}:{riff_slug}"
+            "📊 Getting runtime status for riff: %s:%s:%s",
+            user_uuid[:8],
+            slug,
+            riff_slug,
         )
 
         # Get runtime status
@@ -1667,7 +1614,9 @@ def get_riff_runtime_status(slug, riff_slug):
         )
 
         if success:
-            logger.info(f"✅ Runtime status retrieved: {status_response.get('status')}")
+            logger.info(
+                "✅ Runtime status retrieved: %s", status_response.get("status")
+            )
             log_api_response(
                 logger,
                 "GET",
@@ -1675,9 +1624,13 @@ def get_riff_runtime_status(slug, riff_slug):
                 200,
                 user_uuid,
             )
-            return jsonify({"status": "found", "runtime": status_response}), 200
+            return polled_jsonify(
+                {"status": "found", "runtime": status_response}, STATUS_MAX_AGE
+            )
         else:
-            logger.info(f"ℹ️ Runtime not found or error: {status_response.get('error')}")
+            logger.info(
+                "ℹ️ Runtime not found or error: %s", status_response.get("error")
+            )
             log_api_response(
                 logger,
                 "GET",
@@ -1697,7 +1650,7 @@ def get_riff_runtime_status(slug, riff_slug):
             )
 
     except Exception as e:
-        logger.error(f"💥 Error getting riff runtime status: {str(e)}")
+        logger.error("💥 Error getting riff runtime status: %s", e)
         log_api_response(
             logger,
             "GET",
@@ -55,7 +55,7 @@ class RuntimeService:
             default_headers.update(headers)
 
         try:
-            logger.info(f"🌐 Making {method} request to {url}")
+            logger.info("🌐 Making %s request to %s", method, url)
 
             if method.upper() == "GET":
                 response = requests.get(url, headers=default_headers, timeout=30)
@@ -66,7 +66,7 @@ class RuntimeService:
             else:
                 return False, {"error": f"Unsupported HTTP method: {method}"}
 
-            logger.info(f"📡 Runtime API response: {response.status_code}")
+            logger.info("📡 Runtime API response: %s", response.status_code)
 
             if response.status_code in [200, 201, 202]:
                 return True, response.json()
@@ -78,7 +78,7 @@ class RuntimeService:
                 except Exception:
                     error_msg = f"{error_msg} - {response.text}"
 
-                logger.error(f"❌ {error_msg}")
+                logger.error("❌ %s", error_msg)
                 return False, {"error": error_msg}
 
         except requests.exceptions.Timeout:
@@ -88,7 +88,7 @@ class RuntimeService:
             logger.error("❌ Failed to connect to Runtime API")
             return False, {"error": "Failed to connect to Runtime API"}
         except Exception as e:
-            logger.error(f"❌ Runtime API request failed: {e}")
+            logger.error("❌ Runtime API request failed: %s", e)
             return False, {"error": f"Runtime API request failed: {str(e)}"}
 
     def start_runtime(
@@ -116,15 +116,15 @@ class RuntimeService:
             "environment": {"DEBUG": "true"},
         }
 
-        logger.info(f"🚀 Starting runtime for session: {session_id}")
+        logger.info("🚀 Starting runtime for session: %s", session_id)
         success, response = self._make_request("POST", "/start", runtime_config)
 
         if success:
             logger.info(
-                f"✅ Runtime started successfully: {response.get('runtime_id')}"
+                "✅ Runtime started successfully: %s", response.get("runtime_id")
             )
         else:
-            logger.error(f"❌ Failed to start runtime: {response.get('error')}")
+            logger.error("❌ Failed to start runtime: %s", response.get("error"))
 
         return success, response
 
@@ -144,14 +144,14 @@ class RuntimeService:
         """
         session_id = f"{user_uuid}.{app_slug}.{riff_slug}"
 
-        logger.info(f"📊 Getting runtime status for session: {session_id}")
+        logger.info("📊 Getting runtime status for session: %s", session_id)
         success, response = self._make_request("GET", f"/sessions/{session_id}")
 
         if success:
             status = response.get("status", "unknown")
-            logger.info(f"📈 Runtime status: {status}")
+            logger.info("📈 Runtime status: %s", status)
         else:
-            logger.warning(f"⚠️ Failed to get runtime status: {response.get('error')}")
+            logger.warning("⚠️ Failed to get runtime status: %s", response.get("error"))
 
         return success, response
 
@@ -174,35 +174,35 @@ class RuntimeService:
         start_time = time.time()
 
         logger.info(
-            f"⏳ Waiting for runtime to be ready: {session_id} (timeout: {timeout}s)"
+            "⏳ Waiting for runtime to be ready: %s (timeout: %ss)", session_id, timeout
         )
 
         while time.time() - start_time < timeout:
             success, response = self.get_runtime_status(user_uuid, app_slug, riff_slug)
 
             if not success:
-                logger.warning(f"⚠️ Failed to get runtime status, retrying in 5s...")
+                logger.warning("⚠️ Failed to get runtime status, retrying in 5s...")
                 time.sleep(5)
                 continue
 
             status = response.get("status", "unknown")
 
             if status == "running":
-                logger.info(f"✅ Runtime is ready: {session_id}")
+                logger.info("✅ Runtime is ready: %s", session_id)
                 return True, response
             elif status == "error":
-                logger.error(f"❌ Runtime failed to start: {session_id}")
+                logger.error("❌ Runtime failed to start: %s", session_id)
                 return False, {"error": "Runtime failed to start", "status": status}
             elif status in ["starting", "paused"]:
-                logger.info(f"🔄 Runtime status: {status}, waiting...")
+                logger.info("🔄 Runtime status: %s, waiting...", status)
                 time.sleep(5)
                 continue
             else:
-                logger.warning(f"⚠️ Unknown runtime status: {status}, waiting...")
+                logger.warning("⚠️ Unknown runtime status: %s, waiting...", status)
                 time.sleep(5)
                 continue
 
-        logger.error(f"⏰ Timeout waiting for runtime to be ready: {session_id}")
+        logger.error("⏰ Timeout waiting for runtime to be ready: %s", session_id)
         return False, {"error": "Timeout waiting for runtime to be ready"}
 
     def pause_runtime(self, runtime_id: str) -> Tuple[bool, Dict]:
@@ -215,15 +215,15 @@ class RuntimeService:
         Returns:
             Tuple of (success: bool, response_data: Dict)
         """
-        logger.info(f"⏸️ Pausing runtime: {runtime_id}")
+        logger.info("⏸️ Pausing runtime: %s", runtime_id)
 
         pause_data = {"runtime_id": runtime_id}
         success, response = self._make_request("POST", "/pause", pause_data)
 
         if success:
-            logger.info(f"✅ Runtime paused successfully: {runtime_id}")
+            logger.info("✅ Runtime paused successfully: %s", runtime_id)
         else:
-            logger.error(f"❌ Failed to pause runtime: {response.get('error')}")
+            logger.error("❌ Failed to pause runtime: %s", response.get("error"))
 
         return success, response
 
@@ -237,15 +237,15 @@ class RuntimeService:
         Returns:
             Tuple of (success: bool, response_data: Dict)
         """
-        logger.info(f"▶️ Resuming runtime: {runtime_id}")
+        logger.info("▶️ Resuming runtime: %s", runtime_id)
 
         resume_data = {"runtime_id": runtime_id}
         success, response = self._make_request("POST", "/resume", resume_data)
 
         if success:
-            logger.info(f"✅ Runtime resumed successfully: {runtime_id}")
+            logger.info("✅ Runtime resumed successfully: %s", runtime_id)
         else:
-            logger.error(f"❌ Failed to resume runtime: {response.get('error')}")
+            logger.error("❌ Failed to resume runtime: %s", response.get("error"))
 
         return success, response
 
@@ -268,12 +268,12 @@ class RuntimeService:
                 return True, response.json()
             else:
                 logger.warning(
-                    f"⚠️ Runtime API health check failed: {response.status_code}"
+                    "⚠️ Runtime API health check failed: %s", response.status_code
                 )
                 return False, {"error": f"Health check failed: {response.status_code}"}
 
         except Exception as e:
-            logger.error(f"❌ Runtime API health check failed: {e}")
+            logger.error("❌ Runtime API health check failed: %s", e)
             return False, {"error": f"Health check failed: {str(e)}"}
 
     def check_runtime_alive(self, runtime_url: str) -> Tuple[bool, Dict]:
@@ -291,29 +291,31 @@ class RuntimeService:
 
         try:
             url = f"{runtime_url.rstrip('/')}/alive"
-            logger.info(f"🔍 Checking runtime alive status: {url}")
+            logger.info("🔍 Checking runtime alive status: %s", url)
 
             response = requests.get(url, timeout=10)
 
             if response.status_code == 200:
-                logger.info(f"✅ Runtime is alive: {runtime_url}")
+                logger.info("✅ Runtime is alive: %s", runtime_url)
                 return True, {"status": "alive", "url": runtime_url}
             else:
                 logger.warning(
-                    f"⚠️ Runtime alive check failed: {response.status_code} for {runtime_url}"
+                    "⚠️ Runtime alive check failed: %s for %s",
+                    response.status_code,
+                    runtime_url,
                 )
                 return False, {
                     "error": f"Runtime alive check failed: {response.status_code}"
                 }
 
         except requests.exceptions.Timeout:
-            logger.warning(f"⏰ Runtime alive check timed out: {runtime_url}")
+            logger.warning("⏰ Runtime alive check timed out: %s", runtime_url)
             return False, {"error": "Runtime alive check timed out"}
         except requests.exceptions.ConnectionError:
-            logger.warning(f"🔌 Failed to connect to runtime: {runtime_url}")
+            logger.warning("🔌 Failed to connect to runtime: %s", runtime_url)
             return False, {"error": "Failed to connect to runtime"}
         except Exception as e:
-            logger.warning(f"❌ Runtime alive check failed: {e} for {runtime_url}")
+            logger.warning("❌ Runtime alive check failed: %s for %s", e, runtime_url)
             return False, {"error": f"Runtime alive check failed: {str(e)}"}
 
     def wait_for_runtime_ready_and_alive(
@@ -344,7 +346,9 @@ class RuntimeService:
         start_time = time.time()
 
         logger.info(
-            f"⏳ Waiting for runtime to be ready and alive: {session_id} (timeout: {timeout}s)"
+            "⏳ Waiting for runtime to be ready and alive: %s (timeout: %ss)",
+            session_id,
+            timeout,
         )
 
         while time.time() - start_time < timeout:
@@ -355,7 +359,8 @@ class RuntimeService:
 
             if not ready_success:
                 logger.warning(
-                    f"⚠️ Failed to get runtime status, retrying in {check_interval}s..."
+                    "⚠️ Failed to get runtime status, retrying in %ss...",
+                    check_interval,
                 )
                 time.sleep(check_interval)
                 continue
@@ -364,10 +369,10 @@ class RuntimeService:
             current_runtime_url = runtime_url or ready_response.get("url")
 
             if status == "error":
-                logger.error(f"❌ Runtime failed to start: {session_id}")
+                logger.error("❌ Runtime failed to start: %s", session_id)
                 return False, {"error": "Runtime failed to start", "status": status}
             elif status != "running":
-                logger.info(f"🔄 Runtime status: {status}, waiting...")
+                logger.info("🔄 Runtime status: %s, waiting...", status)
                 time.sleep(check_interval)
                 continue
 
@@ -380,7 +385,9 @@ class RuntimeService:
                 if alive_success:
                     elapsed_time = int(time.time() - start_time)
                     logger.info(
-                        f"✅ Runtime is ready and alive after {elapsed_time}s: {session_id}"
+                        "✅ Runtime is ready and alive after %ss: %s",
+                        elapsed_time,
+                        session_id,
                     )
                     return True, {
                         **ready_response,
@@ -388,22 +395,26 @@ class RuntimeService:
                         "url": current_runtime_url,
                     }
                 else:
-                    logger.info(f"🔄 Runtime is running but not yet alive, waiting...")
+                    logger.info("🔄 Runtime is running but not yet alive, waiting...")
             else:
-                logger.warning(f"⚠️ Runtime is running but no URL available, waiting...")
+                logger.warning("⚠️ Runtime is running but no URL available, waiting...")
 
             # Log progress every 30 seconds to avoid spam
             elapsed_time = int(time.time() - start_time)
             if elapsed_time > 0 and elapsed_time % 30 == 0:
                 logger.info(
-                    f"🔄 Still waiting for runtime to be ready and alive ({elapsed_time}s elapsed): {session_id}"
+                    "🔄 Still waiting for runtime to be ready and alive (%ss elapsed): %s",
+                    elapsed_time,
+                    session_id,
                 )
 
             time.sleep(check_interval)
 
         elapsed_time = int(time.time() - start_time)
         logger.error(
-            f"⏰ Timeout waiting for runtime to be ready and alive after {elapsed_time}s: {session_id}"
+            "⏰ Timeout waiting for runtime to be ready and alive after %ss: %s",
+            elapsed_time,
+            session_id,
         )
         return False, {
             "error": f"Timeout waiting for runtime to be ready and alive after {elapsed_time}s"
@@ -431,7 +442,10 @@ class RuntimeService:
 
         start_time = time.time()
         logger.info(
-            f"⏳ Waiting for runtime to be alive: {runtime_url} (timeout: {timeout}s, interval: {check_interval}s)"
+            "⏳ Waiting for runtime to be alive: %s (timeout: %ss, interval: %ss)",
+            runtime_url,
+            timeout,
+            check_interval,
         )
 
         while time.time() - start_time < timeout:
@@ -439,21 +453,27 @@ class RuntimeService:
 
             if success:
                 elapsed_time = int(time.time() - start_time)
-                logger.info(f"✅ Runtime is alive after {elapsed_time}s: {runtime_url}")
+                logger.info(
+                    "✅ Runtime is alive after %ss: %s", elapsed_time, runtime_url
+                )
                 return True, response
 
             # Log progress every 30 seconds to avoid spam
             elapsed_time = int(time.time() - start_time)
             if elapsed_time > 0 and elapsed_time % 30 == 0:
                 logger.info(
-                    f"🔄 Still waiting for runtime to be alive ({elapsed_time}s elapsed): {runtime_url}"
+                    "🔄 Still waiting for runtime to be alive (%ss elapsed): %s",
+                    elapsed_time,
+                    runtime_url,
                 )
 
             time.sleep(check_interval)
 
         elapsed_time = int(time.time() - start_time)
         logger.error(
-            f"⏰ Timeout waiting for runtime to be alive after {elapsed_time}s: {runtime_url}"
+            "⏰ Timeout waiting for runtime to be alive after %ss: %s",
+            elapsed_time,
+            runtime_url,
         )
         return False, {
             "error": f"Timeout waiting for runtime to be alive after {elapsed_time}s"
@@ -474,7 +494,7 @@ class RuntimeService:
             Tuple of (success: bool, response_data: Dict)
         """
         logger.info(
-            f"🔄 Handling agent reset for {user_uuid[:8]}.{app_slug}.{riff_slug}"
+            "🔄 Handling agent reset for %s.%s.%s", user_uuid[:8], app_slug, riff_slug
         )
 
         # First, check the current runtime status
@@ -492,18 +512,18 @@ class RuntimeService:
 
         if current_status == "paused" and runtime_id:
             # Runtime is paused, resume it
-            logger.info(f"▶️ Runtime is paused, resuming: {runtime_id}")
+            logger.info("▶️ Runtime is paused, resuming: %s", runtime_id)
             return self.resume_runtime(runtime_id)
         elif current_status in ["running", "starting"]:
             # Runtime is running or starting, wait for it to be ready and alive
             logger.info(
-                f"🔄 Runtime is {current_status}, waiting for it to be ready and alive"
+                "🔄 Runtime is %s, waiting for it to be ready and alive", current_status
             )
             return self.wait_for_runtime_ready_and_alive(user_uuid, app_slug, riff_slug)
         else:
             # Runtime is in an unexpected state, start a new one
             logger.info(
-                f"🆕 Runtime status is '{current_status}', starting new runtime"
+                "🆕 Runtime status is '%s', starting new runtime", current_status
             )
             return self.start_runtime(user_uuid, app_slug, riff_slug)
 
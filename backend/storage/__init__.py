@@ -6,7 +6,7 @@ Provides user-specific file-based storage for keys, apps, and riffs.
 from .base_storage import BaseStorage
 from .keys_storage import KeysStorage
 from .apps_storage import AppsStorage
-from .riffs_storage import RiffsStorage
+from .riffs_storage import RiffsStorage, flush_riff_updates
 
 
 # Convenience functions for backward compatibility and easy access
@@ -33,4 +33,5 @@ __all__ = [
     "get_keys_storage",
     "get_apps_storage",
     "get_riffs_storage",
+    "flush_riff_updates",
 ]
@@ -3,8 +3,8 @@ Apps storage class for OpenVibe backend.
 Handles user app data storage and management.
 """
 
+import bisect
 import logging
-import shutil
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -24,67 +24,130 @@ class AppsStorage(BaseStorage):
         """Get path to app.json file"""
         return self.get_app_dir_path(app_slug) / "app.json"
 
+    def get_index_file_path(self) -> Path:
+        """Get path to the name-ordered apps index"""
+        return self.user_dir / "apps" / "index.json"
+
+    @staticmethod
+    def _sort_key(app_data: Dict[str, Any]) -> str:
+        """Key apps are ordered by: case-insensitive name"""
+        return (app_data.get("name") or "").lower()
+
+    def _update_index(self, app_slug: str, app_data: Optional[Dict[str, Any]]) -> None:
+        """Insert, move or (when app_data is None) remove app_slug in the index"""
+        index_file = self.get_index_file_path()
+        with self.file_lock(index_file):
+            index = self.read_json_file(index_file)
+            if not isinstance(index, list):
+                # No index yet; list_apps rebuilds it from the app directories
+                return
+
+            index = [entry for entry in index if entry.get("slug") != app_slug]
+            if app_data is not None:
+                entry = {"slug": app_slug, "sort_key": self._sort_key(app_data)}
+                keys = [e.get("sort_key", "") for e in index]
+                index.insert(bisect.bisect_right(keys, entry["sort_key"]), entry)
+            self.write_json_file(index_file, index)
+
+    def _rebuild_index(self) -> List[Dict[str, Any]]:
+        """Scan app directories, sort the apps by name and persist the index"""
+        apps_dir = self.user_dir / "apps"
+        index_file = self.get_index_file_path()
+        # Hold the index lock across scan and write: save_app writes app.json
+        # before taking it, so a concurrent save is either seen by the scan or
+        # finds the new index in _update_index, never neither
+        with self.file_lock(index_file):
+            apps = []
+            for app_dir in apps_dir.iterdir():
+                if app_dir.is_dir():
+                    app_file = app_dir / "app.json"
+                    # A single stat() inside the read covers the missing-file case
+                    app_data = self.read_json_file_cached(app_file)
+                    if app_data is None:
+                        logger.debug("📋 No app.json found in %s", app_dir)
+                    elif isinstance(app_data, dict) and app_data:
+                        apps.append((app_dir.name, dict(app_data)))
+                    else:
+                        logger.warning("⚠️ Invalid app data in %s", app_file)
+
+            apps.sort(key=lambda item: self._sort_key(item[1]))
+            index = [
+                {"slug": slug, "sort_key": self._sort_key(app_data)}
+                for slug, app_data in apps
+            ]
+            self.write_json_file(index_file, index)
+        return [app_data for _, app_data in apps]
+
     def load_app(self, app_slug: str) -> Optional[Dict[str, Any]]:
         """Load specific app data"""
-        logger.debug(f"📱 Loading app: {app_slug} for user {self.user_uuid[:8]}...")
+        logger.debug("📱 Loading app: %s for user %s...", app_slug, self.user_uuid[:8])
 
         app_file = self.get_app_file_path(app_slug)
-        data = self.read_json_file(app_file)
+        data = self.read_json_file_cached(app_file)
 
         if data is None:
-            logger.debug(f"📱 App not found: {app_slug}")
+            logger.debug("📱 App not found: %s", app_slug)
             return None
 
         if not isinstance(data, dict):
-            logger.error(f"❌ Invalid app data format for {app_slug}")
+            logger.error("❌ Invalid app data format for %s", app_slug)
             return None
 
-        logger.debug(f"📱 Successfully loaded app: {app_slug}")
-        return data
+        logger.debug("📱 Successfully loaded app: %s", app_slug)
+        # Shallow copy so callers can't mutate the cached record
+        return dict(data)
 
     def save_app(self, app_slug: str, app_data: Dict[str, Any]) -> bool:
         """Save app data"""
-        logger.debug(f"💾 Saving app: {app_slug} for user {self.user_uuid[:8]}...")
+        logger.debug("💾 Saving app: %s for user %s...", app_slug, self.user_uuid[:8])
 
         app_file = self.get_app_file_path(app_slug)
         success = self.write_json_file(app_file, app_data)
+        self.invalidate_cached_file(app_file)
 
         if success:
-            logger.debug(f"✅ App saved successfully: {app_slug}")
+            self._update_index(app_slug, app_data)
+            logger.debug("✅ App saved successfully: %s", app_slug)
         else:
-            logger.error(f"❌ Failed to save app: {app_slug}")
+            logger.error("❌ Failed to save app: %s", app_slug)
 
         return success
 
     def list_apps(self) -> List[Dict[str, Any]]:
-        """List all apps for user"""
-        logger.debug(f"📋 Listing apps for user {self.user_uuid[:8]}...")
+        """List all apps for user, ordered alphabetically by name"""
+        logger.debug("📋 Listing apps for user %s...", self.user_uuid[:8])
 
-        apps_dir = self.user_dir / "apps"
-        if not apps_dir.exists():
-            logger.debug(
-                f"📋 Apps directory doesn't exist for user {self.user_uuid[:8]}"
-            )
-            return []
-
-        apps = []
         try:
-            for app_dir in apps_dir.iterdir():
-                if app_dir.is_dir():
-                    app_file = app_dir / "app.json"
-                    if app_file.exists():
-                        app_data = self.read_json_file(app_file)
-                        if app_data and isinstance(app_data, dict):
-                            apps.append(app_data)
-                        else:
-                            logger.warning(f"⚠️ Invalid app data in {app_file}")
-                    else:
-                        logger.debug(f"📋 No app.json found in {app_dir}")
+            # Apps are kept name-ordered in index.json at write time, so listing
+            # is a straight walk over the index with no per-request sort
+            index = self.read_json_file_cached(self.get_index_file_path())
+            if isinstance(index, list):
+                apps = []
+                for entry in index:
+                    app_data = self.read_json_file_cached(
+                        self.get_app_file_path(entry.get("slug", ""))
+                    )
+                    if not app_data or not isinstance(app_data, dict):
+                        logger.warning("⚠️ Stale apps index, rebuilding")
+                        break
+                    apps.append(dict(app_data))
+                else:
+                    logger.debug(
+                        "📋 Found %s apps for user %s", len(apps), self.user_uuid[:8]
+                    )
+                    return apps
+
+            if not (self.user_dir / "apps").is_dir():
+                logger.debug(
+                    "📋 Apps directory doesn't exist for user %s", self.user_uuid[:8]
+                )
+                return []
+            apps = self._rebuild_index()
         except Exception as e:
-            logger.error(f"❌ Error listing apps: {e}")
+            logger.error("❌ Error listing apps: %s", e)
             return []
 
-        logger.debug(f"📋 Found {len(apps)} apps for user {self.user_uuid[:8]}")
+        logger.debug("📋 Found %s apps for user %s", len(apps), self.user_uuid[:8])
         return apps
 
     def app_exists(self, app_slug: str) -> bool:
@@ -94,17 +157,19 @@ class AppsStorage(BaseStorage):
 
     def delete_app(self, app_slug: str) -> bool:
         """Delete app and all its data"""
-        logger.debug(f"🗑️ Deleting app: {app_slug} for user {self.user_uuid[:8]}...")
+        logger.debug("🗑️ Deleting app: %s for user %s...", app_slug, self.user_uuid[:8])
 
+        self.invalidate_cached_file(self.get_app_file_path(app_slug))
         app_dir = self.get_app_dir_path(app_slug)
         if not app_dir.exists():
-            logger.debug(f"🗑️ App directory doesn't exist: {app_slug}")
+            logger.debug("🗑️ App directory doesn't exist: %s", app_slug)
             return True  # Already deleted
 
         try:
-            shutil.rmtree(app_dir)
-            logger.debug(f"✅ App deleted successfully: {app_slug}")
+            self.remove_directory(app_dir)
+            self._update_index(app_slug, None)
+            logger.debug("✅ App deleted successfully: %s", app_slug)
             return True
         except Exception as e:
-            logger.error(f"❌ Failed to delete app {app_slug}: {e}")
+            logger.error("❌ Failed to delete app %s: %s", app_slug, e)
             return False
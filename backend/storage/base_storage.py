@@ -3,18 +3,77 @@ Base storage class for OpenVibe backend.
 Provides common file operations and utilities for all storage classes.
 """
 
-import json
 import logging
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import shutil
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 # Base data directory - configurable via environment variable
 DATA_DIR = Path(os.environ.get("DATA_DIR", "/data"))
 
+# Buffer size for line-by-line JSON Lines reads
+IO_BUFFER_SIZE = 64 * 1024
+
+# Maximum number of parsed JSON files kept in memory (least recently used evicted)
+JSON_CACHE_MAXSIZE = 2048
+
+# Parsed JSON keyed by file path, validated against (st_ino, st_mtime_ns, st_size)
+_json_cache: "OrderedDict[str, Tuple[Tuple[int, int, int], Any]]" = OrderedDict()
+_json_cache_lock = threading.Lock()
+
+# Per-file locks serializing read-modify-write updates within this process
+_file_locks: Dict[str, threading.RLock] = {}
+_file_locks_guard = threading.Lock()
+
+# Background pool removing deleted directory trees off the request thread
+_cleanup_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="storage-cleanup"
+)
+
+
+def _file_signature(st: os.stat_result) -> Tuple[int, int, int]:
+    """
+    Identify a version of a file for the parse cache.
+
+    Rewrites go through os.replace and so always get a new inode, which tells
+    same-size rewrites apart even within one coarse mtime tick.
+    """
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _invalidate_cache_entry(key: str) -> None:
+    """Drop the cached parse stored under key"""
+    with _json_cache_lock:
+        _json_cache.pop(key, None)
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse a single UTF-8 encoded JSON document"""
+    return orjson.loads(raw)
+
+
+def _append_record(records: List[Any], record: Any) -> List[Any]:
+    """Return a new list of records with record added at the end"""
+    return records + [record]
+
+
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize data to UTF-8 encoded JSON bytes, compact unless pretty is set"""
+    option = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, option=option)
+
 
 class BaseStorage:
     """Base storage class with common file operations"""
@@ -27,73 +86,273 @@ class BaseStorage:
         """Ensure directory exists"""
         try:
             path.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"📁 Directory ensured: {path}")
+            logger.debug("📁 Directory ensured: %s", path)
             return True
         except Exception as e:
-            logger.error(f"❌ Failed to create directory {path}: {e}")
+            logger.error("❌ Failed to create directory %s: %s", path, e)
             return False
 
     def read_json_file(self, file_path: Path) -> Optional[Any]:
         """Read JSON data from file"""
-        logger.debug(f"📖 Reading JSON file: {file_path}")
+        try:
+            # open() doubles as the existence check, so no separate stat();
+            # an unbuffered readall() sizes one bytes object for the whole file
+            with open(file_path, "rb", buffering=0) as f:
+                raw = f.read()
+        except FileNotFoundError:
+            logger.debug("📖 File doesn't exist: %s", file_path)
+            return None
+        except IOError as e:
+            logger.error("❌ Failed to read JSON file %s: %s", file_path, e)
+            return None
 
-        if not file_path.exists():
-            logger.debug(f"📖 File doesn't exist: {file_path}")
+        if not raw:
+            logger.debug("📖 Empty file: %s", file_path)
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                logger.debug(f"📖 File content length: {len(content)} characters")
+            # Hand the raw bytes straight to the parser
+            data = _loads(raw)
+            logger.debug("📖 Successfully loaded JSON from: %s", file_path)
+            return data
+
+        except ValueError as e:
+            logger.error("❌ Failed to read JSON file %s: %s", file_path, e)
+            return None
+
+    def read_json_lines_file(self, file_path: Path) -> Optional[List[Any]]:
+        """Read a JSON Lines file into a list, skipping blank or corrupt lines"""
+        records = []
+        try:
+            with open(file_path, "rb", buffering=IO_BUFFER_SIZE) as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(_loads(line))
+                    except ValueError as e:
+                        # e.g. a torn final line left by a crash mid-append
+                        logger.warning(
+                            "⚠️ Skipping corrupt line %d in %s: %s",
+                            line_number,
+                            file_path,
+                            e,
+                        )
+        except FileNotFoundError:
+            logger.debug("📖 File doesn't exist: %s", file_path)
+            return None
+        except IOError as e:
+            logger.error("❌ Failed to read JSON lines file %s: %s", file_path, e)
+            return None
 
-                if not content.strip():
-                    logger.debug(f"📖 Empty file: {file_path}")
-                    return None
+        logger.debug("📖 Loaded %d records from: %s", len(records), file_path)
+        return records
 
-                data = json.loads(content)
-                logger.debug(f"📖 Successfully loaded JSON from: {file_path}")
-                return data
+    def read_json_file_cached(
+        self,
+        file_path: Path,
+        reader: Optional[Callable[[Path], Optional[Any]]] = None,
+    ) -> Optional[Any]:
+        """
+        Read JSON data from file, reusing the parsed result while the file is unchanged.
 
-        except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"❌ Failed to read JSON file {file_path}: {e}")
+        reader parses the file on a cache miss (read_json_file by default).
+        The returned object is shared between callers and must not be mutated.
+        """
+        try:
+            st = file_path.stat()
+        except OSError:
+            _invalidate_cache_entry(str(file_path))
             return None
 
+        key = str(file_path)
+        signature = _file_signature(st)
+        with _json_cache_lock:
+            cached = _json_cache.get(key)
+            if cached is not None and cached[0] == signature:
+                _json_cache.move_to_end(key)
+                return cached[1]
+
+        # Parse outside the lock so slow reads don't block other files
+        data = (reader or self.read_json_file)(file_path)
+        with _json_cache_lock:
+            if data is None:
+                _json_cache.pop(key, None)
+            else:
+                _json_cache[key] = (signature, data)
+                _json_cache.move_to_end(key)
+                while len(_json_cache) > JSON_CACHE_MAXSIZE:
+                    _json_cache.popitem(last=False)
+        return data
+
+    def file_lock(self, file_path: Path) -> threading.RLock:
+        """
+        Get the lock guarding read-modify-write updates of file_path.
+
+        Hold it around any load -> mutate -> save sequence so concurrent
+        requests can't overwrite each other's changes.
+        """
+        key = str(file_path)
+        lock = _file_locks.get(key)
+        if lock is None:
+            with _file_locks_guard:
+                lock = _file_locks.setdefault(key, threading.RLock())
+        return lock
+
+    def remove_directory(self, path: Path) -> None:
+        """
+        Remove a directory tree without waiting for the deletion.
+
+        The tree is renamed into the user's .trash directory first, which is
+        atomic and makes it disappear from every lookup immediately; the
+        potentially slow rmtree (riff workspaces hold git clones) then runs
+        on a background thread.
+        """
+        trash_dir = self.user_dir / ".trash"
+        trash_dir.mkdir(parents=True, exist_ok=True)
+        target = trash_dir / f"{path.name}-{uuid.uuid4().hex}"
+        os.replace(path, target)
+        _cleanup_executor.submit(shutil.rmtree, target, ignore_errors=True)
+
+    def invalidate_cached_file(self, file_path: Path) -> None:
+        """Drop any cached parse of file_path"""
+        _invalidate_cache_entry(str(file_path))
+
     def write_json_file(
-        self, file_path: Path, data: Any, create_backup: bool = True
+        self,
+        file_path: Path,
+        data: Any,
+        create_backup: bool = False,
+        pretty: bool = False,
     ) -> bool:
         """Write JSON data to file with atomic operation"""
-        logger.debug(f"💾 Writing JSON file: {file_path}")
-
         # Ensure parent directory exists
         if not self.ensure_directory(file_path.parent):
             return False
 
+        # Backups are opt-in: the temp-file + os.replace write below
+        # already guarantees the previous version survives a failed write
+        if create_backup and file_path.exists():
+            backup_file = file_path.with_suffix(".json.backup")
+            logger.debug("💾 Creating backup: %s", backup_file)
+            try:
+                # The write below swaps in a new inode, so a hard link keeps
+                # the old version without copying its data
+                backup_file.unlink(missing_ok=True)
+                os.link(file_path, backup_file)
+            except OSError:
+                # Filesystems without hard links fall back to a full copy
+                try:
+                    shutil.copy2(file_path, backup_file)
+                except OSError as e:
+                    logger.error("❌ Failed to write JSON file %s: %s", file_path, e)
+                    return False
+
+        # Serialize compactly in one pass and write through a single buffer;
+        # pass pretty=True to get human-readable output when debugging
+        return self._write_atomic(file_path, _dumps(data, pretty))
+
+    def write_json_lines_file(self, file_path: Path, records: List[Any]) -> bool:
+        """Write records to a JSON Lines file (one compact document per line) atomically"""
+        if not self.ensure_directory(file_path.parent):
+            return False
+
+        return self._write_atomic(
+            file_path, b"".join(_dumps(record) + b"\n" for record in records)
+        )
+
+    def append_json_line(
+        self,
+        file_path: Path,
+        record: Any,
+        merge: Optional[Callable[[List[Any], Any], List[Any]]] = None,
+    ) -> bool:
+        """
+        Append one record to a JSON Lines file without rewriting it.
+
+        If the file's parsed records are cached and still current, the record
+        is folded into a new cached list (via merge(records, record), or at the
+        end) so the next read doesn't re-parse the whole file.
+
+        Callers that may race on the same file should hold file_lock(file_path).
+        """
+        if not self.ensure_directory(file_path.parent):
+            return False
+
+        line = _dumps(record) + b"\n"
         try:
-            # Create backup if file exists and backup is requested
-            if create_backup and file_path.exists():
-                backup_file = file_path.with_suffix(".json.backup")
-                logger.debug(f"💾 Creating backup: {backup_file}")
-                shutil.copy2(file_path, backup_file)
+            # Raw O_APPEND descriptor: the record and its newline reach the
+            # kernel in a single write() with no Python-level buffering
+            fd = os.open(file_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o666)
+            try:
+                # Start on a fresh line if a crash left a torn final record
+                st = os.fstat(fd)
+                if st.st_size and os.pread(fd, 1, st.st_size - 1) != b"\n":
+                    line = b"\n" + line
+                remaining = memoryview(line)
+                while remaining:
+                    written = os.write(fd, remaining)
+                    remaining = remaining[written:]
+                os.fsync(fd)
+                st_after = os.fstat(fd)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            _invalidate_cache_entry(str(file_path))
+            logger.error("❌ Failed to append to %s: %s", file_path, e)
+            return False
+
+        key = str(file_path)
+        with _json_cache_lock:
+            cached = _json_cache.get(key)
+            if (
+                cached is not None
+                and cached[0] == _file_signature(st)
+                and isinstance(cached[1], list)
+            ):
+                # The cache matched the file right before our write, so it
+                # plus this record is exactly what a re-parse would produce
+                records = (merge or _append_record)(cached[1], record)
+                _json_cache[key] = (_file_signature(st_after), records)
+            else:
+                _json_cache.pop(key, None)
+        logger.debug("💾 Appended %d bytes to: %s", len(line), file_path)
+        return True
 
-            # Write to temporary file first for atomic operation
-            temp_file = file_path.with_suffix(".tmp")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+    def _write_atomic(self, file_path: Path, payload: bytes) -> bool:
+        """Replace file_path with payload via a fsync'd temp file and os.replace"""
+        temp_path = None
+        try:
+            # Write to a uniquely named temporary file in the same directory
+            # so concurrent writers never share it, then atomically move it
+            fd, temp_path = tempfile.mkstemp(
+                dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+            )
+            # The payload is already one contiguous bytes object, so write it
+            # unbuffered instead of copying it through a fresh 64 KiB buffer
+            remaining = memoryview(payload)
+            with open(fd, "wb", buffering=0) as f:
+                while remaining:
+                    written = f.write(remaining)
+                    remaining = remaining[written:]
+                os.fsync(f.fileno())
 
             # Atomic move
-            temp_file.replace(file_path)
+            os.replace(temp_path, file_path)
+            _invalidate_cache_entry(str(file_path))
 
-            logger.debug(f"💾 Successfully wrote JSON to: {file_path}")
-            logger.debug(f"💾 File size: {file_path.stat().st_size} bytes")
+            # Report the size we just serialized rather than stat()-ing the file
+            logger.debug(
+                "💾 Successfully wrote JSON to: %s (%d bytes)", file_path, len(payload)
+            )
             return True
 
         except (IOError, OSError) as e:
-            logger.error(f"❌ Failed to write JSON file {file_path}: {e}")
+            logger.error("❌ Failed to write JSON file %s: %s", file_path, e)
             # Clean up temp file if it exists
-            temp_file = file_path.with_suffix(".tmp")
-            if temp_file.exists():
+            if temp_path and os.path.exists(temp_path):
                 try:
-                    temp_file.unlink()
+                    os.unlink(temp_path)
                 except Exception:
                     pass
             return False
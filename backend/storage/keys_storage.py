@@ -21,34 +21,35 @@ class KeysStorage(BaseStorage):
 
     def load_keys(self) -> Dict[str, str]:
         """Load user's API keys"""
-        logger.debug(f"🔑 Loading keys for user {self.user_uuid[:8]}...")
+        logger.debug("🔑 Loading keys for user %s...", self.user_uuid[:8])
 
         keys_file = self.get_keys_file_path()
-        data = self.read_json_file(keys_file)
+        data = self.read_json_file_cached(keys_file)
 
         if data is None:
-            logger.debug(f"🔑 No keys found for user {self.user_uuid[:8]}")
+            logger.debug("🔑 No keys found for user %s", self.user_uuid[:8])
             return {}
 
         if not isinstance(data, dict):
-            logger.error(f"❌ Invalid keys data format for user {self.user_uuid[:8]}")
+            logger.error("❌ Invalid keys data format for user %s", self.user_uuid[:8])
             return {}
 
-        logger.debug(f"🔑 Successfully loaded keys for providers: {list(data.keys())}")
-        return data
+        logger.debug("🔑 Successfully loaded keys for providers: %s", list(data.keys()))
+        # Shallow copy so callers can't mutate the cached keys
+        return dict(data)
 
     def save_keys(self, keys: Dict[str, str]) -> bool:
         """Save user's API keys"""
-        logger.debug(f"💾 Saving keys for user {self.user_uuid[:8]}...")
-        logger.debug(f"💾 Providers: {list(keys.keys())}")
+        logger.debug("💾 Saving keys for user %s...", self.user_uuid[:8])
+        logger.debug("💾 Providers: %s", list(keys.keys()))
 
         keys_file = self.get_keys_file_path()
         success = self.write_json_file(keys_file, keys)
 
         if success:
-            logger.debug(f"✅ Keys saved successfully for user {self.user_uuid[:8]}")
+            logger.debug("✅ Keys saved successfully for user %s", self.user_uuid[:8])
         else:
-            logger.error(f"❌ Failed to save keys for user {self.user_uuid[:8]}")
+            logger.error("❌ Failed to save keys for user %s", self.user_uuid[:8])
 
         return success
 
@@ -64,14 +65,16 @@ class KeysStorage(BaseStorage):
 
     def set_key(self, provider: str, api_key: str) -> bool:
         """Set API key for specific provider"""
-        keys = self.load_keys()
-        keys[provider] = api_key
-        return self.save_keys(keys)
+        with self.file_lock(self.get_keys_file_path()):
+            keys = self.load_keys()
+            keys[provider] = api_key
+            return self.save_keys(keys)
 
     def remove_key(self, provider: str) -> bool:
         """Remove API key for specific provider"""
-        keys = self.load_keys()
-        if provider in keys:
-            del keys[provider]
-            return self.save_keys(keys)
+        with self.file_lock(self.get_keys_file_path()):
+            keys = self.load_keys()
+            if provider in keys:
+                del keys[provider]
+                return self.save_keys(keys)
         return True  # Key doesn't exist, consider it removed
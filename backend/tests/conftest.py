@@ -44,6 +44,21 @@ def mock_requests(monkeypatch):
     monkeypatch.setattr(requests, "delete", mock_delete)
     monkeypatch.setattr(requests, "put", mock_put)
 
+    # Patch requests.Session methods used by the shared sessions
+    # in utils.http_sessions
+    monkeypatch.setattr(
+        requests.Session, "get", lambda self, url, **kw: mock_get(url, **kw)
+    )
+    monkeypatch.setattr(
+        requests.Session, "post", lambda self, url, **kw: mock_post(url, **kw)
+    )
+    monkeypatch.setattr(
+        requests.Session, "delete", lambda self, url, **kw: mock_delete(url, **kw)
+    )
+    monkeypatch.setattr(
+        requests.Session, "put", lambda self, url, **kw: mock_put(url, **kw)
+    )
+
 
 @pytest.fixture(scope="function")
 def temp_data_dir():
@@ -27,6 +27,22 @@ class TestAppsEndpoints:
         assert data["apps"] == []
         assert data["count"] == 0
 
+    def test_get_apps_not_modified(self, client):
+        """Test that an unchanged app list is answered with 304"""
+        unique_headers = {
+            "X-User-UUID": "test-get-apps-not-modified-uuid",
+            "Content-Type": "application/json",
+        }
+        response = client.get("/api/apps", headers=unique_headers)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = client.get(
+            "/api/apps", headers={**unique_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.data == b""
+
     def test_get_apps_missing_uuid_header(self, client):
         """Test getting apps without UUID header"""
         response = client.get("/api/apps")
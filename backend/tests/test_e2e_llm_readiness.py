@@ -115,6 +115,27 @@ class TestLLMReadinessEndpoints:
         # In mock mode with proper API keys, LLM should be ready after creation
         assert data["ready"] is True
 
+    def test_check_riff_ready_is_cacheable(self, client, mock_api_keys):
+        """Test that readiness polls carry cache headers and revalidate to 304"""
+        unique_headers = {
+            "X-User-UUID": "test-ready-cacheable-uuid",
+            "Content-Type": "application/json",
+        }
+        app_slug, riff_slug = self.setup_app_and_riff_for_llm_tests(
+            client, unique_headers, mock_api_keys, "ready-cacheable-app"
+        )
+        url = f"/api/apps/{app_slug}/riffs/{riff_slug}/ready"
+
+        response = client.get(url, headers=unique_headers)
+        assert response.status_code == 200
+        assert response.cache_control.private is True
+        assert response.cache_control.max_age == 2
+
+        response = client.get(
+            url, headers={**unique_headers, "If-None-Match": response.headers["ETag"]}
+        )
+        assert response.status_code == 304
+
     def test_check_riff_ready_without_api_keys(self, client):
         """Test checking riff readiness without setting up API keys first"""
         unique_headers = {
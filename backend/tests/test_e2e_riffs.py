@@ -3,6 +3,7 @@ End-to-end tests for riffs endpoints.
 Tests riff creation, listing, and management within apps.
 """
 
+import json
 import os
 
 
@@ -265,6 +266,52 @@ class TestRiffsEndpoints:
         # Also check for the automatic rename riff
         assert f"rename-to-{app_slug}" in riff_slugs
 
+    def test_get_messages_as_ndjson(self, client, mock_api_keys):
+        """Test that messages stream as NDJSON when the client asks for it"""
+        unique_headers = {
+            "X-User-UUID": "test-messages-ndjson-uuid",
+            "Content-Type": "application/json",
+        }
+        app_slug = self.setup_app_for_riffs(
+            client, unique_headers, mock_api_keys, "ndjson-app"
+        )
+        response = client.post(
+            f"/api/apps/{app_slug}/riffs",
+            headers=unique_headers,
+            json={"slug": "ndjson-riff"},
+        )
+        assert response.status_code == 201
+
+        # Non-chat message types don't wake the agent
+        for content in ["first", "second"]:
+            response = client.post(
+                f"/api/apps/{app_slug}/riffs/messages",
+                headers=unique_headers,
+                json={"riff_slug": "ndjson-riff", "content": content, "type": "file"},
+            )
+            assert response.status_code == 201
+
+        url = f"/api/apps/{app_slug}/riffs/ndjson-riff/messages"
+        response = client.get(
+            url, headers={**unique_headers, "Accept": "application/x-ndjson"}
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        lines = response.get_data(as_text=True).splitlines()
+        assert [json.loads(line)["content"] for line in lines] == ["first", "second"]
+
+        # JSON stays the default, including when NDJSON is only a fallback
+        for accept in [None, "application/json, application/x-ndjson;q=0.5"]:
+            headers = dict(unique_headers)
+            if accept:
+                headers["Accept"] = accept
+            response = client.get(url, headers=headers)
+            assert response.status_code == 200
+            assert response.mimetype == "application/json"
+            data = response.get_json()
+            assert data["count"] == 2
+            assert [m["content"] for m in data["messages"]] == ["first", "second"]
+
     def test_riff_slug_validation(self, client, mock_api_keys):
         """Test that riff slugs are validated correctly"""
         unique_headers = {
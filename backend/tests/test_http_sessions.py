@@ -0,0 +1,108 @@
+"""
+Tests for the shared HTTP session helpers.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from utils.http_sessions import conditional_get_json
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code, data=None, etag=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = {"ETag": etag} if etag else {}
+
+    def json(self):
+        return self._data
+
+
+class FakeSession:
+    """Session replaying canned responses and recording request headers"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(dict(headers))
+        return self.responses.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def etag_cache():
+    """Give each test an empty ETag cache"""
+    with patch.dict("utils.http_sessions._etag_cache", clear=True) as cache:
+        yield cache
+
+
+URL = "https://api.github.com/repos/owner/repo/commits/main"
+HEADERS = {"Authorization": "token one"}
+
+
+class TestConditionalGetJson:
+    """Test conditional_get_json"""
+
+    def test_304_reuses_cached_body(self):
+        """Test that a revalidated resource returns the cached body"""
+        session = FakeSession(
+            FakeResponse(200, {"sha": "abc"}, etag='"v1"'), FakeResponse(304)
+        )
+
+        ok, _, data = conditional_get_json(session, URL, HEADERS)
+        assert (ok, data) == (True, {"sha": "abc"})
+        ok, response, data = conditional_get_json(session, URL, HEADERS)
+
+        assert ok is True
+        assert response.status_code == 304
+        assert data == {"sha": "abc"}
+        assert "If-None-Match" not in session.sent_headers[0]
+        assert session.sent_headers[1]["If-None-Match"] == '"v1"'
+
+    def test_changed_resource_replaces_cached_body(self):
+        """Test that a fresh 200 updates the cached ETag and body"""
+        session = FakeSession(
+            FakeResponse(200, {"sha": "abc"}, etag='"v1"'),
+            FakeResponse(200, {"sha": "def"}, etag='"v2"'),
+            FakeResponse(304),
+        )
+
+        conditional_get_json(session, URL, HEADERS)
+        assert conditional_get_json(session, URL, HEADERS)[2] == {"sha": "def"}
+        assert conditional_get_json(session, URL, HEADERS)[2] == {"sha": "def"}
+        assert session.sent_headers[2]["If-None-Match"] == '"v2"'
+
+    def test_entries_are_keyed_by_authorization(self):
+        """Test that one token's cached body is never revalidated by another"""
+        session = FakeSession(
+            FakeResponse(200, {"private": True}, etag='"v1"'),
+            FakeResponse(404),
+        )
+
+        conditional_get_json(session, URL, HEADERS)
+        ok, _, data = conditional_get_json(session, URL, {"Authorization": "token two"})
+
+        assert (ok, data) == (False, None)
+        assert "If-None-Match" not in session.sent_headers[1]
+
+    def test_tokens_are_not_stored_in_plaintext(self, etag_cache):
+        """Test that the cache key holds a hash of the Authorization header"""
+        session = FakeSession(FakeResponse(200, {}, etag='"v1"'))
+
+        conditional_get_json(session, URL, HEADERS)
+
+        assert "token one" not in repr(list(etag_cache))
+
+    def test_errors_and_untagged_responses_are_not_cached(self, etag_cache):
+        """Test that only 200 responses with an ETag are remembered"""
+        session = FakeSession(FakeResponse(500), FakeResponse(200, {"sha": "abc"}))
+
+        ok, _, data = conditional_get_json(session, URL, HEADERS)
+        assert (ok, data) == (False, None)
+        ok, _, data = conditional_get_json(session, URL, HEADERS)
+        assert (ok, data) == (True, {"sha": "abc"})
+        assert etag_cache == {}
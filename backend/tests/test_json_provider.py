@@ -0,0 +1,69 @@
+"""
+Tests for the orjson-backed Flask JSON provider.
+"""
+
+import json
+import math
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask, jsonify, request
+
+from utils.json_provider import ORJSONProvider
+
+
+@pytest.fixture
+def app():
+    """Flask app configured like the production app"""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    app.json.sort_keys = False
+    app.json.compact = True
+    return app
+
+
+class TestORJSONProvider:
+    """Test ORJSONProvider"""
+
+    def test_jsonify_is_compact_and_keeps_key_order(self, app):
+        """Test that responses are compact, unsorted and newline-terminated"""
+        with app.app_context():
+            response = jsonify({"b": 1, "a": [1, 2]})
+
+        assert response.mimetype == "application/json"
+        assert response.get_data() == b'{"b":1,"a":[1,2]}\n'
+
+    def test_jsonify_matches_stdlib_for_datetimes(self, app):
+        """Test that datetimes are rendered as HTTP dates like Flask's default"""
+        value = {"at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)}
+        with app.app_context():
+            response = jsonify(value)
+
+        assert response.get_json() == {"at": "Thu, 02 Jan 2025 03:04:05 GMT"}
+
+    def test_jsonify_falls_back_for_big_integers(self, app):
+        """Test that values orjson can't encode still serialize"""
+        with app.app_context():
+            response = jsonify({"n": 2**70})
+
+        assert json.loads(response.get_data()) == {"n": 2**70}
+
+    def test_dumps_and_loads_round_trip(self, app):
+        """Test dumps/loads, including the stdlib fallbacks"""
+        assert app.json.dumps({"a": 1}) == '{"a":1}'
+        assert app.json.dumps({"a": 1}, indent=2) == json.dumps({"a": 1}, indent=2)
+        assert app.json.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        assert math.isnan(app.json.loads("[NaN]")[0])
+
+        with pytest.raises(ValueError):
+            app.json.loads("{not json")
+
+    def test_request_get_json(self, app):
+        """Test that request bodies are parsed through the provider"""
+
+        @app.route("/echo", methods=["POST"])
+        def echo():
+            return jsonify(request.get_json())
+
+        response = app.test_client().post("/echo", json={"message": "hi"})
+        assert response.get_json() == {"message": "hi"}
@@ -0,0 +1,52 @@
+"""
+Tests for the repository utilities.
+"""
+
+import re
+
+import pytest
+
+from utils.repository import parse_github_url
+
+# The pattern parse_github_url replaced in the status helpers
+GITHUB_URL_PATTERN = r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$"
+
+URLS = [
+    "https://github.com/owner/repo",
+    "https://github.com/owner/repo/",
+    "https://github.com/owner/repo.git",
+    "https://github.com/owner/repo.git/",
+    "https://github.com/owner/my.repo",
+    "https://github.com/owner/repo/tree/main",
+    "https://github.com/owner/repo/pull/1",
+    "https://github.com/owner",
+    "https://github.com/owner/",
+    "https://github.com//repo",
+    "https://github.com/",
+    "http://github.com/owner/repo",
+    "https://gitlab.com/owner/repo",
+    "git@github.com:owner/repo.git",
+]
+
+
+class TestParseGithubUrl:
+    """Test parse_github_url"""
+
+    @pytest.mark.parametrize("url", URLS)
+    def test_matches_previous_regex(self, url):
+        """Test that the parser accepts exactly what the old regex accepted"""
+        match = re.match(GITHUB_URL_PATTERN, url)
+        assert parse_github_url(url) == (match.groups() if match else None)
+
+    def test_parses_owner_and_repo(self):
+        """Test the common URL forms"""
+        assert parse_github_url("https://github.com/owner/repo") == ("owner", "repo")
+        assert parse_github_url("https://github.com/owner/repo.git") == (
+            "owner",
+            "repo",
+        )
+
+    @pytest.mark.parametrize("url", [None, ""])
+    def test_missing_url(self, url):
+        """Test that missing URLs are rejected"""
+        assert parse_github_url(url) is None
@@ -2,14 +2,17 @@
 Tests for the storage classes.
 """
 
+import os
 import pytest
 import tempfile
 import shutil
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
 from storage import KeysStorage, AppsStorage, RiffsStorage
 from storage import get_keys_storage, get_apps_storage, get_riffs_storage
+from storage import flush_riff_updates
 
 
 @pytest.fixture
@@ -18,7 +21,7 @@ def temp_data_dir():
     temp_dir = tempfile.mkdtemp()
     with patch("storage.base_storage.DATA_DIR", Path(temp_dir)):
         yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 @pytest.fixture
@@ -129,6 +132,48 @@ class TestAppsStorage:
         assert app1 in apps
         assert app2 in apps
 
+    def test_list_apps_sorted_by_name(self, temp_data_dir, test_uuid):
+        """Test that apps are listed alphabetically across saves and deletes"""
+        storage = AppsStorage(test_uuid)
+
+        storage.save_app("zeta", {"name": "zeta", "slug": "zeta"})
+        storage.save_app("alpha", {"name": "Alpha", "slug": "alpha"})
+        assert [a["slug"] for a in storage.list_apps()] == ["alpha", "zeta"]
+
+        # Index is maintained incrementally once it exists
+        storage.save_app("beta", {"name": "beta", "slug": "beta"})
+        storage.save_app("alpha", {"name": "Omega", "slug": "alpha"})
+        assert [a["slug"] for a in storage.list_apps()] == ["beta", "alpha", "zeta"]
+
+        storage.delete_app("beta")
+        assert [a["slug"] for a in storage.list_apps()] == ["alpha", "zeta"]
+
+    def test_app_saved_during_index_rebuild_is_listed(self, temp_data_dir, test_uuid):
+        """Test that an app saved while the index is rebuilt isn't lost"""
+        storage = AppsStorage(test_uuid)
+        storage.save_app("alpha", {"name": "alpha", "slug": "alpha"})
+        index_file = storage.get_index_file_path()
+
+        saver = threading.Thread(
+            target=AppsStorage(test_uuid).save_app,
+            args=("beta", {"name": "beta", "slug": "beta"}),
+        )
+        write_json_file = storage.write_json_file
+
+        def racing_write(file_path, *args, **kwargs):
+            if file_path == index_file and saver.ident is None:
+                # The scan is done; another request saves an app before the
+                # index lands on disk
+                saver.start()
+                saver.join(0.2)
+            return write_json_file(file_path, *args, **kwargs)
+
+        with patch.object(storage, "write_json_file", side_effect=racing_write):
+            storage.list_apps()
+        saver.join()
+
+        assert [a["slug"] for a in storage.list_apps()] == ["alpha", "beta"]
+
     def test_delete_app(self, temp_data_dir, test_uuid):
         """Test deleting an app"""
         storage = AppsStorage(test_uuid)
@@ -142,6 +187,34 @@ class TestAppsStorage:
         assert storage.delete_app("test-app") is True
         assert storage.app_exists("test-app") is False
 
+    def test_load_app_reflects_updates(self, temp_data_dir, test_uuid):
+        """Test that cached app reads pick up saved changes"""
+        storage = AppsStorage(test_uuid)
+
+        storage.save_app("test-app", {"name": "Test App", "slug": "test-app"})
+        loaded = storage.load_app("test-app")
+        loaded["name"] = "Mutated"
+
+        # Mutating a loaded app must not leak into later reads
+        assert storage.load_app("test-app")["name"] == "Test App"
+
+        storage.save_app("test-app", {"name": "Renamed", "slug": "test-app"})
+        assert storage.load_app("test-app")["name"] == "Renamed"
+        assert storage.list_apps() == [{"name": "Renamed", "slug": "test-app"}]
+
+    def test_write_with_backup_keeps_previous_version(self, temp_data_dir, test_uuid):
+        """Test that create_backup preserves the version being replaced"""
+        storage = AppsStorage(test_uuid)
+        app_file = storage.get_app_file_path("test-app")
+
+        storage.write_json_file(app_file, {"version": 1})
+        storage.write_json_file(app_file, {"version": 2}, create_backup=True)
+        storage.write_json_file(app_file, {"version": 3}, create_backup=True)
+
+        backup_file = app_file.with_suffix(".json.backup")
+        assert storage.read_json_file(backup_file) == {"version": 2}
+        assert storage.read_json_file(app_file) == {"version": 3}
+
 
 class TestRiffsStorage:
     """Test RiffsStorage class"""
@@ -194,6 +267,52 @@ class TestRiffsStorage:
         assert riff1 in riffs
         assert riff2 in riffs
 
+    def test_list_riffs_newest_first(self, temp_data_dir, test_uuid):
+        """Test that riffs are listed newest first across saves and deletes"""
+        storage = RiffsStorage(test_uuid)
+
+        storage.save_riff("test-app", "old", {"slug": "old", "created_at": "1"})
+        storage.save_riff("test-app", "new", {"slug": "new", "created_at": "3"})
+        assert [r["slug"] for r in storage.list_riffs("test-app")] == ["new", "old"]
+
+        # Index is maintained incrementally once it exists
+        storage.save_riff("test-app", "mid", {"slug": "mid", "created_at": "2"})
+        storage.update_riff("test-app", "old", {"message_count": 1})
+        assert [r["slug"] for r in storage.list_riffs("test-app")] == [
+            "new",
+            "mid",
+            "old",
+        ]
+
+        storage.delete_riff("test-app", "mid")
+        assert [r["slug"] for r in storage.list_riffs("test-app")] == ["new", "old"]
+
+    def test_riff_saved_during_index_rebuild_is_listed(self, temp_data_dir, test_uuid):
+        """Test that a riff saved while the index is rebuilt isn't lost"""
+        storage = RiffsStorage(test_uuid)
+        storage.save_riff("test-app", "a", {"slug": "a", "created_at": "1"})
+        index_file = storage.get_index_file_path("test-app")
+
+        saver = threading.Thread(
+            target=RiffsStorage(test_uuid).save_riff,
+            args=("test-app", "b", {"slug": "b", "created_at": "2"}),
+        )
+        write_json_file = storage.write_json_file
+
+        def racing_write(file_path, *args, **kwargs):
+            if file_path == index_file and saver.ident is None:
+                # The scan is done; another request saves a riff before the
+                # index lands on disk
+                saver.start()
+                saver.join(0.2)
+            return write_json_file(file_path, *args, **kwargs)
+
+        with patch.object(storage, "write_json_file", side_effect=racing_write):
+            storage.list_riffs("test-app")
+        saver.join()
+
+        assert [r["slug"] for r in storage.list_riffs("test-app")] == ["b", "a"]
+
     def test_delete_riff(self, temp_data_dir, test_uuid):
         """Test deleting a riff"""
         storage = RiffsStorage(test_uuid)
@@ -207,6 +326,187 @@ class TestRiffsStorage:
         assert storage.delete_riff("test-app", "test-riff") is True
         assert storage.riff_exists("test-app", "test-riff") is False
 
+    def test_cached_messages_reflect_updates(self, temp_data_dir, test_uuid):
+        """Test that cached message reads pick up appended messages"""
+        storage = RiffsStorage(test_uuid)
+
+        storage.add_message("test-app", "test-riff", {"id": "1"})
+        messages = storage.load_messages("test-app", "test-riff")
+        messages.append({"id": "local"})
+
+        # Mutating a loaded list must not leak into later reads
+        assert storage.load_messages("test-app", "test-riff") == [{"id": "1"}]
+
+        storage.add_message("test-app", "test-riff", {"id": "2"})
+        assert storage.load_messages("test-app", "test-riff") == [
+            {"id": "1"},
+            {"id": "2"},
+        ]
+
+    def test_cached_riff_detects_same_size_rewrite(self, temp_data_dir, test_uuid):
+        """Test that a same-size rewrite within one mtime tick isn't served stale"""
+        storage = RiffsStorage(test_uuid)
+        storage.save_riff("test-app", "test-riff", {"message_count": 1})
+        assert storage.load_riff("test-app", "test-riff") == {"message_count": 1}
+
+        # Replace the file behind the cache's back, as another process would,
+        # and pin the old timestamp to mimic a coarse-grained filesystem
+        riff_file = storage.get_riff_file_path("test-app", "test-riff")
+        st = riff_file.stat()
+        temp_file = riff_file.with_name("riff.json.tmp")
+        temp_file.write_bytes(b'{"message_count":2}')
+        os.replace(temp_file, riff_file)
+        os.utime(riff_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert riff_file.stat().st_size == st.st_size
+
+        assert storage.load_riff("test-app", "test-riff") == {"message_count": 2}
+
+    def test_add_message_migrates_legacy_messages(self, temp_data_dir, test_uuid):
+        """Test that legacy messages.json is carried into the JSONL log"""
+        storage = RiffsStorage(test_uuid)
+        legacy_file = storage.get_messages_file_path("test-app", "test-riff")
+        storage.write_json_file(legacy_file, [{"id": "old"}])
+
+        assert storage.load_messages("test-app", "test-riff") == [{"id": "old"}]
+
+        storage.add_message("test-app", "test-riff", {"id": "new"})
+        assert not legacy_file.exists()
+        assert storage.load_messages("test-app", "test-riff") == [
+            {"id": "old"},
+            {"id": "new"},
+        ]
+
+    def test_torn_message_line_is_skipped(self, temp_data_dir, test_uuid):
+        """Test that a partially written last line doesn't break the log"""
+        storage = RiffsStorage(test_uuid)
+        storage.add_message("test-app", "test-riff", {"id": "1"})
+
+        log_file = storage.get_messages_log_path("test-app", "test-riff")
+        with open(log_file, "ab") as f:
+            f.write(b'{"id": "tor')
+
+        storage.add_message("test-app", "test-riff", {"id": "2"})
+        assert storage.load_messages("test-app", "test-riff") == [
+            {"id": "1"},
+            {"id": "2"},
+        ]
+
+    def test_messages_load_oldest_first(self, temp_data_dir, test_uuid):
+        """Test that messages come back in creation order regardless of log order"""
+        storage = RiffsStorage(test_uuid)
+        for message_id, created_at in [("b", "2025-01-02"), ("a", "2025-01-01")]:
+            storage.add_message(
+                "test-app", "test-riff", {"id": message_id, "created_at": created_at}
+            )
+
+        messages = storage.load_messages("test-app", "test-riff")
+        assert [message["id"] for message in messages] == ["a", "b"]
+
+    def test_add_message_updates_cached_messages(self, temp_data_dir, test_uuid):
+        """Test that appends are folded into cached messages without a re-parse"""
+        storage = RiffsStorage(test_uuid)
+        storage.add_message("test-app", "test-riff", {"id": "b", "created_at": "2"})
+        storage.load_messages("test-app", "test-riff")
+
+        with patch.object(storage, "read_json_lines_file") as read:
+            storage.add_message("test-app", "test-riff", {"id": "c", "created_at": "3"})
+            storage.add_message("test-app", "test-riff", {"id": "a", "created_at": "1"})
+            messages = storage.load_messages("test-app", "test-riff")
+
+        read.assert_not_called()
+        assert [message["id"] for message in messages] == ["a", "b", "c"]
+
+    def test_concurrent_add_message_keeps_all(self, temp_data_dir, test_uuid):
+        """Test that concurrent message appends don't overwrite each other"""
+        storage = RiffsStorage(test_uuid)
+
+        def add_messages(worker):
+            for i in range(10):
+                storage.add_message("test-app", "test-riff", {"id": f"{worker}-{i}"})
+
+        threads = [threading.Thread(target=add_messages, args=(w,)) for w in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(storage.load_messages("test-app", "test-riff")) == 80
+
+    def test_commit_message_updates_riff_stats(self, temp_data_dir, test_uuid):
+        """Test that committing messages keeps the riff's message stats"""
+        storage = RiffsStorage(test_uuid)
+        storage.save_riff("test-app", "test-riff", {"slug": "test-riff"})
+
+        for i in range(3):
+            message = {"id": str(i), "created_at": f"2025-01-0{i + 1}"}
+            assert storage.commit_message("test-app", "test-riff", message) is True
+        flush_riff_updates()
+
+        riff = storage.load_riff("test-app", "test-riff")
+        assert riff["message_count"] == 3
+        assert riff["last_message_at"] == "2025-01-03"
+        assert len(storage.load_messages("test-app", "test-riff")) == 3
+
+    def test_deferred_riff_updates_are_bounded(self, temp_data_dir, test_uuid):
+        """Test that producers wait for the writer once the queue is full"""
+        storage = RiffsStorage(test_uuid)
+        for i in range(5):
+            storage.save_riff("test-app", f"riff-{i}", {"slug": f"riff-{i}"})
+
+        with patch("storage.riffs_storage.RIFF_WRITER_MAX_PENDING", 1):
+            for i in range(5):
+                storage.update_riff_deferred("test-app", f"riff-{i}", {"n": i})
+            flush_riff_updates()
+
+        for i in range(5):
+            assert storage.load_riff("test-app", f"riff-{i}")["n"] == i
+
+    def test_delete_riff_waits_for_inflight_update(self, temp_data_dir, test_uuid):
+        """Test that an update racing a delete can't recreate the riff"""
+        storage = RiffsStorage(test_uuid)
+        storage.save_riff("test-app", "test-riff", {"slug": "test-riff"})
+        storage.list_riffs("test-app")  # build the index
+
+        loaded = threading.Event()
+        load_riff = storage.load_riff
+
+        def slow_load_riff(*args):
+            riff = load_riff(*args)
+            loaded.set()
+            threading.Event().wait(0.2)  # give delete_riff a chance to run
+            return riff
+
+        with patch.object(storage, "load_riff", side_effect=slow_load_riff):
+            updater = threading.Thread(
+                target=storage.update_riff,
+                args=("test-app", "test-riff", {"message_count": 1}),
+            )
+            updater.start()
+            loaded.wait()
+            assert storage.delete_riff("test-app", "test-riff") is True
+            updater.join()
+
+        assert not storage.riff_exists("test-app", "test-riff")
+        assert storage.list_riffs("test-app") == []
+
+    def test_deferred_riff_updates_are_merged(self, temp_data_dir, test_uuid):
+        """Test that queued riff updates are all applied by the writer"""
+        storage = RiffsStorage(test_uuid)
+        storage.save_riff("test-app", "test-riff", {"slug": "test-riff"})
+
+        for count in range(1, 6):
+            storage.update_riff_deferred(
+                "test-app", "test-riff", {"message_count": count}
+            )
+        storage.update_riff_deferred("test-app", "test-riff", {"last_message_at": "t"})
+        flush_riff_updates()
+
+        assert storage.load_riff("test-app", "test-riff") == {
+            "slug": "test-riff",
+            "message_count": 5,
+            "last_message_at": "t",
+        }
+
 
 class TestConvenienceFunctions:
     """Test convenience functions"""
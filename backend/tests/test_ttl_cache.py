@@ -0,0 +1,187 @@
+"""
+Tests for the ttl_cache decorator.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+from utils.ttl_cache import ttl_cache
+
+
+class TestTTLCache:
+    """Test ttl_cache"""
+
+    def test_results_are_reused_until_expiry(self):
+        """Test that results are cached per arguments until the TTL passes"""
+        calls = []
+
+        @ttl_cache(10)
+        def lookup(name):
+            calls.append(name)
+            return {"name": name}
+
+        with patch("utils.ttl_cache.time.monotonic", return_value=100.0):
+            assert lookup("a") == {"name": "a"}
+            assert lookup("a") == {"name": "a"}
+            assert lookup("b") == {"name": "b"}
+        assert calls == ["a", "b"]
+
+        with patch("utils.ttl_cache.time.monotonic", return_value=109.9):
+            lookup("a")
+        assert calls == ["a", "b"]
+
+        with patch("utils.ttl_cache.time.monotonic", return_value=110.0):
+            lookup("a")
+        assert calls == ["a", "b", "a"]
+
+    def test_none_results_are_not_cached(self):
+        """Test that None (an error signal) is retried on the next call"""
+        calls = []
+
+        @ttl_cache(60)
+        def lookup(name):
+            calls.append(name)
+            return None
+
+        assert lookup("a") is None
+        assert lookup("a") is None
+        assert calls == ["a", "a"]
+
+    def test_invalidate_drops_one_entry(self):
+        """Test that invalidate(*args) only forgets the matching call"""
+        calls = []
+
+        @ttl_cache(60)
+        def lookup(name, token):
+            calls.append(name)
+            return name
+
+        lookup("a", "token")
+        lookup("b", "token")
+        lookup.invalidate("a", "token")
+        lookup("a", "token")
+        lookup("b", "token")
+        assert calls == ["a", "b", "a"]
+
+        lookup.cache_clear()
+        lookup("b", "token")
+        assert calls == ["a", "b", "a", "b"]
+
+    def test_maxsize_evicts_oldest(self):
+        """Test that the cache never holds more than maxsize entries"""
+        calls = []
+
+        @ttl_cache(60, maxsize=2)
+        def lookup(name):
+            calls.append(name)
+            return name
+
+        for name in ["a", "b", "c", "b", "a"]:
+            lookup(name)
+        assert calls == ["a", "b", "c", "a"]
+
+    def test_concurrent_misses_share_one_call(self):
+        """Test that concurrent misses for the same arguments call once"""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        @ttl_cache(60)
+        def lookup(name):
+            calls.append(name)
+            started.set()
+            release.wait(5)
+            return {"name": name}
+
+        results = []
+
+        def worker():
+            results.append(lookup("a"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)  # let the other callers reach the in-flight call
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["a"]
+        assert results == [{"name": "a"}] * 8
+
+    def test_exception_reaches_waiters_without_poisoning(self):
+        """Test that a failed call raises in every waiter and is then retried"""
+        started = threading.Event()
+        release = threading.Event()
+        fail = True
+        calls = []
+
+        @ttl_cache(60)
+        def lookup(name):
+            calls.append(name)
+            started.set()
+            release.wait(5)
+            if fail:
+                raise RuntimeError("upstream down")
+            return name
+
+        errors = []
+
+        def worker():
+            try:
+                lookup("a")
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)  # let the other callers reach the in-flight call
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["a"]
+        assert len(errors) == 4
+        assert all(str(e) == "upstream down" for e in errors)
+
+        fail = False
+        assert lookup("a") == "a"
+
+    def test_keyword_arguments_are_part_of_the_key(self):
+        """Test that keyword arguments are accepted and keyed by name and value"""
+        calls = []
+
+        @ttl_cache(60)
+        def lookup(name, branch="main", search_by_base=False):
+            calls.append((name, branch, search_by_base))
+            return name
+
+        assert lookup("a", branch="dev", search_by_base=True) == "a"
+        lookup("a", search_by_base=True, branch="dev")
+        assert calls == [("a", "dev", True)]
+
+        lookup("a", branch="main")
+        lookup("a", "dev", True)
+        assert calls == [("a", "dev", True), ("a", "main", False), ("a", "dev", True)]
+
+    def test_invalidate_with_keyword_arguments(self):
+        """Test that invalidate(**kwargs) forgets the matching keyword call"""
+        calls = []
+
+        @ttl_cache(60)
+        def lookup(name, branch="main"):
+            calls.append(branch)
+            return branch
+
+        lookup("a", branch="dev")
+        lookup("a", branch="prod")
+        lookup.invalidate("a", branch="dev")
+        lookup("a", branch="dev")
+        lookup("a", branch="prod")
+        assert calls == ["dev", "prod", "dev"]
@@ -3,12 +3,19 @@ Shared utility functions for checking deployment status via GitHub Actions.
 """
 
 import requests
-import re
 import logging
 
+from utils.http_sessions import github_session
+from utils.repository import parse_github_url
+from utils.ttl_cache import ttl_cache
+
 logger = logging.getLogger(__name__)
 
+# Seconds a deployment status is reused for repeat polls of the same branch
+DEPLOYMENT_STATUS_CACHE_TTL = 5
+
 
+@ttl_cache(DEPLOYMENT_STATUS_CACHE_TTL)
 def get_deployment_status(repo_url, github_token, branch_name):
     """
     Get deployment status by checking GitHub Actions for "Deploy to Fly.io" job.
@@ -25,7 +32,7 @@ def get_deployment_status(repo_url, github_token, branch_name):
             - details: Additional details (commit SHA, job URL, etc.)
     """
     logger.info(
-        f"🚀 Checking deployment status for branch '{branch_name}' in {repo_url}"
+        "🚀 Checking deployment status for branch '%s' in %s", branch_name, repo_url
     )
 
     if not github_token:
@@ -36,17 +43,16 @@ def get_deployment_status(repo_url, github_token, branch_name):
         }
 
     # Parse GitHub URL to extract owner and repo
-    github_pattern = r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$"
-    match = re.match(github_pattern, repo_url)
-    if not match:
+    parsed = parse_github_url(repo_url)
+    if not parsed:
         return {
             "status": "error",
             "message": f"Invalid GitHub URL format: {repo_url}",
             "details": {"error": "invalid_github_url"},
         }
 
-    owner, repo = match.groups()
-    logger.info(f"🔍 Parsed GitHub repo: {owner}/{repo}, branch: {branch_name}")
+    owner, repo = parsed
+    logger.info("🔍 Parsed GitHub repo: %s/%s, branch: %s", owner, repo, branch_name)
 
     headers = {
         "Authorization": f"token {github_token}",
@@ -56,7 +62,7 @@ def get_deployment_status(repo_url, github_token, branch_name):
 
     try:
         # Step 1: Get the latest commit on the specified branch
-        branch_response = requests.get(
+        branch_response = github_session.get(
             f"https://api.github.com/repos/{owner}/{repo}/branches/{branch_name}",
             headers=headers,
             timeout=10,
@@ -70,7 +76,7 @@ def get_deployment_status(repo_url, github_token, branch_name):
             }
         elif branch_response.status_code != 200:
             logger.warning(
-                f"❌ Failed to get branch info: {branch_response.status_code}"
+                "❌ Failed to get branch info: %s", branch_response.status_code
             )
             return {
                 "status": "error",
@@ -83,10 +89,10 @@ def get_deployment_status(repo_url, github_token, branch_name):
 
         branch_data = branch_response.json()
         commit_sha = branch_data["commit"]["sha"]
-        logger.info(f"📝 Latest commit on '{branch_name}': {commit_sha[:8]}")
+        logger.info("📝 Latest commit on '%s': %s", branch_name, commit_sha[:8])
 
         # Step 2: Get workflow runs for this commit
-        runs_response = requests.get(
+        runs_response = github_session.get(
             f"https://api.github.com/repos/{owner}/{repo}/actions/runs",
             headers=headers,
             params={
@@ -98,7 +104,7 @@ def get_deployment_status(repo_url, github_token, branch_name):
 
         if runs_response.status_code != 200:
             logger.warning(
-                f"❌ Failed to get workflow runs: {runs_response.status_code}"
+                "❌ Failed to get workflow runs: %s", runs_response.status_code
             )
             return {
                 "status": "error",
@@ -112,7 +118,9 @@ def get_deployment_status(repo_url, github_token, branch_name):
         runs_data = runs_response.json()
         workflow_runs = runs_data.get("workflow_runs", [])
         logger.info(
-            f"🔍 Found {len(workflow_runs)} workflow runs for commit {commit_sha[:8]}"
+            "🔍 Found %s workflow runs for commit %s",
+            len(workflow_runs),
+            commit_sha[:8],
         )
 
         # Step 3: Look for "Deploy to Fly.io" job in the workflow runs
@@ -121,12 +129,12 @@ def get_deployment_status(repo_url, github_token, branch_name):
             run_name = run.get("name", "")
             if "Deploy to Fly.io" in run_name:
                 deploy_run = run
-                logger.info(f"✅ Found 'Deploy to Fly.io' workflow: {run_name}")
+                logger.info("✅ Found 'Deploy to Fly.io' workflow: %s", run_name)
                 break
 
         if not deploy_run:
             logger.info(
-                f"❌ No 'Deploy to Fly.io' workflow found for commit {commit_sha[:8]}"
+                "❌ No 'Deploy to Fly.io' workflow found for commit %s", commit_sha[:8]
             )
             return {
                 "status": "error",
@@ -148,7 +156,7 @@ def get_deployment_status(repo_url, github_token, branch_name):
         run_url = deploy_run.get("html_url")
 
         logger.info(
-            f"🔍 Deploy workflow status: {run_status}, conclusion: {run_conclusion}"
+            "🔍 Deploy workflow status: %s, conclusion: %s", run_status, run_conclusion
         )
 
         # Determine final status based on GitHub Actions status
@@ -191,14 +199,14 @@ def get_deployment_status(repo_url, github_token, branch_name):
             }
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Network error while checking deployment status: {str(e)}")
+        logger.error("❌ Network error while checking deployment status: %s", e)
         return {
             "status": "error",
             "message": f"Network error: {str(e)}",
             "details": {"error": "network_error", "exception": str(e)},
         }
     except Exception as e:
-        logger.error(f"❌ Unexpected error while checking deployment status: {str(e)}")
+        logger.error("❌ Unexpected error while checking deployment status: %s", e)
         return {
             "status": "error",
             "message": f"Unexpected error: {str(e)}",
@@ -71,7 +71,7 @@ def serialize_agent_event_to_message(
             return _serialize_generic_event(event, base_message)
 
     except Exception as e:
-        logger.error(f"❌ Error serializing event {type(event).__name__}: {e}")
+        logger.error("❌ Error serializing event %s: %s", type(event).__name__, e)
         return None
 
 
@@ -113,7 +113,7 @@ def _serialize_message_event(
         return None  # Skip non-assistant messages
 
     except Exception as e:
-        logger.error(f"❌ Error serializing MessageEvent: {e}")
+        logger.error("❌ Error serializing MessageEvent: %s", e)
         return None
 
 
@@ -152,7 +152,7 @@ def _serialize_action_event(event, base_message: Dict[str, Any]) -> Dict[str, An
         return base_message
 
     except Exception as e:
-        logger.error(f"❌ Error serializing ActionEvent: {e}")
+        logger.error("❌ Error serializing ActionEvent: %s", e)
         return _create_fallback_message(event, base_message, "Action event occurred")
 
 
@@ -189,7 +189,7 @@ def _serialize_observation_event(event, base_message: Dict[str, Any]) -> Dict[st
         return base_message
 
     except Exception as e:
-        logger.error(f"❌ Error serializing ObservationEvent: {e}")
+        logger.error("❌ Error serializing ObservationEvent: %s", e)
         return _create_fallback_message(event, base_message, "Tool execution completed")
 
 
@@ -215,7 +215,7 @@ def _serialize_error_event(event, base_message: Dict[str, Any]) -> Dict[str, Any
         return base_message
 
     except Exception as e:
-        logger.error(f"❌ Error serializing AgentErrorEvent: {e}")
+        logger.error("❌ Error serializing AgentErrorEvent: %s", e)
         return _create_fallback_message(event, base_message, "An error occurred")
 
 
@@ -231,7 +231,7 @@ def _serialize_pause_event(event, base_message: Dict[str, Any]) -> Dict[str, Any
         return base_message
 
     except Exception as e:
-        logger.error(f"❌ Error serializing PauseEvent: {e}")
+        logger.error("❌ Error serializing PauseEvent: %s", e)
         return _create_fallback_message(event, base_message, "Agent paused")
 
 
@@ -258,7 +258,7 @@ def _serialize_generic_event(event, base_message: Dict[str, Any]) -> Dict[str, A
         return base_message
 
     except Exception as e:
-        logger.error(f"❌ Error serializing generic event: {e}")
+        logger.error("❌ Error serializing generic event: %s", e)
         return _create_fallback_message(event, base_message, "Agent event occurred")
 
 
@@ -301,7 +301,7 @@ def _create_action_message(action_name: str, action_data: Dict, event) -> str:
         return base_msg
 
     except Exception as e:
-        logger.error(f"❌ Error creating action message: {e}")
+        logger.error("❌ Error creating action message: %s", e)
         return f"🔧 **Action: {action_name}**"
 
 
@@ -341,7 +341,7 @@ def _create_observation_message(tool_name: str, observation_data: Dict, event) -
         return base_msg
 
     except Exception as e:
-        logger.error(f"❌ Error creating observation message: {e}")
+        logger.error("❌ Error creating observation message: %s", e)
         return f"🔍 **{tool_name} completed**"
 
 
@@ -359,7 +359,7 @@ def _safe_extract_action_details(action) -> Dict[str, Any]:
                 details[attr] = value
         return details
     except Exception as e:
-        logger.error(f"❌ Error extracting action details: {e}")
+        logger.error("❌ Error extracting action details: %s", e)
         return {}
 
 
@@ -384,7 +384,7 @@ def _safe_extract_observation_details(observation) -> Dict[str, Any]:
 
         return details
     except Exception as e:
-        logger.error(f"❌ Error extracting observation details: {e}")
+        logger.error("❌ Error extracting observation details: %s", e)
         return {}
 
 
@@ -399,7 +399,7 @@ def _extract_thought_content(event) -> Optional[str]:
             return " ".join(thoughts) if thoughts else None
         return None
     except Exception as e:
-        logger.error(f"❌ Error extracting thought content: {e}")
+        logger.error("❌ Error extracting thought content: %s", e)
         return None
 
 
@@ -416,7 +416,7 @@ def _extract_metrics(event) -> Optional[Dict[str, Any]]:
             }
         return None
     except Exception as e:
-        logger.error(f"❌ Error extracting metrics: {e}")
+        logger.error("❌ Error extracting metrics: %s", e)
         return None
 
 
@@ -0,0 +1,88 @@
+"""
+Shared HTTP sessions for outbound API calls.
+
+Reusing one requests.Session per upstream host keeps TCP/TLS connections
+alive between calls instead of paying a fresh handshake on every request.
+"""
+
+import hashlib
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connection pool sizing: number of host pools and connections kept per host
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 64
+
+# Maximum number of ETag-validated response bodies kept for conditional GETs
+ETAG_CACHE_MAXSIZE = 1024
+
+# (url, auth hash) -> (etag, parsed JSON body)
+_etag_cache = {}
+_etag_lock = threading.Lock()
+
+
+def create_session() -> requests.Session:
+    """
+    Create a requests.Session with a keep-alive connection pool.
+
+    Returns:
+        requests.Session: Session with pooled HTTPS/HTTP adapters mounted
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Session for api.github.com
+github_session = create_session()
+
+# Session for api.machines.dev (Fly.io)
+fly_session = create_session()
+
+
+def conditional_get_json(session, url, headers, timeout=10):
+    """
+    GET a JSON resource, revalidating a previously seen copy with If-None-Match.
+
+    APIs such as GitHub answer a matching ETag with an empty 304 that does not
+    count against the rate limit; the cached body is returned in that case.
+
+    Args:
+        session: requests.Session to issue the request with
+        url: Resource URL
+        headers: Request headers (the Authorization header is part of the key)
+        timeout: Request timeout in seconds
+
+    Returns:
+        tuple: (ok, response, data) - ok is True for a 200 or a revalidated 304,
+        data is the parsed JSON body when ok, otherwise None
+    """
+    auth = headers.get("Authorization", "")
+    key = (url, hashlib.blake2b(auth.encode("utf-8"), digest_size=16).hexdigest())
+
+    with _etag_lock:
+        cached = _etag_cache.get(key)
+
+    request_headers = headers
+    if cached:
+        request_headers = {**headers, "If-None-Match": cached[0]}
+
+    response = session.get(url, headers=request_headers, timeout=timeout)
+
+    if response.status_code == 304 and cached:
+        return True, response, cached[1]
+    if response.status_code != 200:
+        return False, response, None
+
+    data = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        with _etag_lock:
+            if len(_etag_cache) >= ETAG_CACHE_MAXSIZE and key not in _etag_cache:
+                del _etag_cache[next(iter(_etag_cache))]
+            _etag_cache[key] = (etag, data)
+    return True, response, data
@@ -0,0 +1,86 @@
+"""
+Flask JSON provider that uses orjson for responses and request bodies.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that parses and encodes JSON (including jsonify()) with orjson.
+
+    Values orjson does not handle natively (and datetimes, which Flask renders
+    as HTTP dates) are passed to Flask's default hook, so response bodies keep
+    the same meaning as with the stdlib encoder. Anything orjson refuses to
+    encode (e.g. integers beyond 64 bits) goes through the stdlib provider.
+    """
+
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize a value to a compact JSON string.
+
+        Args:
+            obj: The value to serialize
+            **kwargs: Keyword arguments for the stdlib encoder
+
+        Returns:
+            str: The JSON text
+        """
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, s, **kwargs):
+        """
+        Deserialize JSON, as used by request.get_json().
+
+        Args:
+            s: JSON text as str or bytes
+            **kwargs: Keyword arguments for the stdlib decoder
+
+        Returns:
+            Any: The decoded value
+        """
+        if kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # e.g. NaN or integers beyond 64 bits, which only the stdlib
+            # accepts; genuinely invalid input raises from here as before
+            return super().loads(s)
+
+    def response(self, *args, **kwargs):
+        """
+        Serialize the given arguments as a JSON response.
+
+        Args:
+            *args: A single value, or several values treated as a list
+            **kwargs: Keyword arguments treated as a dict
+
+        Returns:
+            Response: Response with an application/json body
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        option = (
+            orjson.OPT_APPEND_NEWLINE
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        if self.compact is False or (self.compact is None and self._app.debug):
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        try:
+            body = orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
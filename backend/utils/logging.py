@@ -46,35 +46,35 @@ def log_system_info(logger: logging.Logger) -> None:
     logger.info("=" * 50)
 
     # Python information
-    logger.info(f"🐍 Python version: {sys.version}")
-    logger.info(f"📦 Python executable: {sys.executable}")
+    logger.info("🐍 Python version: %s", sys.version)
+    logger.info("📦 Python executable: %s", sys.executable)
 
     # Environment information
-    logger.info(f"🌍 Environment Variables:")
-    logger.info(f"  - FLY_APP_NAME: {os.environ.get('FLY_APP_NAME', 'local')}")
-    logger.info(f"  - FLASK_ENV: {os.environ.get('FLASK_ENV', 'production')}")
-    logger.info(f"  - PORT: {os.environ.get('PORT', '8000')}")
-    logger.info(f"  - PWD: {os.environ.get('PWD', 'unknown')}")
-    logger.info(f"  - DATA_DIR: {DATA_DIR}")
+    logger.info("🌍 Environment Variables:")
+    logger.info("  - FLY_APP_NAME: %s", os.environ.get("FLY_APP_NAME", "local"))
+    logger.info("  - FLASK_ENV: %s", os.environ.get("FLASK_ENV", "production"))
+    logger.info("  - PORT: %s", os.environ.get("PORT", "8000"))
+    logger.info("  - PWD: %s", os.environ.get("PWD", "unknown"))
+    logger.info("  - DATA_DIR: %s", DATA_DIR)
 
     # File system information
-    logger.info(f"📁 Data directory status:")
-    logger.info(f"  - Path: {DATA_DIR}")
-    logger.info(f"  - Exists: {DATA_DIR.exists()}")
+    logger.info("📁 Data directory status:")
+    logger.info("  - Path: %s", DATA_DIR)
+    logger.info("  - Exists: %s", DATA_DIR.exists())
     logger.info(
-        f"  - Is directory: {DATA_DIR.is_dir() if DATA_DIR.exists() else 'N/A'}"
+        "  - Is directory: %s", DATA_DIR.is_dir() if DATA_DIR.exists() else "N/A"
     )
 
     if DATA_DIR.exists():
         try:
             subdirs = list(DATA_DIR.iterdir())
-            logger.info(f"  - Subdirectories: {len(subdirs)}")
+            logger.info("  - Subdirectories: %s", len(subdirs))
             for subdir in subdirs[:5]:  # Show first 5 subdirs
-                logger.info(f"    - {subdir.name}")
+                logger.info("    - %s", subdir.name)
             if len(subdirs) > 5:
-                logger.info(f"    - ... and {len(subdirs) - 5} more")
+                logger.info("    - ... and %s more", len(subdirs) - 5)
         except Exception as e:
-            logger.error(f"  - Error reading directory: {e}")
+            logger.error("  - Error reading directory: %s", e)
 
     logger.info("=" * 50)
 
@@ -92,8 +92,11 @@ def log_api_request(
         endpoint: The API endpoint
         user_id: Optional user identifier
     """
+    # Skip building the message parts entirely when DEBUG is off
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     user_info = f" (user: {user_id[:8]})" if user_id else ""
-    logger.debug(f"📡 {method} {endpoint}{user_info}")
+    logger.debug("📡 %s %s%s", method, endpoint, user_info)
 
 
 def log_api_response(
@@ -113,8 +116,12 @@ def log_api_response(
         status_code: HTTP status code
         user_id: Optional user identifier
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     user_info = f" (user: {user_id[:8]})" if user_id else ""
     status_emoji = (
         "✅" if 200 <= status_code < 300 else "❌" if status_code >= 400 else "⚠️"
     )
-    logger.debug(f"{status_emoji} {method} {endpoint} -> {status_code}{user_info}")
+    logger.debug(
+        "%s %s %s -> %s%s", status_emoji, method, endpoint, status_code, user_info
+    )
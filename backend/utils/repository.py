@@ -9,17 +9,44 @@ embedded in the remote URL to enable authenticated push/pull operations.
 import os
 import subprocess
 import shutil
-import requests
 import re
 from pathlib import Path
 from typing import Optional, Tuple
 from utils.logging import get_logger
 from keys import load_user_keys
 from storage.base_storage import DATA_DIR
+from utils.http_sessions import github_session
 
 logger = get_logger(__name__)
 
 
+def parse_github_url(repo_url: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    Extract owner and repository name from an https://github.com URL.
+
+    Validation and parsing happen in a single pass of prefix/partition string
+    operations, which is cheaper than a regex match for these short inputs.
+
+    Args:
+        repo_url: GitHub repository URL, e.g. https://github.com/owner/repo
+
+    Returns:
+        Tuple[str, str]: (owner, repo) or None if the URL is not a GitHub repo URL
+    """
+    if not repo_url:
+        return None
+    rest = repo_url.removeprefix("https://github.com/")
+    if rest is repo_url:
+        return None
+    owner, _, tail = rest.partition("/")
+    repo, _, extra = tail.partition("/")
+    repo = repo.removesuffix(".git")
+    # Only a trailing slash may follow the repo name (no /tree/..., /pull/...)
+    if not owner or not repo or extra:
+        return None
+    return owner, repo
+
+
 def extract_repo_info(github_url: str) -> Optional[Tuple[str, str]]:
     """
     Extract owner and repository name from GitHub URL.
@@ -42,7 +69,7 @@ def extract_repo_info(github_url: str) -> Optional[Tuple[str, str]]:
             owner, repo = match.groups()
             return owner, repo
 
-    logger.error(f"❌ Could not extract repo info from URL: {github_url}")
+    logger.error("❌ Could not extract repo info from URL: %s", github_url)
     return None
 
 
@@ -74,14 +101,14 @@ def check_branch_exists(
         }
 
         api_url = f"https://api.github.com/repos/{owner}/{repo}/branches/{branch_name}"
-        response = requests.get(api_url, headers=headers, timeout=30)
+        response = github_session.get(api_url, headers=headers, timeout=30)
 
         remote_exists = response.status_code == 200
-        logger.info(f"🌿 Remote branch '{branch_name}' exists: {remote_exists}")
+        logger.info("🌿 Remote branch '%s' exists: %s", branch_name, remote_exists)
 
         return remote_exists, False  # We can't check local without being in the repo
     except Exception as e:
-        logger.error(f"❌ Error checking branch existence: {str(e)}")
+        logger.error("❌ Error checking branch existence: %s", e)
         return False, False
 
 
@@ -113,25 +140,25 @@ def check_pr_exists(
 
         # Search for PRs from this branch as head
         api_url = f"https://api.github.com/repos/{owner}/{repo}/pulls?head={owner}:{branch_name}&state=open"
-        response = requests.get(api_url, headers=headers, timeout=30)
+        response = github_session.get(api_url, headers=headers, timeout=30)
 
         if response.status_code == 200:
             prs = response.json()
             if prs and len(prs) > 0:
                 pr_url = prs[0].get("html_url")
                 logger.info(
-                    f"🔀 Found existing PR for branch '{branch_name}': {pr_url}"
+                    "🔀 Found existing PR for branch '%s': %s", branch_name, pr_url
                 )
                 return True, pr_url
             else:
-                logger.info(f"🔀 No existing PR found for branch '{branch_name}'")
+                logger.info("🔀 No existing PR found for branch '%s'", branch_name)
                 return False, None
         else:
-            logger.error(f"❌ Failed to check PR existence: {response.status_code}")
+            logger.error("❌ Failed to check PR existence: %s", response.status_code)
             return False, None
 
     except Exception as e:
-        logger.error(f"❌ Error checking PR existence: {str(e)}")
+        logger.error("❌ Error checking PR existence: %s", e)
         return False, None
 
 
@@ -156,7 +183,7 @@ def create_pull_request(
             github_url, branch_name, github_token
         )
         if pr_exists and existing_pr_url:
-            logger.info(f"🔀 Adopting existing pull request: {existing_pr_url}")
+            logger.info("🔀 Adopting existing pull request: %s", existing_pr_url)
             return True, existing_pr_url
 
         repo_info = extract_repo_info(github_url)
@@ -184,15 +211,20 @@ def create_pull_request(
         }
 
         logger.info(
-            f"🔀 Creating pull request for branch '{branch_name}' in {owner}/{repo}"
+            "🔀 Creating pull request for branch '%s' in %s/%s",
+            branch_name,
+            owner,
+            repo,
         )
 
-        response = requests.post(api_url, headers=headers, json=pr_data, timeout=30)
+        response = github_session.post(
+            api_url, headers=headers, json=pr_data, timeout=30
+        )
 
         if response.status_code == 201:
             pr_data = response.json()
             pr_url = pr_data.get("html_url")
-            logger.info(f"✅ Successfully created pull request: {pr_url}")
+            logger.info("✅ Successfully created pull request: %s", pr_url)
             return True, pr_url
         elif response.status_code == 422:
             # PR might already exist or other validation error
@@ -210,22 +242,23 @@ def create_pull_request(
                 )
                 if pr_exists and existing_pr_url:
                     logger.info(
-                        f"🔀 Found existing pull request after creation attempt: {existing_pr_url}"
+                        "🔀 Found existing pull request after creation attempt: %s",
+                        existing_pr_url,
                     )
                     return True, existing_pr_url
 
-            logger.warning(f"⚠️ Pull request creation failed: {error_message}")
+            logger.warning("⚠️ Pull request creation failed: %s", error_message)
             return False, f"PR creation failed: {error_message}"
         else:
             error_message = (
                 f"GitHub API error: {response.status_code} - {response.text}"
             )
-            logger.error(f"❌ {error_message}")
+            logger.error("❌ %s", error_message)
             return False, error_message
 
     except Exception as e:
         error_message = f"Error creating pull request: {str(e)}"
-        logger.error(f"❌ {error_message}")
+        logger.error("❌ %s", error_message)
         return False, error_message
 
 
@@ -248,10 +281,12 @@ def create_workspace_directory(user_uuid: str, app_slug: str, riff_slug: str) ->
     try:
         # Create the directory structure
         workspace_path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"📁 Created workspace directory: {workspace_path}")
+        logger.info("📁 Created workspace directory: %s", workspace_path)
         return str(workspace_path)
     except Exception as e:
-        logger.error(f"❌ Failed to create workspace directory {workspace_path}: {e}")
+        logger.error(
+            "❌ Failed to create workspace directory %s: %s", workspace_path, e
+        )
         raise
 
 
@@ -283,7 +318,7 @@ def clone_repository(
 
         # Remove existing project directory if any
         if os.path.exists(project_path):
-            logger.info(f"🧹 Cleaning existing project directory: {project_path}")
+            logger.info("🧹 Cleaning existing project directory: %s", project_path)
             shutil.rmtree(project_path)
 
         # Modify GitHub URL to include user's stored token for authentication
@@ -291,7 +326,7 @@ def clone_repository(
             user_keys = load_user_keys(user_uuid)
             github_token = user_keys.get("github")
         except Exception as e:
-            logger.warning(f"⚠️ Failed to load user keys for {user_uuid}: {e}")
+            logger.warning("⚠️ Failed to load user keys for %s: %s", user_uuid, e)
             github_token = None
 
         if github_token and github_url.startswith("https://github.com/"):
@@ -300,15 +335,16 @@ def clone_repository(
                 "https://github.com/", f"https://{github_token}@github.com/"
             )
             logger.info(
-                f"📥 Cloning repository with user authentication to {project_path}"
+                "📥 Cloning repository with user authentication to %s", project_path
             )
         else:
             authenticated_url = github_url
             if not github_token:
                 logger.warning(
-                    f"⚠️ No GitHub token found for user {user_uuid}, cloning without authentication"
+                    "⚠️ No GitHub token found for user %s, cloning without authentication",
+                    user_uuid,
                 )
-            logger.info(f"📥 Cloning repository {github_url} to {project_path}")
+            logger.info("📥 Cloning repository %s to %s", github_url, project_path)
 
         # Clone the repository into the project subdirectory
         clone_cmd = ["git", "clone", authenticated_url, project_path]
@@ -318,10 +354,10 @@ def clone_repository(
 
         if result.returncode != 0:
             error_msg = f"Failed to clone repository: {result.stderr}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             return False, error_msg
 
-        logger.info(f"✅ Successfully cloned repository to {project_path}")
+        logger.info("✅ Successfully cloned repository to %s", project_path)
 
         # Change to the project directory for git operations
         original_cwd = os.getcwd()
@@ -340,7 +376,7 @@ def clone_repository(
                 )
                 if config_result.returncode != 0:
                     error_msg = f"Failed to configure git: {config_result.stderr}"
-                    logger.error(f"❌ {error_msg}")
+                    logger.error("❌ %s", error_msg)
                     return False, error_msg
 
             logger.info("✅ Git configuration set successfully")
@@ -359,7 +395,7 @@ def clone_repository(
 
             if remote_result.returncode == 0 and remote_result.stdout.strip():
                 # Remote branch exists, checkout and track it
-                logger.info(f"🌿 Remote branch '{branch_name}' found, checking out...")
+                logger.info("🌿 Remote branch '%s' found, checking out...", branch_name)
                 checkout_cmd = [
                     "git",
                     "checkout",
@@ -377,13 +413,13 @@ def clone_repository(
                 if local_result.returncode == 0 and local_result.stdout.strip():
                     # Local branch exists, checkout it
                     logger.info(
-                        f"🌿 Local branch '{branch_name}' found, checking out..."
+                        "🌿 Local branch '%s' found, checking out...", branch_name
                     )
                     checkout_cmd = ["git", "checkout", branch_name]
                 else:
                     # Branch doesn't exist, create new branch from main/master
                     logger.info(
-                        f"🌿 Branch '{branch_name}' not found, creating new branch..."
+                        "🌿 Branch '%s' not found, creating new branch...", branch_name
                     )
 
                     # First, determine the default branch
@@ -421,7 +457,9 @@ def clone_repository(
                             default_branch = "main"  # Final fallback
 
                     logger.info(
-                        f"🌿 Creating new branch '{branch_name}' from '{default_branch}'"
+                        "🌿 Creating new branch '%s' from '%s'",
+                        branch_name,
+                        default_branch,
                     )
                     checkout_cmd = [
                         "git",
@@ -438,10 +476,10 @@ def clone_repository(
 
             if checkout_result.returncode != 0:
                 error_msg = f"Failed to checkout branch '{branch_name}': {checkout_result.stderr}"
-                logger.error(f"❌ {error_msg}")
+                logger.error("❌ %s", error_msg)
                 return False, error_msg
 
-            logger.info(f"✅ Successfully checked out branch '{branch_name}'")
+            logger.info("✅ Successfully checked out branch '%s'", branch_name)
 
             # Verify the current branch
             verify_cmd = ["git", "branch", "--show-current"]
@@ -451,12 +489,12 @@ def clone_repository(
 
             if verify_result.returncode == 0:
                 current_branch = verify_result.stdout.strip()
-                logger.info(f"📍 Current branch: {current_branch}")
+                logger.info("📍 Current branch: %s", current_branch)
 
             # If GitHub token is available, push branch and create PR
             if github_token and current_branch == branch_name:
                 logger.info(
-                    f"🚀 Preparing branch '{branch_name}' for push and PR creation..."
+                    "🚀 Preparing branch '%s' for push and PR creation...", branch_name
                 )
 
                 # Check if we need to add an empty commit (only for new branches)
@@ -479,11 +517,13 @@ def clone_repository(
                     )
 
                     if empty_commit_result.returncode == 0:
-                        logger.info(f"✅ Added empty commit to branch '{branch_name}'")
+                        logger.info("✅ Added empty commit to branch '%s'", branch_name)
                     else:
                         # Don't fail if empty commit fails - the branch might already have commits
                         logger.warning(
-                            f"⚠️ Could not add empty commit to branch '{branch_name}': {empty_commit_result.stderr}"
+                            "⚠️ Could not add empty commit to branch '%s': %s",
+                            branch_name,
+                            empty_commit_result.stderr,
                         )
 
                     # Push the new branch to remote
@@ -494,7 +534,7 @@ def clone_repository(
 
                     if push_result.returncode == 0:
                         logger.info(
-                            f"✅ Successfully pushed branch '{branch_name}' to remote"
+                            "✅ Successfully pushed branch '%s' to remote", branch_name
                         )
                     else:
                         # Check if it's just because the branch already exists
@@ -503,30 +543,34 @@ def clone_repository(
                             or "up-to-date" in push_result.stderr.lower()
                         ):
                             logger.info(
-                                f"🌿 Branch '{branch_name}' already exists on remote, adopting it"
+                                "🌿 Branch '%s' already exists on remote, adopting it",
+                                branch_name,
                             )
                         else:
                             error_msg = f"Failed to push branch '{branch_name}' to remote: {push_result.stderr}"
-                            logger.error(f"❌ {error_msg}")
+                            logger.error("❌ %s", error_msg)
                             return False, error_msg
                 else:
-                    logger.info(f"🌿 Adopting existing remote branch '{branch_name}'")
+                    logger.info("🌿 Adopting existing remote branch '%s'", branch_name)
 
                 # Create pull request (this will check for existing PR first)
                 pr_success, pr_result = create_pull_request(
                     github_url, branch_name, github_token
                 )
                 if pr_success:
-                    logger.info(f"🔀 Pull request ready: {pr_result}")
+                    logger.info("🔀 Pull request ready: %s", pr_result)
                 else:
                     # Don't fail the entire operation if PR creation fails
                     logger.warning(
-                        f"⚠️ Could not create/find pull request for branch '{branch_name}': {pr_result}"
+                        "⚠️ Could not create/find pull request for branch '%s': %s",
+                        branch_name,
+                        pr_result,
                     )
                     # Continue without failing - the branch is still set up correctly
             elif not github_token:
                 logger.info(
-                    f"ℹ️ No GitHub token available for user {user_uuid}, skipping push and PR creation"
+                    "ℹ️ No GitHub token available for user %s, skipping push and PR creation",
+                    user_uuid,
                 )
 
             return True, None
@@ -537,11 +581,11 @@ def clone_repository(
 
     except subprocess.TimeoutExpired:
         error_msg = "Repository operation timed out"
-        logger.error(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         return False, error_msg
     except Exception as e:
         error_msg = f"Unexpected error during repository setup: {str(e)}"
-        logger.error(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         return False, error_msg
 
 
@@ -571,12 +615,12 @@ def setup_riff_workspace(
         )
 
         if success:
-            logger.info(f"🎉 Workspace setup complete: {workspace_path}")
+            logger.info("🎉 Workspace setup complete: %s", workspace_path)
             return True, workspace_path, None
         else:
             return False, workspace_path, error_msg
 
     except Exception as e:
         error_msg = f"Failed to setup workspace: {str(e)}"
-        logger.error(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         return False, None, error_msg
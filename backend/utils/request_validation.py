@@ -0,0 +1,56 @@
+"""
+Request validation helpers shared by the route blueprints.
+"""
+
+from functools import wraps
+
+from flask import g, jsonify, request
+
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def get_user_uuid():
+    """
+    Extract the user UUID from the X-User-UUID request header.
+
+    Returns:
+        tuple: (user_uuid, error_response) - exactly one of them is None
+    """
+    raw_uuid = request.headers.get("X-User-UUID", "")
+    user_uuid = raw_uuid.strip()
+    if user_uuid:
+        return user_uuid, None
+
+    if not raw_uuid:
+        logger.warning("❌ X-User-UUID header is required")
+        return None, (jsonify({"error": "X-User-UUID header is required"}), 400)
+
+    logger.warning("❌ Empty UUID provided in header")
+    return None, (jsonify({"error": "UUID cannot be empty"}), 400)
+
+
+def require_user_uuid(view):
+    """
+    Decorator that validates the X-User-UUID header once per request.
+
+    The cleaned UUID is stored on ``flask.g.user_uuid`` for the view to use;
+    requests with a missing or blank header are rejected with a 400.
+
+    Args:
+        view: The Flask view function to wrap
+
+    Returns:
+        function: The wrapped view function
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        user_uuid, error_response = get_user_uuid()
+        if error_response:
+            return error_response
+        g.user_uuid = user_uuid
+        return view(*args, **kwargs)
+
+    return wrapper
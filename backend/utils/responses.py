@@ -0,0 +1,74 @@
+"""
+Response helpers shared by the route blueprints.
+"""
+
+from flask import current_app, jsonify, request
+
+
+def conditional_jsonify(*args, **kwargs):
+    """
+    Build a JSON response that honours If-None-Match.
+
+    The response carries an ETag derived from its body; when the client
+    already holds that version it gets an empty 304 instead of the payload.
+
+    Args:
+        *args: Positional arguments passed through to flask.jsonify
+        **kwargs: Keyword arguments passed through to flask.jsonify
+
+    Returns:
+        Response: 200 JSON response with an ETag, or 304 Not Modified
+    """
+    response = jsonify(*args, **kwargs)
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def polled_jsonify(payload, max_age, public=False):
+    """
+    Build a conditional JSON response that clients may reuse for a while.
+
+    Meant for status endpoints the frontend polls: within max_age seconds the
+    browser answers repeat polls from its cache, and after that it revalidates
+    with the ETag and usually gets a 304.
+
+    Args:
+        payload: JSON-serializable response body
+        max_age: Seconds the response may be reused without revalidation
+        public: True for responses that are the same for every user; otherwise
+            the response is private and varies on the X-User-UUID header
+
+    Returns:
+        Response: 200 JSON response with caching headers, or 304 Not Modified
+    """
+    response = conditional_jsonify(payload)
+    response.cache_control.max_age = max_age
+    if public:
+        response.cache_control.public = True
+    else:
+        response.cache_control.private = True
+        response.vary.add("X-User-UUID")
+    return response
+
+
+def ndjson_response(records):
+    """
+    Stream records as newline-delimited JSON, one document per line.
+
+    Each record is encoded only as the response is written, so the client
+    starts receiving data straight away and no single buffer holds the
+    whole encoded body.
+
+    Args:
+        records: Iterable of JSON-serializable records
+
+    Returns:
+        Response: Streaming application/x-ndjson response
+    """
+    dumps = current_app.json.dumps
+
+    def generate():
+        for record in records:
+            yield dumps(record) + "\n"
+
+    return current_app.response_class(generate(), mimetype="application/x-ndjson")
@@ -0,0 +1,120 @@
+"""
+Small in-memory TTL cache for memoizing slow, read-only lookups.
+"""
+
+import hashlib
+import threading
+import time
+from concurrent.futures import Future
+from functools import wraps
+
+
+def _make_key(args, kwargs):
+    """
+    Build a cache key from a call's arguments.
+
+    Arguments are hashed so secrets such as API tokens are never kept in
+    memory as plaintext dictionary keys. Keyword arguments are included in
+    name order, so f(a, b=1, c=2) and f(a, c=2, b=1) share an entry, while
+    f(a, 1) and f(a, b=1) are cached separately.
+
+    Args:
+        args: Positional arguments of the cached call
+        kwargs: Keyword arguments of the cached call
+
+    Returns:
+        str: Hex digest identifying the arguments
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for arg in args:
+        digest.update(str(arg).encode("utf-8"))
+        digest.update(b"\0")
+    for name, value in sorted(kwargs.items()):
+        # \1 marks a keyword so it can't collide with a positional argument
+        digest.update(b"\1" + name.encode("utf-8") + b"=")
+        digest.update(str(value).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def ttl_cache(ttl, maxsize=1024):
+    """
+    Decorator caching a function's non-None results for ttl seconds.
+
+    Positional and keyword arguments both take part in the cache key, so
+    ``invalidate`` must be called the same way as the cached call. None
+    results (used by the status helpers to signal errors) are not cached so
+    failures are retried on the next call. Concurrent calls with the same arguments
+    that miss the cache wait for a single underlying call and share its
+    result (or exception). The wrapped function gains
+    ``invalidate(*args, **kwargs)`` and ``cache_clear()`` helpers.
+
+    Args:
+        ttl: Time-to-live for cached entries in seconds
+        maxsize: Maximum number of cached entries
+
+    Returns:
+        function: Decorator to apply to the function
+    """
+
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+
+        # key -> Future for calls currently running, so concurrent misses
+        # for the same arguments share one underlying call
+        in_flight = {}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            now = time.monotonic()
+
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and entry[0] > now:
+                    return entry[1]
+                future = in_flight.get(key)
+                if future is None:
+                    future = in_flight[key] = Future()
+                    leader = True
+                else:
+                    leader = False
+
+            if not leader:
+                return future.result()
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    del in_flight[key]
+                future.set_exception(e)
+                raise
+
+            with lock:
+                if result is not None:
+                    if len(cache) >= maxsize:
+                        # Drop expired entries first, then the oldest one
+                        for stale_key in [k for k, v in cache.items() if v[0] <= now]:
+                            del cache[stale_key]
+                        if len(cache) >= maxsize:
+                            del cache[next(iter(cache))]
+                    cache[key] = (now + ttl, result)
+                del in_flight[key]
+            future.set_result(result)
+            return result
+
+        def invalidate(*args, **kwargs):
+            with lock:
+                cache.pop(_make_key(args, kwargs), None)
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.invalidate = invalidate
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator